@@ -186,7 +186,7 @@ else:
 
 #: Global settings options for kivy
 kivy_options = {
-    'window': ('egl_rpi', 'pygame', 'sdl', 'x11'),
+    'window': ('egl_rpi', 'pygame', 'sdl', 'x11', 'offscreen'),
     'text': ('pil', 'pygame', 'sdlttf'),
     'video': ('ffmpeg', 'gstreamer', 'pyglet', 'null'),
     'audio': ('pygame', 'gstreamer', 'sdl'),
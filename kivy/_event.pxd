@@ -7,3 +7,4 @@ cdef class EventDispatcher(ObjectWithUid):
     cdef dict __storage
     cdef object __weakref__
     cpdef dict properties(self)
+    cdef _dispatch(self, list event_stack, str event_type, tuple largs)
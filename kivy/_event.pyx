@@ -17,7 +17,8 @@ __all__ = ('EventDispatcher', )
 
 from functools import partial
 from kivy.weakmethod import WeakMethod
-from kivy.properties cimport Property, PropertyStorage, ObjectProperty
+from kivy.properties cimport Property, PropertyStorage, ObjectProperty, \
+    stats_entry, stats_time
 
 cdef int widget_uid = 0
 cdef dict cache_properties = {}
@@ -293,6 +294,20 @@ cdef class EventDispatcher(ObjectWithUid):
         As soon as a handler return True, the dispatching stop
         '''
         cdef list event_stack = self.__event_stack[event_type]
+        cdef list entry = stats_entry(self, event_type)
+        cdef double start
+        if entry is not None:
+            entry[2] += 1
+            if len(event_stack) > entry[4]:
+                entry[4] = len(event_stack)
+            start = stats_time()
+            try:
+                return self._dispatch(event_stack, event_type, largs)
+            finally:
+                entry[3] += stats_time() - start
+        return self._dispatch(event_stack, event_type, largs)
+
+    cdef _dispatch(self, list event_stack, str event_type, tuple largs):
         cdef object remove = event_stack.remove
         for value in event_stack[:]:
             handler = value()
@@ -32,13 +32,41 @@ Arguments:
   invocation. If no args_converter is provided, a default one, that
   assumes that the data items are strings, is used.
 
+.. versionchanged:: 1.8.0
+    A view can give back the item views that it doesn't display anymore with
+    :meth:`Adapter.release_view`. If the views are created from a cls, they
+    are reused for other items with :meth:`Adapter.recycle_view`.
+
+Recycling Views
+---------------
+
+.. versionadded:: 1.8.0
+
+The item views released by the view are kept in a pool, limited to
+:data:`Adapter.pool_size` views, and reused for other data items instead of
+creating new ones. An item view can take part in the recycling by defining
+these methods:
+
+* `on_recycle(adapter, index)`: called when the view is released and put in
+  the pool. Use it to stop anything that depends on the previous data item.
+
+* `refresh_view_attrs(adapter, index, item_args)`: called when the view is
+  reused for the data item at `index`, with the `item_args` returned by the
+  args_converter. If it is not defined, the `item_args` are set as attributes
+  of the view.
+
+When a single data item is modified in place, call
+:meth:`Adapter.refresh_data_item` instead of resetting the data: only the view
+of this item is updated.
+
 
 '''
 
 __all__ = ('Adapter', )
 
+from collections import deque
 from kivy.event import EventDispatcher
-from kivy.properties import ObjectProperty
+from kivy.properties import ObjectProperty, NumericProperty
 from kivy.lang import Builder
 from kivy.adapters.args_converters import list_item_args_converter
 
@@ -96,6 +124,18 @@ class Adapter(EventDispatcher):
     defaults to None.
     '''
 
+    pool_size = NumericProperty(100)
+    '''Maximum number of released views kept to be reused for other items.
+    When the pool is full, the view released the longest time ago is dropped.
+
+    .. versionadded:: 1.8.0
+
+    :data:`pool_size` is a :class:`~kivy.properties.NumericProperty` and
+    defaults to 100.
+    '''
+
+    __events__ = ('on_data_item_changed', )
+
     def __init__(self, **kwargs):
 
         if 'data' not in kwargs:
@@ -120,6 +160,7 @@ class Adapter(EventDispatcher):
         else:
             self.args_converter = list_item_args_converter
 
+        self._recycled_views = deque()
         super(Adapter, self).__init__(**kwargs)
 
     def bind_triggers_to_view(self, func):
@@ -128,6 +169,66 @@ class Adapter(EventDispatcher):
     def get_data_item(self):
         return self.data
 
+    def release_view(self, index, view):
+        '''Called by the view when the item view for `index` is not displayed
+        anymore. If the view is an instance of :data:`cls`, or has a
+        `refresh_view_attrs` method, it is kept in the pool to be reused by
+        :meth:`recycle_view`.
+
+        .. versionadded:: 1.8.0
+        '''
+        if not hasattr(view, 'refresh_view_attrs') and \
+                not (self.cls and isinstance(view, self.cls)):
+            return
+        on_recycle = getattr(view, 'on_recycle', None)
+        if on_recycle is not None:
+            on_recycle(self, index)
+        views = self._recycled_views
+        views.append(view)
+        while len(views) > max(0, self.pool_size):
+            views.popleft()
+
+    def recycle_view(self, item_args, index=None):
+        '''Return a view released with :meth:`release_view`, updated with the
+        `item_args` returned by the :data:`args_converter` for the item at
+        `index`, or None if no view can be reused.
+
+        If the view has a `refresh_view_attrs` method, it is called with the
+        adapter, `index` and `item_args`. Otherwise, a view can only be reused
+        if all the `item_args` are attributes of the view. If they are not, the
+        arguments are only used by the constructor of the :data:`cls`, and the
+        released views are dropped.
+
+        .. versionadded:: 1.8.0
+        '''
+        views = self._recycled_views
+        if not views:
+            return None
+        view = views.pop()
+        refresh_view_attrs = getattr(view, 'refresh_view_attrs', None)
+        if refresh_view_attrs is not None:
+            refresh_view_attrs(self, index, item_args)
+            return view
+        for key in item_args:
+            if not hasattr(view, key):
+                views.clear()
+                return None
+        for key, value in item_args.items():
+            setattr(view, key, value)
+        return view
+
+    def refresh_data_item(self, index):
+        '''Tell that the data item at `index` has been modified in place. The
+        view is notified with the `on_data_item_changed` event, and gets the
+        updated item view with :meth:`get_view`.
+
+        .. versionadded:: 1.8.0
+        '''
+        self.dispatch('on_data_item_changed', index)
+
+    def on_data_item_changed(self, index):
+        pass
+
     def get_view(self, index):  # pragma: no cover
         item_args = self.args_converter(self.data)
 
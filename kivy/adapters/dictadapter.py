@@ -104,9 +104,8 @@ class DictAdapter(ListAdapter):
 
         sorted_keys will be updated by update_for_new_data().
         '''
-        if len(self.selection) > 0:
-            selected_keys = [sel.text for sel in self.selection]
-            first_sel_index = self.sorted_keys.index(selected_keys[0])
+        first_sel_index = self._selected_indices.first()
+        if first_sel_index is not None:
             desired_keys = self.sorted_keys[first_sel_index:]
             self.data = dict([(key, self.data[key]) for key in desired_keys])
 
@@ -116,9 +115,8 @@ class DictAdapter(ListAdapter):
 
         sorted_keys will be updated by update_for_new_data().
         '''
-        if len(self.selection) > 0:
-            selected_keys = [sel.text for sel in self.selection]
-            last_sel_index = self.sorted_keys.index(selected_keys[-1])
+        last_sel_index = self._selected_indices.last()
+        if last_sel_index is not None:
             desired_keys = self.sorted_keys[:last_sel_index + 1]
             self.data = dict([(key, self.data[key]) for key in desired_keys])
 
@@ -130,10 +128,9 @@ class DictAdapter(ListAdapter):
 
         sorted_keys will be updated by update_for_new_data().
         '''
-        if len(self.selection) > 0:
-            selected_keys = [sel.text for sel in self.selection]
-            first_sel_index = self.sorted_keys.index(selected_keys[0])
-            last_sel_index = self.sorted_keys.index(selected_keys[-1])
+        first_sel_index = self._selected_indices.first()
+        if first_sel_index is not None:
+            last_sel_index = self._selected_indices.last()
             desired_keys = self.sorted_keys[first_sel_index:last_sel_index + 1]
             self.data = dict([(key, self.data[key]) for key in desired_keys])
 
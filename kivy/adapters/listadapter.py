@@ -43,11 +43,28 @@ A :class:`~kivy.adapters.dictadapter.DictAdapter` is a subclass of a
     an ObjectProperty, so we need to reset it here to ListProperty). See also
     DictAdapter and its set of data = DictProperty().
 
+.. versionchanged:: 1.8.0
+
+    The :data:`~ListAdapter.cached_views` can be limited with
+    :data:`~ListAdapter.cache_limit`. When a data item is modified in place,
+    :meth:`~ListAdapter.refresh_data_item` updates its cached view instead of
+    resetting the whole cache.
+
+    The selection is backed by the data indices of the selected items, kept
+    as sorted ranges, so that selecting, deselecting and trimming do not scan
+    the :data:`~ListAdapter.selection`. :meth:`~ListAdapter.select_range`,
+    :meth:`~ListAdapter.deselect_range`, :meth:`~ListAdapter.select_all` and
+    :meth:`~ListAdapter.deselect_all` change the selection of many items with
+    a single *on_selection_change* event, without creating their views.
+
 '''
 
 __all__ = ('ListAdapter', )
 
 import inspect
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from sys import maxsize
 from kivy.event import EventDispatcher
 from kivy.adapters.adapter import Adapter
 from kivy.adapters.models import SelectableDataItem
@@ -59,6 +76,134 @@ from kivy.properties import NumericProperty
 from kivy.lang import Builder
 
 
+def _selection_key(view):
+    # the selection list is sorted by data index, the views without an index
+    # are at the end
+    index = getattr(view, 'index', None)
+    return maxsize if index is None else index
+
+
+class _SelectedIndices(object):
+    # set of data indices, stored as sorted, disjoint and non-adjacent ranges
+    # [start, end], so that a contiguous selection takes a single range.
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for start, end in zip(self.starts, self.ends):
+            for index in range(start, end + 1):
+                yield index
+
+    def __contains__(self, index):
+        i = bisect_right(self.starts, index) - 1
+        return i >= 0 and index <= self.ends[i]
+
+    def first(self):
+        return self.starts[0] if self.starts else None
+
+    def last(self):
+        return self.ends[-1] if self.ends else None
+
+    def add(self, index):
+        starts = self.starts
+        ends = self.ends
+        i = bisect_right(starts, index) - 1
+        if i >= 0 and index <= ends[i]:
+            return
+        join_left = i >= 0 and ends[i] == index - 1
+        join_right = i + 1 < len(starts) and starts[i + 1] == index + 1
+        if join_left and join_right:
+            ends[i] = ends[i + 1]
+            del starts[i + 1]
+            del ends[i + 1]
+        elif join_left:
+            ends[i] = index
+        elif join_right:
+            starts[i + 1] = index
+        else:
+            starts.insert(i + 1, index)
+            ends.insert(i + 1, index)
+        self.count += 1
+
+    def remove(self, index):
+        starts = self.starts
+        ends = self.ends
+        i = bisect_right(starts, index) - 1
+        if i < 0 or index > ends[i]:
+            return
+        start = starts[i]
+        end = ends[i]
+        if start == end:
+            del starts[i]
+            del ends[i]
+        elif index == start:
+            starts[i] = index + 1
+        elif index == end:
+            ends[i] = index - 1
+        else:
+            ends[i] = index - 1
+            starts.insert(i + 1, index + 1)
+            ends.insert(i + 1, end)
+        self.count -= 1
+
+    def add_range(self, start, end):
+        # merge [start, end] with the overlapping or adjacent ranges
+        starts = self.starts
+        ends = self.ends
+        i = bisect_left(ends, start - 1)
+        j = bisect_right(starts, end + 1)
+        removed = 0
+        if i < j:
+            removed = sum(ends[k] - starts[k] + 1 for k in range(i, j))
+            start = min(start, starts[i])
+            end = max(end, ends[j - 1])
+        starts[i:j] = [start]
+        ends[i:j] = [end]
+        self.count += end - start + 1 - removed
+
+    def remove_range(self, start, end):
+        starts = self.starts
+        ends = self.ends
+        i = bisect_left(ends, start)
+        j = bisect_right(starts, end)
+        if i >= j:
+            return
+        removed = sum(ends[k] - starts[k] + 1 for k in range(i, j))
+        new_starts = []
+        new_ends = []
+        if starts[i] < start:
+            new_starts.append(starts[i])
+            new_ends.append(start - 1)
+        if ends[j - 1] > end:
+            new_starts.append(end + 1)
+            new_ends.append(ends[j - 1])
+        starts[i:j] = new_starts
+        ends[i:j] = new_ends
+        self.count -= removed - sum(
+            e - s + 1 for s, e in zip(new_starts, new_ends))
+
+    def range(self, start, end):
+        # iterate over the indices from start to end (included)
+        starts = self.starts
+        ends = self.ends
+        i = bisect_left(ends, start)
+        while i < len(starts) and starts[i] <= end:
+            for index in range(max(start, starts[i]), min(end, ends[i]) + 1):
+                yield index
+            i += 1
+
+    def clear(self):
+        self.starts = []
+        self.ends = []
+        self.count = 0
+
+
 class ListAdapter(Adapter, EventDispatcher):
     '''
     A base class for adapters interfacing with lists, dictionaries or other
@@ -80,6 +225,13 @@ class ListAdapter(Adapter, EventDispatcher):
     selection = ListProperty([])
     '''The selection list property is the container for selected items.
 
+    .. versionchanged:: 1.8.0
+        The items selected with :meth:`select_range` or :meth:`select_all`
+        are added to the selection when their view is created. Use
+        :meth:`get_selected_indices` to get all the selected items. If the
+        selection list is changed directly, the selection is only made of
+        the views in the list. The views are kept sorted by data index.
+
     :data:`selection` is a :class:`~kivy.properties.ListProperty` and defaults
     to [].
     '''
@@ -173,19 +325,66 @@ class ListAdapter(Adapter, EventDispatcher):
     defaults to {}.
     '''
 
+    cache_limit = NumericProperty(None, allownone=True)
+    '''Maximum number of views in :data:`cached_views`. When the limit is
+    reached, the least recently used views are removed from the cache. The
+    selected views are never removed, as the :data:`selection` refers to them.
+
+    .. versionadded:: 1.8.0
+
+    :data:`cache_limit` is a :class:`~kivy.properties.NumericProperty` and
+    defaults to None (no limit).
+    '''
+
     __events__ = ('on_selection_change', )
 
     def __init__(self, **kwargs):
+        # indices of the cached views, from the least recently used
+        self._cache_order = OrderedDict()
+        # the selection, by view id (the views are not hashable), and by data
+        # index
+        self._selected_views = {}
+        self._views_by_index = {}
+        self._selected_indices = _SelectedIndices()
+        # data indices of the views in the selection list, to find a view in
+        # the list without comparing the views
+        self._selection_keys = []
+        # during a bulk operation, the selection list is only updated once
+        self._selection_batch = None
+        # set while the adapter changes the selection list itself
+        self._updating_selection = False
         super(ListAdapter, self).__init__(**kwargs)
 
         self.bind(selection_mode=self.selection_mode_changed,
                   allow_empty_selection=self.check_for_empty_selection,
+                  cache_limit=self._trim_cache,
+                  selection=self._sync_selection,
                   data=self.update_for_new_data)
+        self._sync_selection()
 
         self.update_for_new_data()
 
     def delete_cache(self, *args):
         self.cached_views = {}
+        self._cache_order = OrderedDict()
+
+    def _trim_cache(self, *args):
+        limit = self.cache_limit
+        order = self._cache_order
+        if limit is None or len(order) <= limit:
+            return
+        excess = len(order) - max(0, limit)
+        cached_views = self.cached_views
+        evicted = []
+        for index in order:
+            if getattr(cached_views.get(index), 'is_selected', False):
+                continue
+            evicted.append(index)
+            if len(evicted) == excess:
+                break
+        for index in evicted:
+            del order[index]
+            cached_views.pop(index, None)
 
     def get_count(self):
         return len(self.data)
@@ -197,17 +396,23 @@ class ListAdapter(Adapter, EventDispatcher):
 
     def selection_mode_changed(self, *args):
         if self.selection_mode == 'none':
-            for selected_view in self.selection:
-                self.deselect_item_view(selected_view)
+            batch = self._begin_selection_batch()
+            self._deselect_all_items()
+            if batch:
+                self._end_selection_batch()
         else:
             self.check_for_empty_selection()
 
     def get_view(self, index):
+        order = self._cache_order
         if index in self.cached_views:
+            order[index] = order.pop(index, None)
             return self.cached_views[index]
         item_view = self.create_view(index)
         if item_view:
             self.cached_views[index] = item_view
+            order[index] = None
+            self._trim_cache()
         return item_view
 
     def create_view(self, index):
@@ -226,12 +431,18 @@ class ListAdapter(Adapter, EventDispatcher):
 
         item_args['index'] = index
 
-        if self.cls:
-            view_instance = self.cls(**item_args)
-        else:
-            view_instance = Builder.template(self.template, **item_args)
+        view_instance = self.recycle_view(item_args, index)
+        recycled = view_instance is not None
+        if not recycled:
+            if self.cls:
+                view_instance = self.cls(**item_args)
+            else:
+                view_instance = Builder.template(self.template, **item_args)
 
-        if self.propagate_selection_to_data:
+        if index in self._selected_indices:
+            # selected by index, before its view was created
+            self._select_created_view(view_instance)
+        elif self.propagate_selection_to_data:
             # The data item must be a subclass of SelectableDataItem, or must
             # have an is_selected boolean or function, so it has is_selected
             # available.  If is_selected is unavailable on the data item, an
@@ -255,25 +466,234 @@ class ListAdapter(Adapter, EventDispatcher):
                 msg = "ListAdapter: unselectable data item for {0}"
                 raise Exception(msg.format(index))
 
-        view_instance.bind(on_release=self.handle_selection)
+        if not recycled:
+            view_instance.bind(on_release=self.handle_selection)
 
-        for child in view_instance.children:
-            child.bind(on_release=self.handle_selection)
+            for child in view_instance.children:
+                child.bind(on_release=self.handle_selection)
 
         return view_instance
 
+    def release_view(self, index, view):
+        '''Called by the view when the item view for `index` is not displayed
+        anymore. The selected views are kept in :data:`cached_views`, as the
+        :data:`selection` refers to them. The others are removed from the
+        cache, and may be reused for another item.
+
+        .. versionadded:: 1.8.0
+        '''
+        if getattr(view, 'is_selected', False):
+            return
+        if self.cached_views.get(index) is view:
+            del self.cached_views[index]
+            self._cache_order.pop(index, None)
+        super(ListAdapter, self).release_view(index, view)
+
+    def refresh_data_item(self, index):
+        '''Tell that the data item at `index` has been modified in place.
+
+        If the cached view of the item has a `refresh_view_attrs` method, it
+        is updated in place with the new arguments from the
+        :data:`args_converter`. Otherwise, it is removed from the cache (and
+        from the :data:`selection`), and a new view is created by the next
+        :meth:`get_view`, selected if the item was. The other cached views are
+        kept.
+
+        .. versionadded:: 1.8.0
+        '''
+        view = self.cached_views.get(index)
+        if view is not None:
+            item = self.get_data_item(index)
+            refresh_view_attrs = getattr(view, 'refresh_view_attrs', None)
+            if item is not None and refresh_view_attrs is not None:
+                item_args = self.args_converter(index, item)
+                item_args['index'] = index
+                refresh_view_attrs(self, index, item_args)
+            else:
+                del self.cached_views[index]
+                self._cache_order.pop(index, None)
+                if id(view) in self._selected_views:
+                    # the item stays selected by index: the new view is
+                    # selected when it is created
+                    self._forget_selected_view(view, keep_index=True)
+                    self._remove_selection(view)
+                    self.dispatch('on_selection_change')
+        super(ListAdapter, self).refresh_data_item(index)
+
     def on_selection_change(self, *args):
         '''on_selection_change() is the default handler for the
         on_selection_change event.
         '''
         pass
 
+    def _sync_selection(self, *args):
+        # the selection list was changed directly, not by the adapter: index
+        # it again
+        if self._updating_selection:
+            return
+        self._selected_views = {}
+        self._views_by_index = {}
+        self._selected_indices.clear()
+        for view in self.selection:
+            self._remember_selected_view(view)
+        keys = [_selection_key(view) for view in self.selection]
+        if keys == sorted(keys):
+            self._selection_keys = keys
+        else:
+            self._set_selection(self.selection[:])
+
+    def _set_selection(self, views):
+        views = sorted(views, key=_selection_key)
+        self._selection_keys = [_selection_key(view) for view in views]
+        self._updating_selection = True
+        self.selection = views
+        self._updating_selection = False
+
+    def _append_selection(self, view):
+        if self._selection_batch is not None:
+            self._selection_batch.append(view)
+            return
+        key = _selection_key(view)
+        position = bisect_right(self._selection_keys, key)
+        self._selection_keys.insert(position, key)
+        self._updating_selection = True
+        self.selection.insert(position, view)
+        self._updating_selection = False
+
+    def _remove_selection(self, view):
+        if self._selection_batch is not None:
+            # removed from the list at the end of the batch
+            return
+        # several views can have the same index (composite list items)
+        keys = self._selection_keys
+        selection = self.selection
+        position = bisect_left(keys, _selection_key(view))
+        while selection[position] is not view:
+            position += 1
+        del keys[position]
+        self._updating_selection = True
+        del selection[position]
+        self._updating_selection = False
+
+    def _remember_selected_view(self, view):
+        self._selected_views[id(view)] = view
+        index = getattr(view, 'index', None)
+        self._views_by_index.setdefault(index, []).append(view)
+        if index is not None:
+            self._selected_indices.add(index)
+
+    def _forget_selected_view(self, view, keep_index=False):
+        del self._selected_views[id(view)]
+        index = getattr(view, 'index', None)
+        views = self._views_by_index[index]
+        views[:] = [x for x in views if x is not view]
+        if not views:
+            # the index is selected as long as one of its views is
+            del self._views_by_index[index]
+            if index is not None and not keep_index:
+                self._selected_indices.remove(index)
+
+    def _selected_count(self):
+        return len(self._selected_indices) + \
+            len(self._views_by_index.get(None, ()))
+
+    def _begin_selection_batch(self):
+        # returns False if a batch is already started
+        if self._selection_batch is not None:
+            return False
+        self._selection_batch = []
+        return True
+
+    def _end_selection_batch(self):
+        # update the selection list once, with the views selected during the
+        # batch
+        added = self._selection_batch
+        self._selection_batch = None
+        selected = self._selected_views
+        selection = [view for view in self.selection if id(view) in selected]
+        present = set(id(view) for view in selection)
+        for view in added:
+            if id(view) in selected and id(view) not in present:
+                selection.append(view)
+                present.add(id(view))
+        self._set_selection(selection)
+
+    def _select_created_view(self, view):
+        # the view of an item selected by index is created
+        view.select()
+        view.is_selected = True
+        self._remember_selected_view(view)
+        self._append_selection(view)
+
+    def _select_indices(self, start, end):
+        # select the items from start to end (included): their existing
+        # views are selected, the others are only selected by index
+        indices = self._selected_indices
+        selected = self._selected_views
+        cached_views = self.cached_views
+        if end - start < len(cached_views):
+            views = [(index, cached_views.get(index))
+                     for index in range(start, end + 1)]
+        else:
+            views = list(cached_views.items())
+        for index, view in views:
+            if view is not None and start <= index <= end and \
+                    id(view) not in selected:
+                self.select_item_view(view)
+        if self.propagate_selection_to_data:
+            for index in range(start, end + 1):
+                if index not in indices:
+                    self.select_data_item(self.get_data_item(index))
+        indices.add_range(start, end)
+
+    def _deselect_indices(self, start, end):
+        # deselect the items from start to end (included), with or without a
+        # view
+        indices = self._selected_indices
+        views = [view for index, index_views in self._views_by_index.items()
+                 if index is not None and start <= index <= end
+                 for view in index_views]
+        for view in views:
+            self.deselect_item_view(view)
+        if self.propagate_selection_to_data:
+            for index in list(indices.range(start, end)):
+                self.deselect_data_item(self.get_data_item(index))
+        indices.remove_range(start, end)
+
+    def _deselect_all_items(self):
+        for view in list(self._selected_views.values()):
+            self.deselect_item_view(view)
+        indices = self._selected_indices
+        if len(indices):
+            self._deselect_indices(indices.first(), indices.last())
+
+    def is_view_selected(self, view):
+        '''Return True if the `view` is in the :data:`selection`.
+
+        .. versionadded:: 1.8.0
+        '''
+        return id(view) in self._selected_views
+
+    def is_index_selected(self, index):
+        '''Return True if the item at `index` is selected, even if its view is
+        not created.
+
+        .. versionadded:: 1.8.0
+        '''
+        return index in self._selected_indices
+
+    def get_selected_indices(self):
+        '''Return the sorted list of the data indices of the selected items,
+        including the items selected without a view.
+
+        .. versionadded:: 1.8.0
+        '''
+        return list(self._selected_indices)
+
     def handle_selection(self, view, hold_dispatch=False, *args):
-        if view not in self.selection:
-            if self.selection_mode in ['none', 'single'] and \
-                    len(self.selection) > 0:
-                for selected_view in self.selection:
-                    self.deselect_item_view(selected_view)
+        if id(view) not in self._selected_views:
+            if self.selection_mode in ['none', 'single']:
+                self._deselect_all_items()
             if self.selection_mode != 'none':
                 if self.selection_mode == 'multiple':
                     if self.allow_empty_selection:
@@ -281,7 +701,7 @@ class ListAdapter(Adapter, EventDispatcher):
                         if self.selection_limit < 0:
                             self.select_item_view(view)
                         else:
-                            if len(self.selection) < self.selection_limit:
+                            if self._selected_count() < self.selection_limit:
                                 self.select_item_view(view)
                     else:
                         self.select_item_view(view)
@@ -322,7 +742,8 @@ class ListAdapter(Adapter, EventDispatcher):
     def select_item_view(self, view):
         view.select()
         view.is_selected = True
-        self.selection.append(view)
+        self._remember_selected_view(view)
+        self._append_selection(view)
 
         # [TODO] sibling selection for composite items
         #        Needed? Or handled from parent?
@@ -347,18 +768,22 @@ class ListAdapter(Adapter, EventDispatcher):
 
             extend: boolean for whether or not to extend the existing list
         '''
+        batch = self._begin_selection_batch()
         if not extend:
-            self.selection = []
+            self._deselect_all_items()
 
         for view in view_list:
             self.handle_selection(view, hold_dispatch=True)
 
+        if batch:
+            self._end_selection_batch()
         self.dispatch('on_selection_change')
 
     def deselect_item_view(self, view):
         view.deselect()
         view.is_selected = False
-        self.selection.remove(view)
+        self._forget_selected_view(view)
+        self._remove_selection(view)
 
         # [TODO] sibling deselection for composite items
         #        Needed? Or handled from parent?
@@ -374,31 +799,118 @@ class ListAdapter(Adapter, EventDispatcher):
             self.deselect_data_item(item)
 
     def deselect_list(self, l):
+        batch = self._begin_selection_batch()
         for view in l:
             self.handle_selection(view, hold_dispatch=True)
 
+        if batch:
+            self._end_selection_batch()
+        self.dispatch('on_selection_change')
+
+    def select_range(self, start, end, extend=True):
+        '''Select the items with indices from `start` to `end` (included),
+        with a single *on_selection_change* event. The selection_mode and
+        selection_limit are respected, as with :meth:`select_list`.
+
+        The views of the items are not created: the views already created are
+        selected, and the others are selected when :meth:`get_view` creates
+        them. Use :meth:`get_selected_indices` to get all the selected items.
+
+        .. versionadded:: 1.8.0
+        '''
+        start = max(0, start)
+        end = min(end, self.get_count() - 1)
+        batch = self._begin_selection_batch()
+        mode = self.selection_mode
+        if mode != 'multiple':
+            self._deselect_all_items()
+            if mode == 'single' and start <= end:
+                self._select_indices(end, end)
+        elif not extend:
+            indices = self._selected_indices
+            if len(indices) and indices.first() < start:
+                self._deselect_indices(indices.first(), start - 1)
+            if len(indices) and indices.last() > end:
+                self._deselect_indices(end + 1, indices.last())
+            for view in self._views_by_index.get(None, [])[:]:
+                self.deselect_item_view(view)
+        if mode == 'multiple' and start <= end:
+            limit = self.selection_limit
+            if self.allow_empty_selection and limit >= 0:
+                remaining = limit - self._selected_count()
+                index = start
+                while remaining > 0 and index <= end:
+                    if index not in self._selected_indices:
+                        self._select_indices(index, index)
+                        remaining -= 1
+                    index += 1
+            else:
+                self._select_indices(start, end)
+
+        if batch:
+            self._end_selection_batch()
         self.dispatch('on_selection_change')
 
-    # [TODO] Could easily add select_all() and deselect_all().
+    def deselect_range(self, start, end):
+        '''Deselect the selected items with indices from `start` to `end`
+        (included), with a single *on_selection_change* event.
+
+        .. versionadded:: 1.8.0
+        '''
+        batch = self._begin_selection_batch()
+        self._deselect_indices(start, end)
+        if self.selection_mode != 'none':
+            self._check_for_empty_selection(True)
+
+        if batch:
+            self._end_selection_batch()
+        self.dispatch('on_selection_change')
+
+    def select_all(self):
+        '''Select all the items. See :meth:`select_range`.
+
+        .. versionadded:: 1.8.0
+        '''
+        self.select_range(0, self.get_count() - 1)
+
+    def deselect_all(self):
+        '''Deselect all the items. See :meth:`deselect_range`.
+
+        .. versionadded:: 1.8.0
+        '''
+        batch = self._begin_selection_batch()
+        self._deselect_all_items()
+        if self.selection_mode != 'none':
+            self._check_for_empty_selection(True)
+
+        if batch:
+            self._end_selection_batch()
+        self.dispatch('on_selection_change')
 
     def update_for_new_data(self, *args):
         self.delete_cache()
         self.initialize_selection()
 
     def initialize_selection(self, *args):
-        if len(self.selection) > 0:
-            self.selection = []
+        if len(self.selection) > 0 or self._selected_count() > 0:
+            self._selected_views = {}
+            self._views_by_index = {}
+            self._selected_indices.clear()
+            self._set_selection([])
             self.dispatch('on_selection_change')
 
         self.check_for_empty_selection()
 
     def check_for_empty_selection(self, *args):
+        self._check_for_empty_selection(self._selection_batch is not None)
+
+    def _check_for_empty_selection(self, hold_dispatch):
         if not self.allow_empty_selection:
-            if len(self.selection) == 0:
+            if self._selected_count() == 0:
                 # Select the first item if we have it.
                 v = self.get_view(0)
                 if v is not None:
-                    self.handle_selection(v)
+                    self.handle_selection(v, hold_dispatch=hold_dispatch)
 
     # [TODO] Also make methods for scroll_to_sel_start, scroll_to_sel_end,
     #        scroll_to_sel_middle.
@@ -407,17 +919,16 @@ class ListAdapter(Adapter, EventDispatcher):
         '''Cut list items with indices in sorted_keys that are less than the
         index of the first selected item if there is a selection.
         '''
-        if len(self.selection) > 0:
-            first_sel_index = min([sel.index for sel in self.selection])
+        first_sel_index = self._selected_indices.first()
+        if first_sel_index is not None:
             self.data = self.data[first_sel_index:]
 
     def trim_right_of_sel(self, *args):
         '''Cut list items with indices in sorted_keys that are greater than
         the index of the last selected item if there is a selection.
         '''
-        if len(self.selection) > 0:
-            last_sel_index = max([sel.index for sel in self.selection])
-            print('last_sel_index', last_sel_index)
+        last_sel_index = self._selected_indices.last()
+        if last_sel_index is not None:
             self.data = self.data[:last_sel_index + 1]
 
     def trim_to_sel(self, *args):
@@ -426,10 +937,9 @@ class ListAdapter(Adapter, EventDispatcher):
         selection. This preserves intervening list items within the selected
         range.
         '''
-        if len(self.selection) > 0:
-            sel_indices = [sel.index for sel in self.selection]
-            first_sel_index = min(sel_indices)
-            last_sel_index = max(sel_indices)
+        first_sel_index = self._selected_indices.first()
+        if first_sel_index is not None:
+            last_sel_index = self._selected_indices.last()
             self.data = self.data[first_sel_index:last_sel_index + 1]
 
     def cut_to_sel(self, *args):
@@ -65,6 +65,10 @@ class SimpleListAdapter(Adapter):
 
         item_args = self.args_converter(index, item)
 
+        instance = self.recycle_view(item_args, index)
+        if instance is not None:
+            return instance
+
         if self.cls:
             instance = self.cls(**item_args)
             return instance
@@ -28,6 +28,13 @@ A file with ``<basename>.atlas`` is a json file formatted like this::
         # ...
     }
 
+If the atlas was created with ``trim=True``, the ids of the trimmed images
+have 4 more values: the position of the trimmed image inside the original one,
+and the size of the original image::
+
+    "id3": [ <x>, <y>, <width>, <height>,
+             <offset_x>, <offset_y>, <original_width>, <original_height> ]
+
 Example of the Kivy ``defaulttheme.atlas``::
 
     {
@@ -122,11 +129,30 @@ Manual usage of the Atlas
     ['bubble', 'bubble-red', 'button', 'button-down']
     >>> print(atlas['button'])
     <kivy.graphics.texture.TextureRegion object at 0x2404d10>
+
+Runtime atlas
+-------------
+
+.. versionadded:: 1.8.0
+
+Images that are not in an atlas file can still be packed together when they
+are loaded. If the ``runtime_atlas`` token of the ``graphics`` section is set
+to a page size, every small rgba image loaded by
+:class:`~kivy.core.image.Image` (and so, by the
+:class:`~kivy.uix.image.Image` widget) is packed into a shared page of a
+:class:`RuntimeAtlas`, and you get a
+:class:`~kivy.graphics.texture.TextureRegion` of that page instead of a new
+texture. Icons displayed together then share the same texture.
+
+A page is released when all the regions packed into it are garbage
+collected. The space of a single released region is not reused.
 '''
 
-__all__ = ('Atlas', )
+__all__ = ('Atlas', 'RuntimeAtlas')
 
 import json
+from multiprocessing.pool import ThreadPool
+from weakref import ref
 from os.path import basename, dirname, join, splitext
 from kivy.event import EventDispatcher
 from kivy.logger import Logger
@@ -136,6 +162,7 @@ import os
 
 # late import to prevent recursion
 CoreImage = None
+Texture = None
 
 
 class Atlas(EventDispatcher):
@@ -148,6 +175,19 @@ class Atlas(EventDispatcher):
     :data:`textures` is a :class:`~kivy.properties.DictProperty`, default to {}
     '''
 
+    trims = DictProperty({})
+    '''Trimming information of the textures whose transparent borders were
+    removed when the atlas was created (see the `trim` parameter of
+    :meth:`create`). Each id is associated to a tuple ``(offset_x, offset_y,
+    original_width, original_height)``: the texture must be drawn at
+    (offset_x, offset_y) inside a box of the original size to show the
+    original image.
+
+    .. versionadded:: 1.8.0
+
+    :data:`trims` is a :class:`~kivy.properties.DictProperty`, default to {}
+    '''
+
     def _get_filename(self):
         return self._filename
 
@@ -184,6 +224,7 @@ class Atlas(EventDispatcher):
         Logger.debug('Atlas: Need to load %d images' % len(meta))
         d = dirname(filename)
         textures = {}
+        trims = {}
         for subfilename, ids in meta.items():
             subfilename = join(d, subfilename)
             Logger.debug('Atlas: Load <%s>' % subfilename)
@@ -194,13 +235,17 @@ class Atlas(EventDispatcher):
             # for all the uid, load the image, get the region, and put it in our
             # dict.
             for meta_id, meta_coords in ids.items():
-                x, y, w, h = meta_coords
-                textures[meta_id] = ci.texture.get_region(*meta_coords)
+                x, y, w, h = meta_coords[:4]
+                textures[meta_id] = ci.texture.get_region(x, y, w, h)
+                if len(meta_coords) > 4:
+                    trims[meta_id] = tuple(meta_coords[4:])
 
+        self.trims = trims
         self.textures = textures
 
     @staticmethod
-    def create(outname, filenames, size, padding=2, use_path=False):
+    def create(outname, filenames, size, padding=2, use_path=False,
+               trim=False, jobs=None):
         '''This method can be used to create manually an atlas from a set of
         images.
 
@@ -231,13 +276,23 @@ class Atlas(EventDispatcher):
                 ``../data/tiles/green_grass.png`` then the id will be
                 ``green_grass`` if use_path is False, and it will be
                 ``data_tiles_green_grass`` if use_path is True
+            `trim`: bool, default to False
+                If True, the fully transparent borders of the images are
+                removed before packing. The ids then reference the trimmed
+                images, and the position of the trimmed image inside the
+                original one is stored in the ``.atlas`` (see
+                :data:`trims`).
+            `jobs`: int, default to None
+                Number of threads used to load and save the images. Default to
+                the number of CPUs.
 
             .. versionchanged:: 1.8.0
                 Parameter use_path added
+
+            .. versionchanged:: 1.8.0
+                The images are packed with the MaxRects algorithm, loaded and
+                saved in parallel. Parameters trim and jobs added.
         '''
-        # Thanks to
-        # omnisaurusgames.com/2011/06/texture-atlas-generation-using-python/
-        # for its initial implementation.
         try:
             from PIL import Image
         except ImportError:
@@ -245,89 +300,91 @@ class Atlas(EventDispatcher):
             raise
 
         size = int(size)
+        pool = ThreadPool(jobs)
+
+        def load(filename):
+            im = Image.open(filename)
+            im.load()
+            trimmed = None
+            if trim:
+                if im.mode != 'RGBA':
+                    im = im.convert('RGBA')
+                bbox = im.split()[-1].getbbox()
+                if bbox is not None and bbox != (0, 0) + im.size:
+                    # offset of the trimmed image from the bottom-left
+                    # corner, and size of the original image
+                    w, h = im.size
+                    trimmed = bbox[0], h - bbox[3], w, h
+                    im = im.crop(bbox)
+            return filename, im, trimmed
 
-        # open all of the images
-        ims = [(f, Image.open(f)) for f in filenames]
-
-        # sort by image area
-        ims = sorted(ims, key=lambda im: im[1].size[0] * im[1].size[1],
-                reverse=True)
-
-        # free boxes are empty space in our output image set
-        # the freebox tuple format is: outidx, x, y, w, h
-        freeboxes = [(0, 0, 0, size, size)]
-        numoutimages = 1
-
-        # full boxes are areas where we have placed images in the atlas
-        # the full box tuple format is: image, outidx, x, y, w, h, filename
-        fullboxes = []
-
-        # do the actual atlasing by sticking the largest images we can have into
-        # the smallest valid free boxes
-        for imageinfo in ims:
-            im = imageinfo[1]
-            imw, imh = im.size
-            imw += padding
-            imh += padding
-            if imw > size or imh > size:
-                Logger.error('Atlas: image %s is larger than the atlas size!' %
-                    imageinfo[0])
-                return
-
-            inserted = False
-            while not inserted:
-                for idx, fb in enumerate(freeboxes):
-                    # find the smallest free box that will contain this image
-                    if fb[3] >= imw and fb[4] >= imh:
-                        # we found a valid spot! Remove the current freebox, and
-                        # split the leftover space into (up to) two new
-                        # freeboxes
-                        del freeboxes[idx]
-                        if fb[3] > imw:
-                            freeboxes.append((
-                                fb[0], fb[1] + imw, fb[2],
-                                fb[3] - imw, imh))
-
-                        if fb[4] > imh:
-                            freeboxes.append((
-                                fb[0], fb[1], fb[2] + imh,
-                                fb[3], fb[4] - imh))
-
-                        # keep this sorted!
-                        freeboxes = sorted(freeboxes,
-                                key=lambda fb: fb[3] * fb[4])
-                        fullboxes.append((im,
-                            fb[0], fb[1] + padding,
-                            fb[2] + padding, imw - padding,
-                            imh - padding, imageinfo[0]))
-                        inserted = True
+        try:
+            # open all of the images
+            ims = pool.map(load, filenames)
+
+            # place the images by decreasing longest side, then area: the
+            # small ones will fill the holes left by the big ones.
+            ims = sorted(ims, key=lambda im: (max(im[1].size),
+                im[1].size[0] * im[1].size[1]), reverse=True)
+
+            # one packer per output image
+            packers = []
+
+            # full boxes are areas where we have placed images in the atlas
+            # the full box tuple format is: image, outidx, x, y, w, h,
+            # filename, trimmed
+            fullboxes = []
+
+            for filename, im, trimmed in ims:
+                imw, imh = im.size
+                imw += padding
+                imh += padding
+                if imw > size or imh > size:
+                    Logger.error(
+                        'Atlas: image %s is larger than the atlas size!' %
+                        filename)
+                    return
+
+                # use the first output image that has room for it
+                best = None
+                for idx, packer in enumerate(packers):
+                    pos = packer.find(imw, imh)
+                    if pos is not None:
+                        best = idx, pos
                         break
-
-                if not inserted:
-                    # oh crap - there isn't room in any of our free boxes, so we
-                    # have to add a new output image
-                    freeboxes.append((numoutimages, 0, 0, size, size))
-                    numoutimages += 1
-
-        # now that we've figured out where everything goes, make the output
-        # images and blit the source images to the approriate locations
-        Logger.info('Atlas: create an {0}x{0} rgba image'.format(size))
-        outimages = [Image.new('RGBA', (size, size))
-                for i in range(0, int(numoutimages))]
-        for fb in fullboxes:
-            x, y = fb[2], fb[3]
-            out = outimages[fb[1]]
-            out.paste(fb[0], (fb[2], fb[3]))
-            w, h = fb[0].size
-            if padding > 1:
-                out.paste(fb[0].crop((0, 0, w, 1)), (x, y - 1))
-                out.paste(fb[0].crop((0, h - 1, w, h)), (x, y + h))
-                out.paste(fb[0].crop((0, 0, 1, h)), (x - 1, y))
-                out.paste(fb[0].crop((w - 1, 0, w, h)), (x + w, y))
-
-        # save the output images
-        for idx, outimage in enumerate(outimages):
-            outimage.save('%s-%d.png' % (outname, idx))
+                if best is None:
+                    # there isn't room in any of our output images, so we
+                    # have to add a new one
+                    packers.append(_MaxRectsPacker(size, size))
+                    best = len(packers) - 1, (0, 0)
+
+                idx, (x, y) = best
+                packers[idx].place(x, y, imw, imh)
+                fullboxes.append((im, idx, x + padding, y + padding,
+                    imw - padding, imh - padding, filename, trimmed))
+
+            # now that we've figured out where everything goes, make the
+            # output images and blit the source images to the approriate
+            # locations
+            Logger.info('Atlas: create an {0}x{0} rgba image'.format(size))
+            outimages = [Image.new('RGBA', (size, size))
+                    for i in range(0, len(packers))]
+            for fb in fullboxes:
+                x, y = fb[2], fb[3]
+                out = outimages[fb[1]]
+                out.paste(fb[0], (fb[2], fb[3]))
+                w, h = fb[0].size
+                if padding > 1:
+                    out.paste(fb[0].crop((0, 0, w, 1)), (x, y - 1))
+                    out.paste(fb[0].crop((0, h - 1, w, h)), (x, y + h))
+                    out.paste(fb[0].crop((0, 0, 1, h)), (x - 1, y))
+                    out.paste(fb[0].crop((w - 1, 0, w, h)), (x + w, y))
+
+            # save the output images
+            pool.map(lambda item: item[1].save('%s-%d.png' % (
+                outname, item[0])), enumerate(outimages))
+        finally:
+            pool.close()
 
         # write out an json file that says where everything ended up
         meta = {}
@@ -355,6 +412,8 @@ class Atlas(EventDispatcher):
 
             x, y, w, h = fb[2:6]
             d[uid] = x, size - y - h, w, h
+            if fb[7] is not None:
+                d[uid] += fb[7]
 
         outfn = '%s.atlas' % outname
         with open(outfn, 'w') as fd:
@@ -362,6 +421,214 @@ class Atlas(EventDispatcher):
 
         return outfn, meta
 
+
+class _MaxRectsPacker(object):
+    # Pack rectangles into one page, using the MaxRects algorithm with the
+    # "best short side fit" heuristic. The free space is kept as a list of
+    # maximal rectangles that can overlap each other.
+
+    def __init__(self, width, height):
+        super(_MaxRectsPacker, self).__init__()
+        self.width = width
+        self.height = height
+        self.used = 0
+        self.freerects = [(0, 0, width, height)]
+
+    @property
+    def occupancy(self):
+        return self.used / float(self.width * self.height)
+
+    def find(self, w, h):
+        # return the (x, y) where a w*h rectangle would be placed, or None
+        best = None
+        best_short = best_long = self.width + self.height
+        for fx, fy, fw, fh in self.freerects:
+            if fw < w or fh < h:
+                continue
+            short, long = sorted((fw - w, fh - h))
+            if short < best_short or (short == best_short and
+                                      long < best_long):
+                best = fx, fy
+                best_short, best_long = short, long
+        return best
+
+    def insert(self, w, h):
+        pos = self.find(w, h)
+        if pos is not None:
+            self.place(pos[0], pos[1], w, h)
+        return pos
+
+    def place(self, x, y, w, h):
+        kept = []
+        splitted = []
+        append = splitted.append
+        for rect in self.freerects:
+            fx, fy, fw, fh = rect
+            if x >= fx + fw or x + w <= fx or y >= fy + fh or y + h <= fy:
+                kept.append(rect)
+                continue
+            # split the free rectangle around the placed one
+            if x > fx:
+                append((fx, fy, x - fx, fh))
+            if x + w < fx + fw:
+                append((x + w, fy, fx + fw - x - w, fh))
+            if y > fy:
+                append((fx, fy, fw, y - fy))
+            if y + h < fy + fh:
+                append((fx, y + h, fw, fy + fh - y - h))
+
+        # remove the rectangles contained in another one. the kept rectangles
+        # were not contained in each other before, so only the pairs with a
+        # new rectangle need to be tested.
+        news = []
+        for index, rect in enumerate(splitted):
+            rx, ry, rw, rh = rect
+            for fx, fy, fw, fh in kept:
+                if (rx >= fx and ry >= fy and rx + rw <= fx + fw and
+                        ry + rh <= fy + fh):
+                    break
+            else:
+                for other in splitted[index + 1:] + news:
+                    fx, fy, fw, fh = other
+                    if (rx >= fx and ry >= fy and rx + rw <= fx + fw and
+                            ry + rh <= fy + fh):
+                        break
+                else:
+                    news.append(rect)
+        if news:
+            # a new rectangle can't contain a kept one: they are both
+            # maximal in the free space before the placement, and the new
+            # one is a part of a previous free rectangle.
+            kept.extend(news)
+        self.freerects = kept
+        self.used += w * h
+
+
+def _extrude_rgba(data, w, h):
+    # return the rgba pixels with a 1px border copied from the image edges,
+    # to prevent the linear filtering to take pixels from the neighbours.
+    stride = w * 4
+    rows = [data[i:i + stride] for i in range(0, stride * h, stride)]
+    rows = [row[:4] + row + row[-4:] for row in rows]
+    return b''.join([rows[0]] + rows + [rows[-1]])
+
+
+class _RuntimeAtlasPage(object):
+
+    def __init__(self, size):
+        super(_RuntimeAtlasPage, self).__init__()
+        self.texture = Texture.create(size=(size, size), colorfmt='rgba')
+        self.packer = _MaxRectsPacker(size, size)
+        # (weakref of the region, source, x, y) of all the packed images
+        self.entries = []
+        self.texture.add_reload_observer(self._reload)
+
+    def _reload(self, texture):
+        # the page has no source, so each image must be loaded again.
+        from kivy.core.image import ImageLoader
+        for region, source, x, y in self.entries:
+            if region() is None:
+                continue
+            try:
+                imagedata = ImageLoader.load(
+                    source, keep_data=True, nocache=True)._data[0]
+            except Exception:
+                Logger.exception('Atlas: Unable to reload <%s>' % source)
+                continue
+            w, h = imagedata.size
+            texture.blit_buffer(_extrude_rgba(imagedata.data, w, h),
+                    size=(w + 2, h + 2), colorfmt='rgba', pos=(x, y))
+
+
+class RuntimeAtlas(object):
+    '''Pack images into shared texture pages, as they are loaded. See the
+    module documentation for more information.
+
+    .. versionadded:: 1.8.0
+
+    :Parameters:
+        `size`: int, default to 1024
+            Size of a page.
+        `max_size`: int, default to None
+            Images with a width or a height bigger than this are not packed.
+            Default to a quarter of the page size.
+    '''
+
+    def __init__(self, size=1024, max_size=None):
+        super(RuntimeAtlas, self).__init__()
+        global Texture
+        if Texture is None:
+            from kivy.graphics.texture import Texture
+        self.size = size
+        self.max_size = max_size or size // 4
+        self.pages = []
+
+    def can_add(self, imagedata):
+        '''Return True if the image data can be packed into a page.
+        '''
+        w, h = imagedata.size
+        return (imagedata.fmt == 'rgba' and not imagedata.have_mipmap and
+                0 < w <= self.max_size and 0 < h <= self.max_size and
+                imagedata.data is not None)
+
+    def add(self, imagedata, source=None):
+        '''Pack an :class:`~kivy.core.image.ImageData` into a page, and
+        return the :class:`~kivy.graphics.texture.TextureRegion` where it has
+        been uploaded, or None if the image cannot be packed.
+
+        :Parameters:
+            `imagedata`: :class:`~kivy.core.image.ImageData`
+                Image to pack.
+            `source`: str, default to None
+                Filename of the image, used to upload it again if the OpenGL
+                context is lost. Default to the source of the image data.
+        '''
+        source = source or imagedata.source
+        if source is None or not self.can_add(imagedata):
+            return None
+        w, h = imagedata.size
+
+        # keep 1px around the image for the extruded border
+        for page in self.pages:
+            pos = page.packer.insert(w + 2, h + 2)
+            if pos is not None:
+                break
+        else:
+            page = _RuntimeAtlasPage(self.size)
+            pos = page.packer.insert(w + 2, h + 2)
+            self.pages.append(page)
+            Logger.debug('Atlas: create runtime page #%d (%dx%d)' % (
+                len(self.pages), self.size, self.size))
+
+        x, y = pos
+        page.texture.blit_buffer(_extrude_rgba(imagedata.data, w, h),
+                size=(w + 2, h + 2), colorfmt='rgba', pos=(x, y))
+        region = page.texture.get_region(x + 1, y + 1, w, h)
+        page.entries.append((ref(region, self._on_region_released), source,
+                             x, y))
+        return region
+
+    def _on_region_released(self, wr):
+        for page in self.pages[:]:
+            entries = page.entries
+            for index, entry in enumerate(entries):
+                if entry[0] is wr:
+                    del entries[index]
+                    if not entries:
+                        self.pages.remove(page)
+                    return
+
+    @property
+    def occupancy(self):
+        '''Ratio of the pages area used by the packed images, between 0 and
+        1.
+        '''
+        if not self.pages:
+            return 0.
+        return sum(page.packer.used for page in self.pages) / float(
+            len(self.pages) * self.size * self.size)
+
+
 if __name__ == '__main__':
 
     import sys
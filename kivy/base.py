@@ -3,6 +3,29 @@
 Event loop management
 =====================
 
+Power saving
+------------
+
+.. versionadded:: 1.8.0
+
+By default, the event loop runs at the `maxfps` of the configuration, even
+when nothing changes on the screen. When :attr:`EventLoopBase.power_save` is
+True (`power_save` token of the graphics section), the loop sleeps before each
+frame until:
+
+- the next event scheduled on the :class:`~kivy.clock.Clock` is due,
+- :meth:`EventLoopBase.wakeup` is called, for example by an input provider
+  reading its device in a thread,
+- the window has events waiting, or its canvas must be redrawn.
+
+It returns to full rate as long as there is activity: a running animation is
+an interval scheduled on the clock, and keeps waking up the loop.
+
+The window and the clock are checked again every
+:attr:`EventLoopBase.power_save_poll` seconds, to catch the events from
+sources that cannot wake up the loop, like a callback scheduled from another
+thread. Windows that cannot tell if they have pending events (see
+:meth:`~kivy.core.window.WindowBase.has_pending_events`) never sleep.
 '''
 
 __all__ = (
@@ -16,9 +39,13 @@ __all__ = (
 )
 
 import sys
+from collections import deque
+from threading import Event
+from time import time
 from kivy.config import Config
 from kivy.logger import Logger
 from kivy.clock import Clock
+from kivy.profiler import Profiler
 from kivy.event import EventDispatcher
 from kivy.lang import Builder
 
@@ -87,10 +114,25 @@ class EventLoopBase(EventDispatcher):
 
     __events__ = ('on_start', 'on_pause', 'on_stop')
 
+    #: Maximum time in seconds slept in power saving mode before checking
+    #: again the window and the clock.
+    #:
+    #: .. versionadded:: 1.8.0
+    power_save_poll = .1
+
     def __init__(self):
         super(EventLoopBase, self).__init__()
         self.quit = False
         self.input_events = []
+        self._input_queue = deque()
+        self._input_index = {}
+        self._coalesced_events = set()
+        #: If True, only the last `update` event of each touch is dispatched
+        #: per frame. The :attr:`~kivy.input.motionevent.MotionEvent.coalesced`
+        #: attribute of the touch tells how many updates have been dropped.
+        #:
+        #: .. versionadded:: 1.8.0
+        self.coalesce_events = True
         self.postproc_modules = []
         self.status = 'idle'
         self.input_providers = []
@@ -98,6 +140,13 @@ class EventLoopBase(EventDispatcher):
         self.event_listeners = []
         self.window = None
         self.me_list = []
+        #: If True, sleep while nothing need to be done instead of running at
+        #: `maxfps`. Check the `Power saving`_ section for more information.
+        #:
+        #: .. versionadded:: 1.8.0
+        self.power_save = bool(Config and
+                               Config.getint('graphics', 'power_save'))
+        self._wakeup_event = Event()
 
     @property
     def touches(self):
@@ -176,6 +225,8 @@ class EventLoopBase(EventDispatcher):
 
         # ensure any restart will not break anything later.
         self.input_events = []
+        self._input_queue.clear()
+        self._input_index.clear()
 
         self.status = 'stopped'
         self.dispatch('on_stop')
@@ -258,57 +309,160 @@ class EventLoopBase(EventDispatcher):
                 me.pop()
         me.grab_state = False
 
-    def _dispatch_input(self, *ev):
-        # remove the save event for the touch if exist
-        if ev in self.input_events:
-            self.input_events.remove(ev)
-        self.input_events.append(ev)
+    def _dispatch_input(self, etype, me):
+        # the queue entries are lists, so a coalesced update can be dropped
+        # in place instead of being searched and removed from the queue.
+        entry = [etype, me]
+        if etype == 'update' and self.coalesce_events:
+            index = self._input_index
+            previous = index.get(me)
+            if previous is None:
+                me.coalesced = 0
+            else:
+                previous[0] = None
+                me.coalesced += 1
+                self._coalesced_events.add(me)
+            index[me] = entry
+        self._input_queue.append(entry)
 
     def dispatch_input(self):
         '''Called by idle() to read events from input providers, pass event to
         postproc, and dispatch final events.
         '''
+        # the coalesced updates counted in the previous frame are obsolete
+        coalesced = self._coalesced_events
+        if coalesced:
+            index = self._input_index
+            for me in list(coalesced):
+                if me not in index:
+                    me.coalesced = 0
+                    coalesced.discard(me)
+
         # first, aquire input events
         for provider in self.input_providers:
             provider.update(dispatch_fn=self._dispatch_input)
 
+        # keep the events that have not been coalesced
+        queue = self._input_queue
+        if queue:
+            self.input_events.extend([(etype, me) for etype, me in queue
+                                      if etype is not None])
+            queue.clear()
+            self._input_index.clear()
+
         # execute post-processing modules
         for mod in self.postproc_modules:
             self.input_events = mod.process(events=self.input_events)
 
         # real dispatch input
         input_events = self.input_events
-        pop = input_events.pop
+        self.input_events = []
         post_dispatch_input = self.post_dispatch_input
-        while input_events:
-            post_dispatch_input(*pop(0))
+        for etype, me in input_events:
+            post_dispatch_input(etype, me)
+
+    def wakeup(self):
+        '''Wake up the event loop if it's sleeping in power saving mode. This
+        method is thread-safe: an input provider reading its events in another
+        thread must call it when new events are available.
+
+        .. versionadded:: 1.8.0
+        '''
+        self._wakeup_event.set()
+
+    def can_sleep(self):
+        '''Return True if there is no input to dispatch, no touch down, and the
+        window has no pending events and doesn't need to be redrawn.
+
+        .. versionadded:: 1.8.0
+        '''
+        if self._input_queue or self.input_events or self.me_list:
+            return False
+        window = self.window
+        if window is not None:
+            if window.canvas.needs_redraw or window.has_pending_events():
+                return False
+        return True
+
+    def idle_wait(self):
+        '''Sleep until the next clock event is due, :meth:`wakeup` is called,
+        or :meth:`can_sleep` returns False. Return the time slept, in seconds.
+
+        .. versionadded:: 1.8.0
+        '''
+        wakeup_event = self._wakeup_event
+        start = time()
+        while not self.quit and self.can_sleep():
+            timeout = Clock.get_next_timeout()
+            if timeout is not None and timeout <= 0:
+                break
+            if timeout is None or timeout > self.power_save_poll:
+                timeout = self.power_save_poll
+            wakeup_event.wait(timeout)
+            if wakeup_event.is_set():
+                break
+        wakeup_event.clear()
+        return time() - start
 
     def idle(self):
         '''This function is called every frames. By default :
+        * it sleeps until something need to be done, in power saving mode
         * it "tick" the clock to the next frame
         * read all input and dispatch event
         * dispatch on_update + on_draw + on_flip on window
         '''
 
+        profiler = Profiler if Profiler.enabled else None
+
+        # wait for the next clock event or input
+        if self.power_save:
+            if profiler:
+                start = profiler.time()
+                self.idle_wait()
+                profiler.mark('sleep', 'frame', start)
+            else:
+                self.idle_wait()
+
+        if profiler:
+            profiler.frame += 1
+            frame_start = profiler.time()
+
         # update dt
         Clock.tick()
 
         # read and dispatch input from providers
+        if profiler:
+            start = profiler.time()
         self.dispatch_input()
+        if profiler:
+            start = profiler.mark('dispatch_input', 'input', start)
 
         # flush all the canvas operation
         Builder.sync()
+        if profiler:
+            start = profiler.mark('Builder.sync', 'builder', start)
 
         # tick before draw
         Clock.tick_draw()
+        if profiler:
+            start = profiler.mark('Clock.tick_draw', 'clock', start)
 
         # flush all the canvas operation
         Builder.sync()
+        if profiler:
+            start = profiler.mark('Builder.sync', 'builder', start)
 
         window = self.window
         if window and window.canvas.needs_redraw:
             window.dispatch('on_draw')
+            if profiler:
+                start = profiler.mark('on_draw', 'graphics', start)
             window.dispatch('on_flip')
+            if profiler:
+                profiler.mark('on_flip', 'graphics', start)
+
+        if profiler:
+            profiler.mark('frame', 'frame', frame_start)
 
         # don't loop if we don't have listeners !
         if len(self.event_listeners) == 0:
@@ -146,6 +146,7 @@ from os import environ
 from kivy.weakmethod import WeakMethod
 from kivy.config import Config
 from kivy.logger import Logger
+from kivy.profiler import Profiler
 import time
 
 try:
@@ -277,7 +278,13 @@ class ClockEvent(object):
             self._is_triggered = False
 
         # call the callback
-        ret = callback(self._dt)
+        if Profiler.enabled:
+            start = _default_time()
+            ret = callback(self._dt)
+            Profiler.add(Profiler.get_callback_name(callback), 'clock',
+                         start, _default_time() - start)
+        else:
+            ret = callback(self._dt)
 
         # if it's a once event, don't care about the result
         # just remove the event
@@ -300,7 +307,7 @@ class ClockBase(_ClockBase):
     '''
     __slots__ = ('_dt', '_last_fps_tick', '_last_tick', '_fps', '_rfps',
                  '_start_tick', '_fps_counter', '_rfps_counter', '_events',
-                 '_max_fps', 'max_iteration')
+                 '_max_fps', 'max_iteration', 'fixed_step')
 
     MIN_SLEEP = 0.005
     SLEEP_UNDERSHOOT = MIN_SLEEP - 0.001
@@ -323,6 +330,13 @@ class ClockBase(_ClockBase):
         #:     relayout.
         self.max_iteration = 10
 
+        #: .. versionadded:: 1.8.0
+        #:     If set, each :meth:`tick` advances the clock of exactly
+        #:     `fixed_step` seconds without sleeping, instead of following the
+        #:     real time. Used to render frames deterministically, for example
+        #:     by the offscreen window provider.
+        self.fixed_step = 0
+
     @property
     def frametime(self):
         '''Time spent between last frame and current frame (in seconds)
@@ -337,8 +351,12 @@ class ClockBase(_ClockBase):
         if self._fps_counter % 100 == 0:
             self._remove_empty()
 
+        profiler = Profiler if Profiler.enabled else None
+        if profiler:
+            start = profiler.time()
+
         # do we need to sleep ?
-        if self._max_fps > 0:
+        if self._max_fps > 0 and not self.fixed_step:
             min_sleep = self.MIN_SLEEP
             sleep_undershoot = self.SLEEP_UNDERSHOOT
             fps = self._max_fps
@@ -350,7 +368,10 @@ class ClockBase(_ClockBase):
                 sleeptime = 1 / fps - (_default_time() - self._last_tick)
 
         # tick the current time
-        current = _default_time()
+        if self.fixed_step:
+            current = self._last_tick + self.fixed_step
+        else:
+            current = _default_time()
         self._dt = current - self._last_tick
         self._fps_counter += 1
         self._last_tick = current
@@ -367,7 +388,12 @@ class ClockBase(_ClockBase):
             self._rfps_counter = 0
 
         # process event
-        self._process_events()
+        if profiler:
+            start = profiler.mark('sleep', 'frame', start)
+            self._process_events()
+            profiler.mark('Clock.tick', 'clock', start)
+        else:
+            self._process_events()
 
         return self._dt
 
@@ -391,6 +417,30 @@ class ClockBase(_ClockBase):
         '''
         return self._rfps
 
+    def get_next_timeout(self):
+        '''Return the time, in seconds, until the next scheduled event must be
+        called, 0 if an event is already due, or None if nothing is
+        scheduled.
+
+        .. versionadded:: 1.8.0
+        '''
+        timeout = None
+        if self.fixed_step:
+            current = self._last_tick
+        else:
+            current = _default_time()
+        for events in self._events.values():
+            for event in events:
+                if event.timeout <= 0:
+                    return 0
+                # same tolerance as ClockEvent.tick()
+                left = event._last_dt + event.timeout - 0.005 - current
+                if left <= 0:
+                    return 0
+                if timeout is None or left < timeout:
+                    timeout = left
+        return timeout
+
     def get_time(self):
         '''Get the last tick made by the clock'''
         return self._last_tick
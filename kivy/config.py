@@ -121,6 +121,19 @@ Available configuration tokens
     `resizable`: (0, 1)
         If 0, the window will have a fixed size. If 1, the window will be
         resizable.
+    `runtime_atlas`: int, default to 0
+        Size of the pages of the :class:`~kivy.atlas.RuntimeAtlas` where the
+        small images are packed when they are loaded. 0 disables the runtime
+        atlas.
+    `power_save`: (0, 1)
+        If 1, the event loop sleeps while nothing is scheduled on the
+        :class:`~kivy.clock.Clock`, no input is received and the window
+        doesn't need to be redrawn, instead of running at `maxfps`.
+    `partial_redraw`: (0, 1)
+        If 1, the window redraws only the regions changed since the last
+        frame, when the window provider can tell that the previous frame is
+        still in the back buffer. See
+        :meth:`~kivy.core.window.WindowBase.get_buffer_age`.
 
 :input:
 
@@ -177,7 +190,8 @@ Available configuration tokens
 
 .. versionchanged:: 1.8.0
     `systemanddock` and `systemandmulti` has been added as possible value for
-    `keyboard_mode` in kivy section.
+    `keyboard_mode` in kivy section. `runtime_atlas`, `power_save` and
+    `partial_redraw` have been added to graphics section.
 
 .. versionchanged:: 1.2.0
     `resizable` has been added to graphics section
@@ -212,7 +226,7 @@ from kivy.compat import PY2, string_types
 _is_rpi = exists('/opt/vc/include/bcm_host.h')
 
 # Version number of current configuration format
-KIVY_CONFIG_VERSION = 9
+KIVY_CONFIG_VERSION = 12
 
 #: Kivy configuration object
 Config = None
@@ -497,6 +511,15 @@ if not environ.get('KIVY_DOC_INCLUDE'):
             if Config.getint('widgets', 'scroll_timeout') == 55:
                 Config.set('widgets', 'scroll_timeout', '250')
 
+        elif version == 9:
+            Config.setdefault('graphics', 'runtime_atlas', '0')
+
+        elif version == 10:
+            Config.setdefault('graphics', 'power_save', '0')
+
+        elif version == 11:
+            Config.setdefault('graphics', 'partial_redraw', '0')
+
         #elif version == 1:
         #   # add here the command for upgrading from configuration 0 to 1
         #
@@ -32,6 +32,13 @@ class CameraBase(EventDispatcher):
             Used in the gstreamer pipeline by forcing the appsink caps
             to this resolution. If the camera doesnt support the resolution,
             a negotiation error might be thrown.
+        `streaming` : bool, default to False
+            Upload the frames through a
+            :class:`~kivy.graphics.texture.TextureStream` (may be not
+            supported by all providers). The :attr:`texture` changes between
+            frames, so it must be read again on each `on_texture`.
+
+            .. versionadded:: 1.8.0
 
     :Events:
         `on_load`
@@ -47,8 +54,10 @@ class CameraBase(EventDispatcher):
         kwargs.setdefault('stopped', False)
         kwargs.setdefault('resolution', (640, 480))
         kwargs.setdefault('index', 0)
+        kwargs.setdefault('streaming', False)
 
         self.stopped = kwargs.get('stopped')
+        self._streaming = kwargs.get('streaming')
         self._resolution = kwargs.get('resolution')
         self._index = kwargs.get('index')
         self._buffer = None
@@ -18,7 +18,7 @@ from kivy.core import core_register_libs
 from kivy.logger import Logger
 from kivy.cache import Cache
 from kivy.clock import Clock
-from kivy.atlas import Atlas
+from kivy.atlas import Atlas, RuntimeAtlas
 from kivy.resources import resource_find
 from kivy.utils import platform
 from kivy.compat import string_types
@@ -37,6 +37,18 @@ Texture = TextureRegion = None
 Cache.register('kv.image', timeout=60)
 Cache.register('kv.atlas')
 
+# runtime atlas, created on the first populated image if enabled
+_runtime_atlas = None
+
+
+def _get_runtime_atlas():
+    global _runtime_atlas
+    if _runtime_atlas is None:
+        from kivy.config import Config
+        size = Config.getint('graphics', 'runtime_atlas')
+        _runtime_atlas = RuntimeAtlas(size) if size > 0 else False
+    return _runtime_atlas or None
+
 
 class ImageData(object):
     '''Container for images and mipmap images.
@@ -184,8 +196,14 @@ class ImageLoaderBase(object):
             # if not create it and append to the cache
             if texture is None:
                 imagedata = self._data[count]
-                texture = Texture.create_from_data(
-                        imagedata, mipmap=self._mipmap)
+                atlas = None
+                if len(self._data) == 1 and not self._mipmap:
+                    atlas = _get_runtime_atlas()
+                if atlas is not None:
+                    texture = atlas.add(imagedata, source=self.filename)
+                if texture is None:
+                    texture = Texture.create_from_data(
+                            imagedata, mipmap=self._mipmap)
                 if not self._nocache:
                     Cache.append('kv.texture', uid, texture)
                 if imagedata.flip_vertical:
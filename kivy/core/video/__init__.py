@@ -36,6 +36,13 @@ class VideoBase(EventDispatcher):
             providers).
         `autoplay` : bool, defaults to False
             Auto play the video on init.
+        `streaming` : bool, defaults to False
+            Upload the frames through a
+            :class:`~kivy.graphics.texture.TextureStream` (may be not
+            supported by all providers). The :attr:`texture` changes between
+            frames, so it must be read again on each `on_frame`.
+
+            .. versionadded:: 1.8.0
 
     :Events:
         `on_eos`
@@ -47,7 +54,8 @@ class VideoBase(EventDispatcher):
     '''
 
     __slots__ = ('_wantplay', '_buffer', '_filename', '_texture',
-                 '_volume', 'eos', '_state', '_async', '_autoplay')
+                 '_volume', 'eos', '_state', '_async', '_autoplay',
+                 '_streaming')
 
     __events__ = ('on_eos', 'on_load', 'on_frame')
 
@@ -56,6 +64,7 @@ class VideoBase(EventDispatcher):
         kwargs.setdefault('eos', 'stop')
         kwargs.setdefault('async', True)
         kwargs.setdefault('autoplay', False)
+        kwargs.setdefault('streaming', False)
 
         super(VideoBase, self).__init__()
 
@@ -68,6 +77,7 @@ class VideoBase(EventDispatcher):
 
         self._autoplay = kwargs.get('autoplay')
         self._async = kwargs.get('async')
+        self._streaming = kwargs.get('streaming')
         self.eos = kwargs.get('eos')
         if self.eos == 'pause':
             Logger.warning("'pause' is deprecated. Use 'stop' instead.")
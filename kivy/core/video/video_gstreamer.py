@@ -29,7 +29,7 @@ if PY2:
     from urllib import pathname2url
 else:
     from urllib.request import pathname2url
-from kivy.graphics.texture import Texture
+from kivy.graphics.texture import Texture, TextureStream
 from kivy.logger import Logger
 from functools import partial
 from weakref import ref
@@ -70,6 +70,14 @@ def _gst_new_buffer(obj, appsink):
     obj = obj()
     if not obj:
         return
+    if obj._stream is not None:
+        # extract the frame in the gstreamer thread, the main thread will only
+        # have to upload it.
+        buf = obj._videosink.emit('pull-' + BUF_SAMPLE)
+        if buf is not None:
+            data, size = obj._get_frame(buf)
+            obj._stream.write(data, size=size)
+        return
     with obj._buffer_lock:
         obj._buffer = obj._videosink.emit('pull-' + BUF_SAMPLE)
 
@@ -96,6 +104,9 @@ class VideoGStreamer(VideoBase):
         self._buffer_lock = Lock()
         self._buffer = None
         self._texture = None
+        self._stream = None
+        if kwargs.get('streaming'):
+            self._stream = TextureStream(colorfmt='rgb', flip_vertical=True)
         self._gst_init()
         super(VideoGStreamer, self).__init__(**kwargs)
 
@@ -132,8 +143,8 @@ class VideoGStreamer(VideoBase):
         self._bus.connect('message::eos', partial(
             _on_gst_eos, ref(self)))
 
-    def _update_texture(self, buf):
-        # texture will be updated with newest buffer/frame
+    def _get_frame(self, buf):
+        # return the pixels and the size of a gstreamer buffer
         caps = buf.get_caps()
         _s = caps.get_structure(0)
         data = size = None
@@ -141,12 +152,6 @@ class VideoGStreamer(VideoBase):
             size = _s['width'], _s['height']
         else:
             size = _s.get_int('width')[1], _s.get_int('height')[1]
-        if not self._texture:
-            # texture is not allocated yet, so create it first
-            self._texture = Texture.create(size=size, colorfmt='rgb')
-            self._texture.flip_vertical()
-            self.dispatch('on_load')
-        # upload texture data to GPU
         if not PY2:
             mapinfo = None
             try:
@@ -168,10 +173,39 @@ class VideoGStreamer(VideoBase):
                     mem.unmap(mapinfo)
         else:
             data = buf.data
+        return data, size
 
+    def _update_texture(self, buf):
+        # texture will be updated with newest buffer/frame
+        data, size = self._get_frame(buf)
+        if not self._texture:
+            # texture is not allocated yet, so create it first
+            self._texture = Texture.create(size=size, colorfmt='rgb')
+            self._texture.flip_vertical()
+            self.dispatch('on_load')
+        # upload texture data to GPU
         self._texture.blit_buffer(data, size=size, colorfmt='rgb')
 
+    def _update_stream(self):
+        # the preroll pulled by seek() is not coming from the gstreamer thread
+        with self._buffer_lock:
+            buf = self._buffer
+            self._buffer = None
+        if buf is not None:
+            data, size = self._get_frame(buf)
+            self._stream.write(data, size=size)
+        if not self._stream.swap():
+            return
+        loaded = self._texture is not None
+        self._texture = self._stream.texture
+        if not loaded:
+            self.dispatch('on_load')
+        self.dispatch('on_frame')
+
     def _update(self, dt):
+        if self._stream is not None:
+            self._update_stream()
+            return
         buf = None
         with self._buffer_lock:
             buf = self._buffer
@@ -184,6 +218,8 @@ class VideoGStreamer(VideoBase):
         self._playbin.set_state(gst.STATE_NULL)
         self._buffer = None
         self._texture = None
+        if self._stream is not None:
+            self._stream.clear()
 
     def load(self):
         Logger.debug('gstreamer_video: Load <%s>' % self._filename)
@@ -163,6 +163,29 @@ class Keyboard(EventDispatcher):
         return ''
 
 
+def _union_region(a, b):
+    # union of 2 regions: None is everything, () is nothing, or (x, y, w, h)
+    if a is None or b is None:
+        return None
+    if not a:
+        return b
+    if not b:
+        return a
+    x, y = min(a[0], b[0]), min(a[1], b[1])
+    return (x, y, max(a[0] + a[2], b[0] + b[2]) - x,
+            max(a[1] + a[3], b[1] + b[3]) - y)
+
+
+def _contains_region(a, b):
+    # return True if the region a contains the region b
+    if a is None or b == ():
+        return True
+    if b is None or not a:
+        return False
+    return (a[0] <= b[0] and a[1] <= b[1] and
+            b[0] + b[2] <= a[0] + a[2] and b[1] + b[3] <= a[1] + a[3])
+
+
 class WindowBase(EventDispatcher):
     '''WindowBase is an abstract window widget for any window implementation.
 
@@ -419,6 +442,13 @@ class WindowBase(EventDispatcher):
             return
         self.initialized = False
 
+        #: Region redrawn by the last :meth:`on_draw`: None if the whole
+        #: window, or a (x, y, width, height) tuple in pixels, from the bottom
+        #: left. A window provider can use it to swap only this region.
+        #:
+        #: .. versionadded:: 1.8.0
+        self.redraw_region = None
+
         # create a trigger for update/create the window when one of window
         # property changes
         self.trigger_create_window = Clock.create_trigger(
@@ -523,6 +553,9 @@ class WindowBase(EventDispatcher):
             self.render_context = RenderContext()
             self.canvas = Canvas()
             self.render_context.add(self.canvas)
+            self.render_context.damage_tracking = Config.getboolean(
+                'graphics', 'partial_redraw')
+            self._damage_history = []
 
         else:
             # if we get initialized more than once, then reload opengl state
@@ -543,13 +576,41 @@ class WindowBase(EventDispatcher):
         self.update_viewport()
 
     def on_flip(self):
-        '''Flip between buffers (event)'''
+        '''Flip between buffers (event)
+
+        .. versionchanged:: 1.8.0
+            End the graphics statistics of the frame, see
+            :func:`~kivy.graphics.context.get_frame_stats`.
+        '''
+        from kivy.graphics.context import flip_frame_stats
         self.flip()
+        flip_frame_stats()
 
     def flip(self):
         '''Flip between buffers'''
         pass
 
+    def has_pending_events(self):
+        '''Return True if events are waiting to be read by the window. Used by
+        the power saving mode of the :class:`~kivy.base.EventLoopBase` to know
+        if it can sleep. The default implementation cannot tell, and always
+        return True.
+
+        .. versionadded:: 1.8.0
+        '''
+        return True
+
+    def get_buffer_age(self):
+        '''Return how many frames ago the content of the back buffer was
+        drawn, or 0 if it is unknown. When it is known, and the
+        `partial_redraw` token of the graphics section of the configuration is
+        set, :meth:`on_draw` redraws only the regions changed since then.
+        The default implementation returns 0.
+
+        .. versionadded:: 1.8.0
+        '''
+        return 0
+
     def _update_childsize(self, instance, value):
         self.update_childsize([instance])
 
@@ -619,8 +680,57 @@ class WindowBase(EventDispatcher):
         return None
 
     def on_draw(self):
+        '''Draw the window (event).
+
+        .. versionchanged:: 1.8.0
+            With the `partial_redraw` configuration token, only the regions
+            changed are redrawn, see
+            :attr:`~kivy.graphics.instructions.RenderContext.damage_tracking`.
+            The region redrawn is stored in :attr:`redraw_region`.
+        '''
+        rc = self.render_context
+        if not rc.damage_tracking:
+            self.clear()
+            rc.draw()
+            return
+
+        damage = rc.pop_damage()
+        # the back buffer contains the frame drawn `age` frames ago: all the
+        # regions changed since must be redrawn
+        history = self._damage_history
+        age = self.get_buffer_age()
+        region = damage
+        if age == 0 or age > len(history) + 1:
+            region = None
+        else:
+            for previous in history[len(history) + 1 - age:]:
+                region = _union_region(region, previous)
+        self._draw_region(region)
+
+        # the instructions moved or drawn for the first time are known only
+        # now, redraw the frame if they are outside of the region.
+        late = rc.pop_late_damage()
+        if not _contains_region(region, late):
+            region = _union_region(region, late)
+            self._draw_region(region)
+            rc.pop_late_damage()
+
+        history.append(_union_region(damage, late))
+        del history[:-3]
+        self.redraw_region = region
+
+    def _draw_region(self, region):
+        if region is None:
+            self.clear()
+            self.render_context.draw()
+            return
+        from kivy.graphics.opengl import glEnable, glDisable, glScissor, \
+            GL_SCISSOR_TEST
+        glEnable(GL_SCISSOR_TEST)
+        glScissor(*(region or (0, 0, 0, 0)))
         self.clear()
         self.render_context.draw()
+        glDisable(GL_SCISSOR_TEST)
 
     def on_motion(self, etype, me):
         '''Event called when a Motion Event is received.
@@ -1013,4 +1123,5 @@ Window = core_select_lib('window', (
     ('pygame', 'window_pygame', 'WindowPygame'),
     ('sdl', 'window_sdl', 'WindowSDL'),
     ('x11', 'window_x11', 'WindowX11'),
+    ('offscreen', 'window_offscreen', 'WindowOffscreen'),
 ), True)
@@ -234,6 +234,9 @@ def hide_keyboard():
 def is_keyboard_shown():
     return SDL_IsTextInputActive()
 
+def has_events():
+    return SDL_PollEvent(NULL) != 0
+
 def poll():
     cdef SDL_Event event
 
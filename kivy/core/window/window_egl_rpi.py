@@ -6,6 +6,7 @@ Inspired by: rpi_vid_core + JF002 rpi kivy  repo
 
 __all__ = ('WindowEglRpi', )
 
+from kivy.config import Config
 from kivy.logger import Logger
 from kivy.core.window import WindowBase
 from kivy.base import EventLoop
@@ -37,14 +38,11 @@ class WindowEglRpi(WindowBase):
         api = egl._constants.EGL_OPENGL_ES_API
         c = egl._constants
 
-        attribs = [
-            c.EGL_RED_SIZE, 8,
-            c.EGL_GREEN_SIZE, 8,
-            c.EGL_BLUE_SIZE, 8,
-            c.EGL_ALPHA_SIZE, 8,
-            c.EGL_DEPTH_SIZE, 16,
-            c.EGL_SURFACE_TYPE, c.EGL_WINDOW_BIT,
-            c.EGL_NONE]
+        # for the partial redraw, ask to keep the back buffer after a swap
+        surface_types = [c.EGL_WINDOW_BIT]
+        if Config.getboolean('graphics', 'partial_redraw'):
+            surface_types.insert(
+                0, c.EGL_WINDOW_BIT | c.EGL_SWAP_BEHAVIOR_PRESERVED_BIT)
 
         attribs_context = [c.EGL_CONTEXT_CLIENT_VERSION, 2, c.EGL_NONE]
 
@@ -52,8 +50,29 @@ class WindowEglRpi(WindowBase):
         egl.Initialise(display)
         egl.BindAPI(c.EGL_OPENGL_ES_API)
         egl.GetConfigs(display)
-        config = egl.ChooseConfig(display, attribs, 1)[0]
+        for surface_type in surface_types:
+            attribs = [
+                c.EGL_RED_SIZE, 8,
+                c.EGL_GREEN_SIZE, 8,
+                c.EGL_BLUE_SIZE, 8,
+                c.EGL_ALPHA_SIZE, 8,
+                c.EGL_DEPTH_SIZE, 16,
+                c.EGL_SURFACE_TYPE, surface_type,
+                c.EGL_NONE]
+            configs = egl.ChooseConfig(display, attribs, 1)
+            if configs:
+                break
+        config = configs[0]
         surface = egl.CreateWindowSurface(display, config, win)
+        self._buffer_age = 0
+        if surface_type & c.EGL_SWAP_BEHAVIOR_PRESERVED_BIT:
+            try:
+                egl.SurfaceAttrib(display, surface, c.EGL_SWAP_BEHAVIOR,
+                                  c.EGL_BUFFER_PRESERVED)
+                self._buffer_age = 1
+            except Exception:
+                Logger.warning('WinEglRpi: Unable to preserve the buffer, '
+                               'partial redraw disabled')
         context = egl.CreateContext(display, config, None, attribs_context)
         egl.MakeCurrent(display, surface, surface, context)
 
@@ -67,6 +86,13 @@ class WindowEglRpi(WindowBase):
     def flip(self):
         egl.SwapBuffers(self.egl_info[0], self.egl_info[1])
     
+    def has_pending_events(self):
+        # the input comes from the input providers only
+        return False
+
+    def get_buffer_age(self):
+        return self._buffer_age
+
     def _mainloop(self):
         EventLoop.idle()
 
@@ -0,0 +1,227 @@
+'''
+Offscreen Window: headless window provider, rendering into a framebuffer
+object with an EGL context that doesn't need any display.
+
+.. versionadded:: 1.8.0
+
+This provider is used when no other window provider can open a window, or
+when requested with::
+
+    KIVY_WINDOW=offscreen python main.py
+
+On a machine without GPU, Mesa renders with llvmpipe. The window has no input,
+and the :class:`~kivy.clock.Clock` advances of a fixed step at each frame (1 /
+`maxfps`, or 1 / 60 if `maxfps` is 0), without sleeping, so the animations and
+the frame times are reproducible. :meth:`WindowOffscreen.screenshot` saves the
+content of the framebuffer.
+'''
+
+__all__ = ('WindowOffscreen', )
+
+import ctypes
+from ctypes.util import find_library
+from kivy.config import Config
+from kivy.logger import Logger
+from kivy.core.window import WindowBase
+from kivy.base import EventLoop, ExceptionManager, stopTouchApp
+from kivy.clock import Clock
+
+_egl_name = find_library('EGL')
+if _egl_name is None:
+    raise ImportError('WinOffscreen: libEGL not found')
+_egl = ctypes.CDLL(_egl_name)
+
+EGL_DEFAULT_DISPLAY = 0
+EGL_NO_CONTEXT = 0
+EGL_NO_SURFACE = 0
+EGL_NONE = 0x3038
+EGL_ALPHA_SIZE = 0x3021
+EGL_BLUE_SIZE = 0x3022
+EGL_GREEN_SIZE = 0x3023
+EGL_RED_SIZE = 0x3024
+EGL_DEPTH_SIZE = 0x3025
+EGL_SURFACE_TYPE = 0x3033
+EGL_RENDERABLE_TYPE = 0x3040
+EGL_HEIGHT = 0x3056
+EGL_WIDTH = 0x3057
+EGL_CONTEXT_CLIENT_VERSION = 0x3098
+EGL_OPENGL_ES_API = 0x30A0
+EGL_OPENGL_API = 0x30A2
+EGL_PBUFFER_BIT = 0x0001
+EGL_OPENGL_ES2_BIT = 0x0004
+EGL_OPENGL_BIT = 0x0008
+EGL_PLATFORM_SURFACELESS_MESA = 0x31DD
+
+_egl.eglGetProcAddress.restype = ctypes.c_void_p
+_egl.eglGetProcAddress.argtypes = [ctypes.c_char_p]
+_egl.eglGetDisplay.restype = ctypes.c_void_p
+_egl.eglGetDisplay.argtypes = [ctypes.c_void_p]
+_egl.eglInitialize.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int),
+                               ctypes.POINTER(ctypes.c_int)]
+_egl.eglBindAPI.argtypes = [ctypes.c_uint]
+_egl.eglChooseConfig.argtypes = [
+    ctypes.c_void_p, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(
+        ctypes.c_void_p), ctypes.c_int, ctypes.POINTER(ctypes.c_int)]
+_egl.eglCreatePbufferSurface.restype = ctypes.c_void_p
+_egl.eglCreatePbufferSurface.argtypes = [
+    ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)]
+_egl.eglCreateContext.restype = ctypes.c_void_p
+_egl.eglCreateContext.argtypes = [
+    ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p,
+    ctypes.POINTER(ctypes.c_int)]
+_egl.eglMakeCurrent.argtypes = [ctypes.c_void_p, ctypes.c_void_p,
+                                ctypes.c_void_p, ctypes.c_void_p]
+_egl.eglDestroySurface.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+_egl.eglDestroyContext.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+_egl.eglTerminate.argtypes = [ctypes.c_void_p]
+
+
+def _attribs(*values):
+    values = values + (EGL_NONE, )
+    return (ctypes.c_int * len(values))(*values)
+
+
+def _get_display():
+    # prefer the surfaceless platform of Mesa, that never open a display
+    proc = _egl.eglGetProcAddress(b'eglGetPlatformDisplayEXT')
+    if proc:
+        get_platform_display = ctypes.CFUNCTYPE(
+            ctypes.c_void_p, ctypes.c_uint, ctypes.c_void_p,
+            ctypes.c_void_p)(proc)
+        display = get_platform_display(
+            EGL_PLATFORM_SURFACELESS_MESA, EGL_DEFAULT_DISPLAY, None)
+        if display and _egl.eglInitialize(display, None, None):
+            return display
+    display = _egl.eglGetDisplay(EGL_DEFAULT_DISPLAY)
+    if display and _egl.eglInitialize(display, None, None):
+        return display
+    return None
+
+
+def create_egl_context():
+    '''Create an EGL context and make it current. The context is bound to a
+    1x1 pbuffer if the platform supports it, or to no surface at all: the
+    rendering must be done in a framebuffer object.
+
+    Return a (display, surface, context) tuple.
+    '''
+    display = _get_display()
+    if display is None:
+        raise Exception('Unable to initialize an EGL display')
+
+    # use desktop OpenGL when available, OpenGL ES 2 otherwise
+    for api, renderable, context_attribs in (
+            (EGL_OPENGL_API, EGL_OPENGL_BIT, _attribs()),
+            (EGL_OPENGL_ES_API, EGL_OPENGL_ES2_BIT,
+             _attribs(EGL_CONTEXT_CLIENT_VERSION, 2))):
+        if not _egl.eglBindAPI(api):
+            continue
+        config = ctypes.c_void_p()
+        count = ctypes.c_int()
+        for surface_type in (EGL_PBUFFER_BIT, 0):
+            config_attribs = _attribs(
+                EGL_SURFACE_TYPE, surface_type,
+                EGL_RENDERABLE_TYPE, renderable,
+                EGL_RED_SIZE, 8, EGL_GREEN_SIZE, 8, EGL_BLUE_SIZE, 8,
+                EGL_ALPHA_SIZE, 8, EGL_DEPTH_SIZE, 16)
+            if _egl.eglChooseConfig(display, config_attribs,
+                                    ctypes.byref(config), 1,
+                                    ctypes.byref(count)) and count.value:
+                break
+        else:
+            continue
+        context = _egl.eglCreateContext(display, config, EGL_NO_CONTEXT,
+                                        context_attribs)
+        if not context:
+            continue
+        surface = EGL_NO_SURFACE
+        if surface_type:
+            surface = _egl.eglCreatePbufferSurface(
+                display, config, _attribs(EGL_WIDTH, 1, EGL_HEIGHT, 1)) or \
+                EGL_NO_SURFACE
+        if _egl.eglMakeCurrent(display, surface, surface, context):
+            return display, surface, context
+        if surface:
+            _egl.eglDestroySurface(display, surface)
+        _egl.eglDestroyContext(display, context)
+    _egl.eglTerminate(display)
+    raise Exception('Unable to create an EGL context')
+
+
+class WindowOffscreen(WindowBase):
+
+    def create_window(self):
+        if not self.initialized:
+            self._egl_info = create_egl_context()
+            self._fbo = None
+            maxfps = Config.getint('graphics', 'maxfps')
+            Clock.fixed_step = 1. / (maxfps or 60)
+        super(WindowOffscreen, self).create_window()
+
+        from kivy.graphics import Fbo
+        if self._fbo is None:
+            self._fbo = Fbo(size=self.system_size, with_depthbuffer=True)
+        else:
+            self._fbo.size = self.system_size
+
+    def close(self):
+        display, surface, context = self._egl_info
+        _egl.eglMakeCurrent(display, EGL_NO_SURFACE, EGL_NO_SURFACE,
+                            EGL_NO_CONTEXT)
+        if surface:
+            _egl.eglDestroySurface(display, surface)
+        _egl.eglDestroyContext(display, context)
+        _egl.eglTerminate(display)
+
+    def on_draw(self):
+        # there is no default framebuffer to draw into
+        fbo = self._fbo
+        fbo.bind()
+        super(WindowOffscreen, self).on_draw()
+        fbo.release()
+
+    @property
+    def texture(self):
+        '''Texture of the framebuffer where the window is drawn.
+        '''
+        return self._fbo.texture
+
+    def screenshot(self, *largs, **kwargs):
+        filename = super(WindowOffscreen, self).screenshot(*largs, **kwargs)
+        if filename is None:
+            return None
+        from kivy.core.image import ImageLoader
+        loaders = [x for x in ImageLoader.loaders if x.can_save()]
+        if not loaders:
+            Logger.warning('WinOffscreen: No image loader can save <%s>' %
+                           filename)
+            return None
+        width, height = self._fbo.size
+        pixels = self._fbo.pixels
+        # the framebuffer rows are stored from the bottom
+        stride = width * 4
+        pixels = b''.join([pixels[y:y + stride]
+                           for y in range(stride * (height - 1), -1, -stride)])
+        loaders[0].save(filename, width, height, 'rgba', pixels)
+        Logger.debug('Window: Screenshot saved at <%s>' % filename)
+        return filename
+
+    def has_pending_events(self):
+        return False
+
+    def get_buffer_age(self):
+        # the framebuffer object keeps the previous frame
+        return 1
+
+    def mainloop(self):
+        while not EventLoop.quit and EventLoop.status == 'started':
+            try:
+                EventLoop.idle()
+            except BaseException as inst:
+                # use exception manager first
+                r = ExceptionManager.handle_exception(inst)
+                if r == ExceptionManager.RAISE:
+                    stopTouchApp()
+                    raise
+                else:
+                    pass
@@ -231,6 +231,9 @@ class WindowPygame(WindowBase):
             self.flags |= pygame.FULLSCREEN
         self._pygame_set_mode()
 
+    def has_pending_events(self):
+        return pygame.event.peek()
+
     def _mainloop(self):
         EventLoop.idle()
 
@@ -110,6 +110,9 @@ class WindowSDL(WindowBase):
         sdl.flip()
         super(WindowSDL, self).flip()
 
+    def has_pending_events(self):
+        return sdl.has_events()
+
     def _mainloop(self):
         EventLoop.idle()
 
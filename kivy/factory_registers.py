@@ -97,6 +97,7 @@ r('AccordionItem', module='kivy.uix.accordion')
 r('Button', module='kivy.uix.button')
 r('Bubble', module='kivy.uix.bubble')
 r('BubbleButton', module='kivy.uix.bubble')
+r('CachedView', module='kivy.uix.cachedview')
 r('Camera', module='kivy.uix.camera')
 r('Carousel', module='kivy.uix.carousel')
 r('CodeInput', module='kivy.uix.codeinput')
@@ -26,3 +26,5 @@ cdef extern from "stdlib.h":
 cdef extern from "string.h":
     void *memcpy(void *dest, void *src, size_t n)
     void *memset(void *dest, int c, size_t len)
+    int memcmp(void *s1, void *s2, size_t n)
+    int strcmp(const_char_ptr s1, const_char_ptr s2)
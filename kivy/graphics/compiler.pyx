@@ -59,7 +59,8 @@ Note to any Kivy contributor / internal developer:
 
 include 'opcodes.pxi'
 
-from kivy.graphics.instructions cimport Instruction, RenderContext, ContextInstruction
+from kivy.graphics.instructions cimport Instruction, RenderContext, \
+    ContextInstruction, damage_set_current
 from kivy.graphics.context_instructions cimport BindTexture
 
 cdef class GraphicsCompiler:
@@ -97,6 +98,7 @@ cdef class GraphicsCompiler:
                 rc.flag_update_done()
 
                 # apply the instruction
+                damage_set_current(ci)
                 ci.apply()
 
                 # whatever happen, flag as needed (ie not ignore this one.)
@@ -140,6 +142,7 @@ cdef class GraphicsCompiler:
                     # we have potentially new childs, and them can fuck up our
                     # compilation, so reset our current cache.
                     cs_by_rc = {}
+                damage_set_current(c)
                 c.apply()
 
         if rc:
@@ -4,6 +4,18 @@ from kivy.graphics.vbo cimport VBO, VertexBatch
 from kivy.graphics.shader cimport Shader
 from kivy.graphics.fbo cimport Fbo
 
+ctypedef struct frame_stats_t:
+    long instructions
+    long instructions_ignored
+    long canvases_culled
+    long draw_calls
+    long vertices
+    long texture_binds
+    long shader_switches
+    long uniform_uploads
+    long vbo_bytes
+    long texture_bytes
+
 cdef class Context:
     cdef list observers
     cdef list observers_before
@@ -37,3 +49,4 @@ cdef class Context:
     cdef void flush(self)
 
 cpdef Context get_context()
+cdef frame_stats_t *get_frame_stats_ptr()
@@ -8,17 +8,48 @@ This class handle a register of all graphics instructions created, and the
 ability to flush and delete them.
 
 You can read more about it at :doc:`api-kivy.graphics`
+
+Frame statistics
+----------------
+
+.. versionadded:: 1.8.0
+
+The graphics instructions count what they send to OpenGL. The counters are
+reset after each frame, and :func:`get_frame_stats` returns the ones of the
+last frame drawn, as a dict:
+
+======================== ======================================================
+Key                      Description
+======================== ======================================================
+`instructions`           Instructions applied
+`instructions_ignored`   Instructions skipped by the compiler (`GI_IGNORE`)
+`canvases_culled`        Canvases skipped because they are
+                         :data:`~kivy.graphics.instructions.Canvas.culled`
+`draw_calls`             Calls to glDrawElements
+`vertices`               Vertices (indices) drawn
+`texture_binds`          Textures bound
+`shader_switches`        Changes of the current program
+`uniform_uploads`        Uniforms uploaded
+`vbo_bytes`              Bytes uploaded in vertex and index buffers
+`texture_bytes`          Bytes uploaded in textures
+======================== ======================================================
+
+It helps to know if many draw calls could be batched, or if textures are
+uploaded at each frame. The :mod:`~kivy.modules.monitor` module displays some
+of them.
 '''
 
 include "config.pxi"
 
 from cpython.array cimport array
+from libc.string cimport memset
 import gc
 from os import environ
 from weakref import ref
 from kivy.graphics.instructions cimport Canvas
 from kivy.graphics.texture cimport Texture, TextureRegion
 from kivy.graphics.vbo cimport VBO, VertexBatch
+from kivy.graphics.shader cimport reset_programs
 from kivy.logger import Logger
 from kivy.clock import Clock
 from kivy.graphics.c_opengl cimport *
@@ -29,6 +60,8 @@ IF USE_OPENGL_DEBUG == 1:
 from kivy.cache import Cache
 
 cdef Context context = None
+cdef frame_stats_t g_frame_stats
+cdef frame_stats_t g_last_frame_stats
 
 cdef class Context:
 
@@ -94,13 +127,8 @@ cdef class Context:
             self.trigger_gl_dealloc()
 
     cdef void dealloc_shader(self, Shader shader):
-        if shader.program == -1:
-            return
-        if shader.vertex_shader is not None:
-            glDetachShader(shader.program, shader.vertex_shader.shader)
-        if shader.fragment_shader is not None:
-            glDetachShader(shader.program, shader.fragment_shader.shader)
-        glDeleteProgram(shader.program)
+        # the program might be shared with other shaders
+        shader.release_program()
 
     cdef void dealloc_fbo(self, Fbo fbo):
         cdef array arr_fb
@@ -234,6 +262,7 @@ cdef class Context:
                 Logger.trace('Context: reloaded %r' % item())
                 batch.reload()
         Logger.debug('Context: Reload shaders')
+        reset_programs()
         for item in self.l_shader[:]:
             shader = item()
             if shader is not None:
@@ -299,3 +328,28 @@ cpdef Context get_context():
         context = Context()
     return context
 
+
+
+cdef frame_stats_t *get_frame_stats_ptr():
+    return &g_frame_stats
+
+
+def get_frame_stats():
+    '''Return the graphics statistics of the last frame, as a dict. See
+    `Frame statistics`_.
+
+    .. versionadded:: 1.8.0
+    '''
+    return g_last_frame_stats
+
+
+def flip_frame_stats():
+    '''End the statistics of the current frame: they are returned by
+    :func:`get_frame_stats` until the next call, and the counters are reset.
+    Called by the :class:`~kivy.core.window.WindowBase` after each flip.
+
+    .. versionadded:: 1.8.0
+    '''
+    global g_last_frame_stats
+    g_last_frame_stats = g_frame_stats
+    memset(&g_frame_stats, 0, sizeof(frame_stats_t))
@@ -13,6 +13,7 @@ cdef class Fbo(RenderContext):
     cdef GLint _viewport[4]
     cdef Texture _texture
     cdef int _is_bound
+    cdef GLboolean _scissor_enabled
     cdef list observers
 
     cpdef clear_buffer(self)
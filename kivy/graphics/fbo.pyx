@@ -255,6 +255,11 @@ cdef class Fbo(RenderContext):
         fbo_stack.append(self.buffer_id)
         glBindFramebuffer(GL_FRAMEBUFFER, self.buffer_id)
 
+        # the scissor of a partial redraw of the window must not clip us
+        self._scissor_enabled = glIsEnabled(GL_SCISSOR_TEST)
+        if self._scissor_enabled:
+            glDisable(GL_SCISSOR_TEST)
+
         # if asked, push the viewport
         if self._push_viewport:
             glGetIntegerv(GL_VIEWPORT, <GLint *>self._viewport)
@@ -271,6 +276,8 @@ cdef class Fbo(RenderContext):
         # bind the latest fbo, or unbind it.
         fbo_stack.pop()
         glBindFramebuffer(GL_FRAMEBUFFER, fbo_stack[-1])
+        if self._scissor_enabled:
+            glEnable(GL_SCISSOR_TEST)
 
         # if asked, restore the viewport
         if self._push_viewport:
@@ -14,6 +14,7 @@ from texture cimport Texture
 from kivy._event cimport ObjectWithUid
 
 cdef void reset_gl_context()
+cdef void damage_set_current(Instruction instruction)
 
 cdef class Instruction
 cdef class InstructionGroup(Instruction)
@@ -24,9 +25,13 @@ cdef class Instruction(ObjectWithUid):
     cdef InstructionGroup parent
     cdef object __weakref__
     cdef object __proxy_ref
+    cdef float _damage_box[4]
+    cdef int _damage_frame
 
     cdef void apply(self)
     cdef void flag_update(self, int do_parent=?)
+    cdef void flag_child_update(self)
+    cdef void flag_damage(self)
     cdef void flag_update_done(self)
     cdef void set_parent(self, Instruction parent)
     cdef void reload(self)
@@ -57,6 +62,7 @@ cdef class ContextInstruction(Instruction):
     cdef void set_state(self, str name, value) except *
     cdef void push_state(self, str name) except *
     cdef void pop_state(self, str name) except *
+    cdef void flag_damage(self)
 
 cdef class VertexInstruction(Instruction):
     cdef BindTexture texture_binding
@@ -68,6 +74,8 @@ cdef class VertexInstruction(Instruction):
     cdef void rremove(self, InstructionGroup ig)
 
     cdef void build(self)
+    cdef void flag_damage(self)
+    cdef void track_damage(self)
 
 cdef class Callback(Instruction):
     cdef Shader _shader
@@ -85,6 +93,7 @@ cdef class CanvasBase(InstructionGroup):
 
 cdef class Canvas(CanvasBase):
     cdef float _opacity
+    cdef int _culled
     cdef CanvasBase _before
     cdef CanvasBase _after
     cdef void reload(self)
@@ -115,6 +124,7 @@ cdef class RenderContext(Canvas):
     cdef void leave(self) except *
     cdef void apply(self) except *
     cpdef draw(self)
+    cdef void flag_child_update(self)
     cdef void reload(self)
 
 cdef RenderContext getActiveContext()
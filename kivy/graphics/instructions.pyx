@@ -20,7 +20,8 @@ IF USE_OPENGL_DEBUG == 1:
     from c_opengl_debug cimport *
 from kivy.compat import PY2
 from kivy.logger import Logger
-from kivy.graphics.context cimport get_context, Context
+from kivy.graphics.context cimport get_context, Context, frame_stats_t, \
+    get_frame_stats_ptr
 from weakref import proxy
 
 
@@ -28,6 +29,94 @@ cdef int _need_reset_gl = 1
 cdef int _active_texture = -1
 cdef list canvas_list = []
 
+# counters of the current frame, see kivy.graphics.context
+cdef frame_stats_t *stats = get_frame_stats_ptr()
+
+# damage tracking, see RenderContext.damage_tracking.
+cdef struct damage_t:
+    int state
+    float x1, y1, x2, y2
+
+cdef enum:
+    DAMAGE_NONE = 0
+    DAMAGE_RECT = 1
+    DAMAGE_FULL = 2
+
+# render context tracked, and number of render contexts being drawn. The
+# flag_update() done while drawing are not damages.
+cdef RenderContext _damage_context = None
+cdef int _draw_depth = 0
+# 1 while the tracked render context applies its own instructions
+cdef int _damage_drawing = 0
+# index of the last frame drawn by the tracked render context
+cdef int _damage_frame = 0
+# regions to redraw: reported by the instructions flagged for update since the
+# last frame, and found while drawing (moved or new instructions)
+cdef damage_t _damage
+cdef damage_t _late_damage
+# instruction being applied, and instructions that set the current value of
+# each state: a vertex instruction drawn is added to their damage box.
+cdef Instruction _damage_current = None
+cdef dict _damage_owners = {}
+cdef dict _damage_stacks = {}
+# projection * modelview matrix and viewport, to get window coordinates
+cdef int _damage_mvp_valid = 0
+cdef double _damage_mvp[16]
+cdef GLint _damage_viewport[4]
+
+
+cdef void damage_add(damage_t *damage, float *box):
+    # add the box (x1, y1, x2, y2) to the damage. An empty box has x1 > x2.
+    if damage.state == DAMAGE_FULL or box[0] > box[2]:
+        return
+    if damage.state == DAMAGE_NONE:
+        damage.state = DAMAGE_RECT
+        damage.x1, damage.y1, damage.x2, damage.y2 = \
+            box[0], box[1], box[2], box[3]
+        return
+    damage.x1 = min(damage.x1, box[0])
+    damage.y1 = min(damage.y1, box[1])
+    damage.x2 = max(damage.x2, box[2])
+    damage.y2 = max(damage.y2, box[3])
+
+
+cdef void damage_add_box(float *dst, float *box):
+    # extend the box dst with box
+    if box[0] > box[2]:
+        return
+    if dst[0] > dst[2]:
+        dst[0], dst[1], dst[2], dst[3] = box[0], box[1], box[2], box[3]
+        return
+    dst[0] = min(dst[0], box[0])
+    dst[1] = min(dst[1], box[1])
+    dst[2] = max(dst[2], box[2])
+    dst[3] = max(dst[3], box[3])
+
+
+cdef inline void damage_full(damage_t *damage):
+    damage.state = DAMAGE_FULL
+
+
+cdef object damage_pop(damage_t *damage):
+    # return the damage as None (everything), () (nothing) or a (x, y, width,
+    # height) rectangle in pixels, and reset it.
+    cdef int x, y
+    cdef int state = damage.state
+    damage.state = DAMAGE_NONE
+    if state == DAMAGE_FULL:
+        return None
+    elif state == DAMAGE_NONE:
+        return ()
+    x = <int>damage.x1
+    y = <int>damage.y1
+    return (x, y, <int>damage.x2 + 1 - x, <int>damage.y2 + 1 - y)
+
+
+cdef void damage_set_current(Instruction instruction):
+    global _damage_current
+    if _damage_drawing:
+        _damage_current = instruction
+
 cdef void reset_gl_context():
     global _need_reset_gl, _active_texture
     _need_reset_gl = 0
@@ -47,6 +136,7 @@ cdef class Instruction(ObjectWithUid):
         self.__proxy_ref = None
         self.flags = 0
         self.parent = None
+        self._damage_frame = -1
 
     def __init__(self, **kwargs):
         self.group = kwargs.get('group', None)
@@ -61,10 +151,24 @@ cdef class Instruction(ObjectWithUid):
         pass
 
     cdef void flag_update(self, int do_parent=1):
-        if do_parent == 1 and self.parent is not None:
-            self.parent.flag_update()
+        if do_parent == 1:
+            if _damage_context is not None and _draw_depth == 0:
+                self.flag_damage()
+            if self.parent is not None:
+                self.parent.flag_child_update()
         self.flags |= GI_NEEDS_UPDATE
 
+    cdef void flag_child_update(self):
+        # one of our children have been updated
+        if self.parent is not None:
+            self.parent.flag_child_update()
+        self.flags |= GI_NEEDS_UPDATE
+
+    cdef void flag_damage(self):
+        # report the region of the window that must be redrawn because this
+        # instruction changed. By default, we don't know.
+        damage_full(&_damage)
+
     cdef void flag_update_done(self):
         self.flags &= ~GI_NEEDS_UPDATE
 
@@ -124,6 +228,7 @@ cdef class InstructionGroup(Instruction):
             self.compiler = GraphicsCompiler()
 
     cdef void apply(self):
+        global _damage_current
         cdef Instruction c
         cdef list children
         if self.compiler is not None:
@@ -133,11 +238,18 @@ cdef class InstructionGroup(Instruction):
                 children = self.compiled_children.children
                 for c in children:
                     if c.flags & GI_IGNORE:
+                        stats.instructions_ignored += 1
                         continue
+                    stats.instructions += 1
+                    if _damage_drawing:
+                        _damage_current = c
                     c.apply()
             self.flags &= ~GI_NO_APPLY_ONCE
         else:
             for c in self.children:
+                stats.instructions += 1
+                if _damage_drawing:
+                    _damage_current = c
                 c.apply()
 
     cdef void build(self):
@@ -244,6 +356,14 @@ cdef class ContextInstruction(Instruction):
         self.context_pop.append(name)
         self.flag_update()
 
+    cdef void flag_damage(self):
+        # the instructions drawn with our states during the last frame must be
+        # redrawn. If we were not applied, we don't know them.
+        if self._damage_frame != _damage_frame:
+            damage_full(&_damage)
+        else:
+            damage_add(&_damage, self._damage_box)
+
 
 cdef class VertexInstruction(Instruction):
     '''The VertexInstruction class is the base for all graphics instructions
@@ -381,8 +501,38 @@ cdef class VertexInstruction(Instruction):
         if self.flags & GI_NEEDS_UPDATE:
             self.build()
             self.flag_update_done()
+        if _damage_drawing:
+            self.track_damage()
         self.batch.draw()
 
+    cdef void flag_damage(self):
+        # our previous area must be redrawn. The new one will be known when
+        # drawn.
+        if self._damage_frame == _damage_frame:
+            damage_add(&_damage, self._damage_box)
+
+    cdef void track_damage(self):
+        cdef float box[4]
+        cdef Instruction owner
+        damage_window_box(self.batch, box)
+        # moved, resized, or not drawn in the previous frame
+        if self._damage_frame != _damage_frame - 1:
+            damage_add(&_late_damage, box)
+        elif box[0] != self._damage_box[0] or box[1] != self._damage_box[1] \
+                or box[2] != self._damage_box[2] or \
+                box[3] != self._damage_box[3]:
+            damage_add(&_late_damage, self._damage_box)
+            damage_add(&_late_damage, box)
+        self._damage_frame = _damage_frame
+        self._damage_box[0] = box[0]
+        self._damage_box[1] = box[1]
+        self._damage_box[2] = box[2]
+        self._damage_box[3] = box[3]
+        # we are drawn with the states set by the owners
+        for owner in _damage_owners.itervalues():
+            if owner is not None:
+                damage_add_box(owner._damage_box, box)
+
 
 cdef class Callback(Instruction):
     '''.. versionadded:: 1.0.4
@@ -448,6 +598,7 @@ cdef class Callback(Instruction):
         cdef Context ctx
         cdef Shader shader
         cdef int i
+        cdef GLboolean scissor
 
         glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
         glBindBuffer(GL_ARRAY_BUFFER, 0)
@@ -456,6 +607,8 @@ cdef class Callback(Instruction):
             self.flag_update_done()
 
         if self._reset_context:
+            # the scissor may be used by the window for a partial redraw
+            scissor = glIsEnabled(GL_SCISSOR_TEST)
             # FIXME do that in a proper way
             glDisable(GL_DEPTH_TEST)
             glDisable(GL_CULL_FACE)
@@ -489,6 +642,8 @@ cdef class Callback(Instruction):
                 rcx.set_texture(index, texture)
 
             reset_gl_context()
+            if scissor:
+                glEnable(GL_SCISSOR_TEST)
 
     cdef void enter(self):
         self._shader.use()
@@ -540,6 +695,7 @@ cdef class Canvas(CanvasBase):
         get_context().register_canvas(self)
         CanvasBase.__init__(self, **kwargs)
         self._opacity = kwargs.get('opacity', 1.0)
+        self._culled = 0
         self._before = None
         self._after = None
 
@@ -575,6 +731,9 @@ cdef class Canvas(CanvasBase):
         cdef float opacity = self._opacity
         cdef float rc_opacity
         cdef RenderContext rc
+        if self._culled:
+            stats.canvases_culled += 1
+            return
         if opacity != 1.0:
             rc = getActiveContext()
             rc_opacity = rc['opacity']
@@ -664,6 +823,32 @@ cdef class Canvas(CanvasBase):
             self._opacity = value
             self.flag_update()
 
+    property culled:
+        '''If True, the canvas and all its children, including the
+        :data:`before` and :data:`after` groups, are not drawn at all.
+
+        .. versionadded:: 1.8.0
+
+        This is used by the :class:`~kivy.uix.stencilview.StencilView` to skip
+        the widgets that are outside of its bounding box.
+
+        .. warning::
+
+            The context instructions of a culled canvas are not applied
+            either. If the next instructions depend on a
+            :class:`~kivy.graphics.context_instructions.Color` or a
+            transformation set in the canvas without restoring it, they will
+            be drawn differently.
+        '''
+        def __get__(self):
+            return bool(self._culled)
+        def __set__(self, value):
+            value = int(bool(value))
+            if value == self._culled:
+                return
+            self._culled = value
+            self.flag_update()
+
 # Active Canvas and getActiveCanvas function is used
 # by instructions, so they know which canvas to add
 # tehmselves to
@@ -699,6 +884,94 @@ from kivy.cache import Cache
 from kivy.core.image import Image
 from kivy.graphics.transformation cimport Matrix
 
+
+cdef void damage_update_mvp():
+    # compute projection * modelview of the tracked render context
+    global _damage_mvp_valid
+    cdef Matrix p = _damage_context.get_state('projection_mat')
+    cdef Matrix mv = _damage_context.get_state('modelview_mat')
+    cdef int i, j, k
+    cdef double v
+    for j in range(4):
+        for i in range(4):
+            v = 0
+            for k in range(4):
+                v += p.mat[k * 4 + i] * mv.mat[j * 4 + k]
+            _damage_mvp[j * 4 + i] = v
+    _damage_mvp_valid = 1
+
+
+cdef void damage_window_box(VertexBatch batch, float *box):
+    # compute the bounding box of the batch in window coordinates. When it
+    # cannot be computed, use the whole viewport.
+    cdef double *m = _damage_mvp
+    cdef double x, y, w, wx, wy
+    cdef int i
+    if batch.bbox_state == BBOX_EMPTY:
+        box[0] = box[1] = 1
+        box[2] = box[3] = 0
+        return
+    if batch.bbox_state == BBOX_VALID:
+        if not _damage_mvp_valid:
+            damage_update_mvp()
+        for i in range(4):
+            x = batch.bbox[(i & 1) * 2]
+            y = batch.bbox[1 + (i & 2)]
+            w = m[3] * x + m[7] * y + m[15]
+            if w <= 0:
+                break
+            wx = _damage_viewport[0] + _damage_viewport[2] * .5 * (
+                1. + (m[0] * x + m[4] * y + m[12]) / w)
+            wy = _damage_viewport[1] + _damage_viewport[3] * .5 * (
+                1. + (m[1] * x + m[5] * y + m[13]) / w)
+            if i == 0:
+                box[0] = box[2] = wx
+                box[1] = box[3] = wy
+            else:
+                box[0] = min(box[0], wx)
+                box[1] = min(box[1], wy)
+                box[2] = max(box[2], wx)
+                box[3] = max(box[3], wy)
+        else:
+            # margin for the antialiasing and the rounding
+            box[0] -= 2
+            box[1] -= 2
+            box[2] += 2
+            box[3] += 2
+            return
+    box[0] = _damage_viewport[0]
+    box[1] = _damage_viewport[1]
+    box[2] = _damage_viewport[0] + _damage_viewport[2]
+    box[3] = _damage_viewport[1] + _damage_viewport[3]
+
+
+cdef void damage_set_owner(str name):
+    # the instruction being applied sets the value of the state
+    global _damage_mvp_valid
+    cdef Instruction owner = _damage_current
+    if name == 'modelview_mat' or name == 'projection_mat':
+        _damage_mvp_valid = 0
+    if owner is not None and owner._damage_frame != _damage_frame:
+        owner._damage_frame = _damage_frame
+        owner._damage_box[0] = owner._damage_box[1] = 1
+        owner._damage_box[2] = owner._damage_box[3] = 0
+    _damage_owners[name] = owner
+
+
+cdef void damage_push_owner(str name):
+    cdef list stack = _damage_stacks.get(name)
+    if stack is None:
+        stack = _damage_stacks[name] = []
+    stack.append(_damage_owners.get(name))
+
+
+cdef void damage_pop_owner(str name):
+    global _damage_mvp_valid
+    cdef list stack = _damage_stacks.get(name)
+    _damage_owners[name] = stack.pop() if stack else None
+    if name == 'modelview_mat' or name == 'projection_mat':
+        _damage_mvp_valid = 0
+
 cdef class RenderContext(Canvas):
     '''The render context stores all the necessary information for drawing, i.e.:
 
@@ -756,6 +1029,8 @@ cdef class RenderContext(Canvas):
                 d[-1] = value
                 self.flag_update()
         self._shader.set_uniform(name, value)
+        if _damage_drawing and self is _damage_context:
+            damage_set_owner(name)
 
     cdef get_state(self, str name):
         return self.state_stacks[name][-1]
@@ -769,6 +1044,8 @@ cdef class RenderContext(Canvas):
         stack = self.state_stacks[name]
         stack.append(stack[-1])
         self.flag_update()
+        if _damage_drawing and self is _damage_context:
+            damage_push_owner(name)
 
     cdef void push_states(self, list names):
         cdef str name
@@ -781,6 +1058,8 @@ cdef class RenderContext(Canvas):
         if oldvalue != stack[-1]:
             self.set_state(name, stack[-1])
             self.flag_update()
+        if _damage_drawing and self is _damage_context:
+            damage_pop_owner(name)
 
     cdef void pop_states(self, list names):
         cdef str name
@@ -801,6 +1080,8 @@ cdef class RenderContext(Canvas):
             glActiveTexture(GL_TEXTURE0 + index)
         texture.bind()
         self.flag_update()
+        if _damage_drawing and self is _damage_context:
+            damage_set_owner('texture%d' % index)
 
     cdef void enter(self):
         self._shader.use()
@@ -809,6 +1090,9 @@ cdef class RenderContext(Canvas):
         self._shader.stop()
 
     cdef void apply(self):
+        global _draw_depth, _damage_drawing, _damage_frame, _damage_owners, \
+            _damage_stacks, _damage_mvp_valid, _damage_current
+        cdef int damage_paused = 0
         cdef list keys
         if PY2:
             keys = self.state_stacks.keys()
@@ -825,12 +1109,48 @@ cdef class RenderContext(Canvas):
         pushActiveContext(self)
         if _need_reset_gl:
             reset_gl_context()
-        self.push_states(keys)
-        Canvas.apply(self)
-        self.pop_states(keys)
+        _draw_depth += 1
+        if self is _damage_context:
+            _damage_frame += 1
+            _damage_owners = {}
+            _damage_stacks = {}
+            _damage_mvp_valid = 0
+            _damage_current = None
+            glGetIntegerv(GL_VIEWPORT, _damage_viewport)
+            _damage_drawing = 1
+        elif _damage_drawing:
+            # we are drawn in another framebuffer, or with another shader
+            damage_paused = 1
+            _damage_drawing = 0
+        try:
+            self.push_states(keys)
+            Canvas.apply(self)
+            self.pop_states(keys)
+        finally:
+            if self is _damage_context:
+                _damage_drawing = 0
+                _damage_current = None
+            elif damage_paused:
+                _damage_drawing = 1
+            _draw_depth -= 1
         popActiveContext()
         self.flag_update_done()
 
+    cpdef draw(self):
+        # a render context drawn by hand can change the content of a texture
+        # displayed by the tracked one.
+        if _damage_context is not None and _draw_depth == 0 and \
+                self is not _damage_context:
+            damage_full(&_damage)
+        self.apply()
+
+    cdef void flag_child_update(self):
+        # the changes drawn in another render context cannot be located
+        if _damage_context is not None and _draw_depth == 0 and \
+                self is not _damage_context:
+            damage_full(&_damage)
+        Instruction.flag_child_update(self)
+
     cdef void reload(self):
         pushActiveContext(self)
         reset_gl_context()
@@ -843,6 +1163,52 @@ cdef class RenderContext(Canvas):
     def __getitem__(self, key):
         return self._shader.uniform_values[key]
 
+    property damage_tracking:
+        '''If True, the render context tracks the regions of the window
+        changed since the last frame, see :meth:`pop_damage`. Only one render
+        context can track them, usually the one of the
+        :class:`~kivy.core.window.Window`.
+
+        .. versionadded:: 1.8.0
+        '''
+        def __get__(self):
+            return self is _damage_context
+        def __set__(self, value):
+            global _damage_context
+            if value:
+                _damage_context = self
+                damage_full(&_damage)
+            elif self is _damage_context:
+                _damage_context = None
+
+    def pop_damage(self):
+        '''Return the region to redraw because of the instructions updated
+        since the last call, and reset it. The region is `None` if the whole
+        context must be redrawn, an empty tuple if nothing changed, or a
+        (x, y, width, height) tuple in pixels, in the OpenGL viewport
+        coordinates.
+
+        The region is known before drawing for the
+        :class:`VertexInstruction` updated, from their previous position, and
+        for the :class:`ContextInstruction` updated, from the instructions
+        drawn with them during the last frame. The other changes, like adding
+        an instruction or updating a group, need a full redraw.
+
+        .. versionadded:: 1.8.0
+        '''
+        return damage_pop(&_damage)
+
+    def pop_late_damage(self):
+        '''Return the region found damaged while drawing: the new position of
+        the vertex instructions that moved, and the instructions drawn for the
+        first time. The format is the same as :meth:`pop_damage`. If the
+        region was not included in the region redrawn, the frame must be
+        redrawn with it.
+
+        .. versionadded:: 1.8.0
+        '''
+        return damage_pop(&_late_damage)
+
     property shader:
         '''Return the shader attached to the render context.
         '''
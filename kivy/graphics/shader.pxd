@@ -1,5 +1,5 @@
 from c_opengl cimport GLuint
-from transformation cimport Matrix
+from transformation cimport Matrix, matrix_t
 from vertex cimport VertexFormat
 
 cdef class ShaderSource:
@@ -23,6 +23,9 @@ cdef class Shader:
     cdef object frag_src
     cdef dict uniform_locations
     cdef dict uniform_values
+    cdef dict _matrix_snapshots
+    cdef set _dirty_uniforms
+    cdef list _program_entry
 
     cdef void use(self)
     cdef void stop(self)
@@ -34,9 +37,12 @@ cdef class Shader:
     cdef void build_vertex(self, int link=*) except *
     cdef void build_fragment(self, int link=*) except *
     cdef void link_program(self) except *
+    cdef void release_program(self)
     cdef int is_linked(self)
     cdef ShaderSource compile_shader(self, str source, int shadertype)
     cdef get_program_log(self, shader)
     cdef void process_message(self, str ctype, message)
     cdef void reload(self)
     cdef void bind_vertex_format(self, VertexFormat vertex_format)
+
+cdef void reset_programs()
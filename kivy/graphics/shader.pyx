@@ -55,6 +55,38 @@ contain sections identified by a line starting with '---vertex' and
 
 The source property of the Shader should be set tpo the filename of a glsl
 shader file (of the above format), like e.g. `phong.glsl`
+
+
+Uniform upload
+--------------
+
+.. versionchanged:: 1.8.0
+
+A uniform is uploaded only when its value changes. If the program of the shader
+is not in use at that time, the upload is delayed until the next
+:meth:`Shader.use`, instead of uploading every uniform each time the program is
+used. Matrices are compared by value, so a
+:class:`~kivy.graphics.transformation.Matrix` modified in place is uploaded
+again.
+
+.. note::
+
+    If a :class:`~kivy.graphics.instructions.Callback` changes the current
+    program, it must use `reset_context=True`.
+
+Uniform blocks are not available in OpenGL ES 2.0, and are not supported.
+
+
+Program sharing
+---------------
+
+.. versionadded:: 1.8.0
+
+All the shaders with the same vertex and fragment sources share the same
+OpenGL program: the program is linked only once, by the first shader, and
+deleted when no shader use it anymore. Each shader still have its own uniform
+values. The program remembers the values uploaded into it, so when it is used
+by another shader, only the uniforms with a different value are uploaded.
 '''
 
 __all__ = ('Shader', )
@@ -67,13 +99,60 @@ from kivy.graphics.c_opengl cimport *
 IF USE_OPENGL_DEBUG == 1:
     from kivy.graphics.c_opengl_debug cimport *
 from kivy.graphics.vertex cimport vertex_attr_t
-from kivy.graphics.transformation cimport Matrix
-from kivy.graphics.context cimport get_context
+from kivy.graphics.transformation cimport Matrix, matrix_t
+from kivy.graphics.context cimport get_context, frame_stats_t, \
+    get_frame_stats_ptr
 from kivy.logger import Logger
 from kivy.cache import Cache
 from kivy import kivy_shader_dir
 
 
+# program currently in use, to know if a uniform can be uploaded right now
+cdef int _active_program = 0
+
+# counters of the current frame, see kivy.graphics.context
+cdef frame_stats_t *stats = get_frame_stats_ptr()
+
+# programs shared by the shaders having the same sources. the key is the
+# (vertex source, fragment source) tuple, the value is a list with the program
+# id, the number of shaders using it, the id() of the shader that uploaded
+# its uniforms last, and the dict of the values uploaded into the program.
+cdef dict _programs = {}
+
+
+cdef void store_uniform_value(dict values, str name, value):
+    # keep a copy of a value uploaded into a program. matrices and lists can
+    # be modified in place.
+    cdef Matrix copy
+    if type(value) is Matrix:
+        old = values.get(name)
+        if type(old) is Matrix:
+            copy = old
+        else:
+            copy = Matrix()
+            values[name] = copy
+        memcpy(copy.mat, (<Matrix>value).mat, sizeof(matrix_t))
+    elif type(value) is list:
+        values[name] = list(value)
+    else:
+        values[name] = value
+
+
+cdef int is_uniform_value_changed(dict values, str name, value):
+    # return 1 if the value is different from the one in the program
+    old = values.get(name)
+    if old is None or type(old) is not type(value):
+        return 1
+    if type(value) is Matrix:
+        return memcmp((<Matrix>old).mat, (<Matrix>value).mat,
+                      sizeof(matrix_t)) != 0
+    return old != value
+
+
+cdef void reset_programs():
+    # the programs are lost with the gl context, don't delete them.
+    _programs.clear()
+
 cdef str header_vs = ''
 cdef str header_fs = ''
 cdef str default_vs = ''
@@ -163,10 +242,11 @@ cdef class Shader:
         self.fragment_shader = None
         self.uniform_locations = dict()
         self.uniform_values = dict()
+        self._matrix_snapshots = dict()
+        self._dirty_uniforms = set()
 
     def __init__(self, str vs=None, str fs=None, str source=None):
         get_context().register_shader(self)
-        self.program = glCreateProgram()
         if source:
             self.source = source
         else:
@@ -181,23 +261,47 @@ cdef class Shader:
         # Note that we don't free previous created shaders. The current reload
         # is called only when the gl context is reseted. If we do it, we might
         # free newly created shaders (id collision)
+        global _active_program
         glUseProgram(0)
+        _active_program = 0
         self.vertex_shader = None
         self.fragment_shader = None
         #self.uniform_values = dict()
         self.uniform_locations = dict()
         self._success = 0
         self._current_vertex_format = None
-        self.program = glCreateProgram()
+        self.program = -1
+        self._program_entry = None
         self.fs = self.fs
         self.vs = self.vs
 
     cdef void use(self):
         '''Use the shader
         '''
+        global _active_program
+        cdef str name
+        cdef dict program_values
+        cdef list entry = self._program_entry
+        if entry is None:
+            glUseProgram(0)
+            _active_program = 0
+            return
+        if _active_program != self.program:
+            stats.shader_switches += 1
         glUseProgram(self.program)
-        for k, v in self.uniform_values.iteritems():
-            self.upload_uniform(k, v)
+        _active_program = self.program
+        if entry[2] != id(self):
+            # the program is shared, and another shader uploaded its values
+            entry[2] = id(self)
+            self._dirty_uniforms.update(self.uniform_values)
+        if self._dirty_uniforms:
+            # skip the values already in the program
+            program_values = entry[3]
+            for name in self._dirty_uniforms:
+                value = self.uniform_values[name]
+                if is_uniform_value_changed(program_values, name, value):
+                    self.upload_uniform(name, value)
+            self._dirty_uniforms.clear()
         IF USE_GLEW == 1:
             # XXX Very very weird bug. On virtualbox / win7 / glew, if we don't call
             # glFlush or glFinish or glGetIntegerv(GL_CURRENT_PROGRAM, ...), it seem
@@ -212,13 +316,33 @@ cdef class Shader:
     cdef void stop(self):
         '''Stop using the shader
         '''
+        global _active_program
         glUseProgram(0)
+        _active_program = 0
 
     cdef void set_uniform(self, str name, value):
-        if name in self.uniform_values and self.uniform_values[name] == value:
+        cdef Matrix snapshot
+        if type(value) is Matrix:
+            # matrices are often modified in place: compare the values with a
+            # copy of the last matrix set.
+            snapshot = self._matrix_snapshots.get(name)
+            if snapshot is None:
+                snapshot = Matrix()
+                self._matrix_snapshots[name] = snapshot
+            elif memcmp(snapshot.mat, (<Matrix>value).mat,
+                        sizeof(matrix_t)) == 0:
+                self.uniform_values[name] = value
+                return
+            memcpy(snapshot.mat, (<Matrix>value).mat, sizeof(matrix_t))
+        elif name in self.uniform_values and \
+                self.uniform_values[name] == value:
             return
         self.uniform_values[name] = value
-        self.upload_uniform(name, value)
+        if _active_program == self.program and \
+                self._program_entry[2] == id(self):
+            self.upload_uniform(name, value)
+        else:
+            self._dirty_uniforms.add(name)
 
     cdef void upload_uniform(self, str name, value):
         '''Pass a uniform variable to the shader
@@ -229,14 +353,18 @@ cdef class Shader:
         cdef tuple tuple_value
         cdef list list_value
         val_type = type(value)
-        loc = self.uniform_locations.get(name, -1)
-        if loc == -1:
+        if self._program_entry is not None:
+            store_uniform_value(self._program_entry[3], name, value)
+        if name in self.uniform_locations:
+            loc = self.uniform_locations[name]
+        else:
             loc = self.get_uniform_loc(name)
 
         #Logger.debug('Shader: uploading uniform %s (loc=%d, value=%r)' % (name, loc, value))
         if loc == -1:
             #Logger.debug('Shader: -> ignored')
             return
+        stats.uniform_uploads += 1
         #Logger.debug('Shader: -> (gl:%d) %s' % (glGetError(), str(value)))
 
         if val_type is Matrix:
@@ -298,8 +426,9 @@ cdef class Shader:
 
     cdef void upload_uniform_matrix(self, int loc, Matrix value):
         cdef GLfloat mat[16]
-        for x in xrange(16):
-            mat[x] = <GLfloat>value.mat[x]
+        cdef int i
+        for i in range(16):
+            mat[i] = <GLfloat>value.mat[i]
         glUniformMatrix4fv(loc, 1, False, mat)
 
     cdef int get_uniform_loc(self, str name):
@@ -346,43 +475,78 @@ cdef class Shader:
         self.build_fragment()
 
     cdef void build_vertex(self, int link=1):
-        if self.vertex_shader is not None:
-            glDetachShader(self.program, self.vertex_shader.shader)
-            self.vertex_shader = None
         self.vertex_shader = self.compile_shader(self.vert_src, GL_VERTEX_SHADER)
-        if self.vertex_shader is not None:
-            glAttachShader(self.program, self.vertex_shader.shader)
         if link:
             self.link_program()
 
     cdef void build_fragment(self, int link=1):
-        if self.fragment_shader is not None:
-            glDetachShader(self.program, self.fragment_shader.shader)
-            self.fragment_shader = None
         self.fragment_shader = self.compile_shader(self.frag_src, GL_FRAGMENT_SHADER)
-        if self.fragment_shader is not None:
-            glAttachShader(self.program, self.fragment_shader.shader)
         if link:
             self.link_program()
 
     cdef void link_program(self):
+        cdef GLuint program
+        cdef list entry
         if self.vertex_shader is None or self.fragment_shader is None:
             return
 
+        key = (self.vert_src, self.frag_src)
+        entry = self._program_entry
+        if entry is not None and _programs.get(key) is entry:
+            return
+        self.release_program()
+        self.uniform_locations = dict()
+        # a new program have all its uniforms reset
+        self._dirty_uniforms.update(self.uniform_values)
+
+        # reuse the program of another shader with the same sources
+        entry = _programs.get(key)
+        if entry is not None:
+            entry[1] += 1
+            self._program_entry = entry
+            self.program = entry[0]
+            self._success = 1
+            return
+
         # XXX to ensure that shader is ok, read error state right now.
         glGetError()
 
-        glLinkProgram(self.program)
-        self.process_message('program', self.get_program_log(self.program))
-        self.uniform_locations = dict()
+        program = glCreateProgram()
+        glAttachShader(program, self.vertex_shader.shader)
+        glAttachShader(program, self.fragment_shader.shader)
+        glLinkProgram(program)
+        self.process_message('program', self.get_program_log(program))
         error = glGetError()
         if error:
             Logger.error('Shader: GL error %d' % error)
+        self.program = program
         if not self.is_linked():
             self._success = 0
+            self.program = -1
+            glDeleteProgram(program)
             raise Exception('Shader didnt link, check info log.')
+        self._program_entry = entry = [program, 1, 0, {}]
+        _programs[key] = entry
         self._success = 1
 
+    cdef void release_program(self):
+        # stop using the program, and delete it if no other shader use it
+        cdef list entry = self._program_entry
+        if entry is None:
+            return
+        self._program_entry = None
+        self.program = -1
+        entry[1] -= 1
+        if entry[2] == id(self):
+            entry[2] = 0
+        if entry[1] > 0:
+            return
+        for key, value in list(_programs.items()):
+            if value is entry:
+                del _programs[key]
+                break
+        glDeleteProgram(entry[0])
+
     cdef int is_linked(self):
         cdef GLint result = 0
         glGetProgramiv(self.program, GL_LINK_STATUS, &result)
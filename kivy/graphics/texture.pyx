@@ -147,6 +147,25 @@ information.
     actually creating the nearest POT texture and generate mipmap on it. This
     might change in the future.
 
+Streaming frames
+----------------
+
+.. versionadded:: 1.8.0
+
+For video or camera frames, :func:`Texture.blit_buffer` would be called on the
+texture being drawn, every frame, from the main thread. A
+:class:`TextureStream` lets a decoder thread hand over its frames, and uploads
+only the latest one into a ring of textures when the main thread swaps::
+
+    stream = TextureStream(size=(640, 480), colorfmt='rgb')
+
+    # in the decoder thread
+    stream.write(frame_data)
+
+    # in the main thread, once per frame
+    if stream.swap():
+        rectangle.texture = stream.texture
+
 Reloading the Texture
 ---------------------
 
@@ -181,15 +200,17 @@ This way, you could use the same method for initialization and for reloading.
     the text to the texture. You have nothing to do on that case.
 '''
 
-__all__ = ('Texture', 'TextureRegion')
+__all__ = ('Texture', 'TextureRegion', 'TextureStream')
 
 include "config.pxi"
 include "common.pxi"
 include "opengl_utils_def.pxi"
 
 from array import array
+from threading import Lock
 from kivy.weakmethod import WeakMethod
-from kivy.graphics.context cimport get_context
+from kivy.graphics.context cimport get_context, frame_stats_t, \
+    get_frame_stats_ptr
 
 from kivy.graphics.c_opengl cimport *
 IF USE_OPENGL_DEBUG == 1:
@@ -204,6 +225,9 @@ cdef int TI_NEED_GEN        = 1 << 3
 cdef int TI_NEED_ALLOCATE   = 1 << 4
 cdef int TI_NEED_PIXELS     = 1 << 5
 
+# counters of the current frame, see kivy.graphics.context
+cdef frame_stats_t *stats = get_frame_stats_ptr()
+
 
 # compatibility layer
 cdef GLuint GL_BGR = 0x80E0
@@ -722,6 +746,7 @@ cdef class Texture:
     cpdef bind(self):
         '''Bind the texture to current opengl state'''
         cdef GLuint value
+        stats.texture_binds += 1
 
         # if we have no change to apply, just bind and exit
         if not self.flags:
@@ -849,6 +874,7 @@ cdef class Texture:
         cdef int is_compressed = _is_compressed_fmt(colorfmt)
         cdef int _mipmap_generation = mipmap_generation and self._mipmap
         cdef int _mipmap_level = mipmap_level
+        stats.texture_bytes += datasize
 
         with nogil:
             if is_compressed:
@@ -1142,3 +1168,131 @@ cdef class TextureRegion(Texture):
             self.flip_vertical()
             return fbo.pixels
 
+
+
+class TextureStream(object):
+    '''Stream frames from a producer thread into a ring of textures.
+
+    .. versionadded:: 1.8.0
+
+    A :class:`TextureStream` is meant for content that is fully replaced at a
+    high rate, like video or camera frames. The producer (a decoder or capture
+    thread) hands over its frames with :meth:`write`, without touching OpenGL.
+    The main thread calls :meth:`swap` once per frame: only the most recent
+    frame is uploaded, into the texture of the ring that has been displayed
+    the longest, and that texture becomes the new :attr:`texture`. The
+    texture currently used for drawing is never overwritten while it might
+    still be in use by the GPU.
+
+    If the producer writes faster than the main thread swaps, intermediate
+    frames are dropped and counted in :attr:`dropped`.
+
+    .. note::
+
+        Pixel unpack buffers are not part of the OpenGL ES 2.0 subset Kivy is
+        built against, so the stream uses a ring of textures instead. This
+        works the same on desktop GL and GLES2.
+
+    :Parameters:
+        `size`: tuple, default to None
+            Size of the frames. If None, the size given to the first
+            :meth:`write` is used.
+        `colorfmt`: str, default to 'rgb'
+            Color format of the frames.
+        `bufferfmt`: str, default to 'ubyte'
+            Buffer format of the frames.
+        `count`: int, default to 2
+            Number of textures in the ring.
+        `flip_vertical`: bool, default to False
+            If True, all the textures of the ring are flipped vertically.
+    '''
+
+    def __init__(self, size=None, colorfmt='rgb', bufferfmt='ubyte', count=2,
+                 flip_vertical=False):
+        super(TextureStream, self).__init__()
+        if count < 1:
+            raise ValueError('TextureStream count must be at least 1')
+        self.size = size
+        self.colorfmt = colorfmt
+        self.bufferfmt = bufferfmt
+        self.count = count
+        self.flip = flip_vertical
+        self.dropped = 0
+        self._lock = Lock()
+        self._pending = None
+        self._textures = []
+        self._index = -1
+
+    def write(self, data, size=None, colorfmt=None):
+        '''Hand over a new frame to the stream. This method doesn't use
+        OpenGL, and can be called from any thread.
+
+        :Parameters:
+            `data`: bytes
+                Content of the frame
+            `size`: tuple, default to None
+                Size of the frame, if it changed since the last frame.
+            `colorfmt`: str, default to None
+                Color format of the frame, if it changed since the last frame.
+        '''
+        with self._lock:
+            if self._pending is not None:
+                self.dropped += 1
+                # keep a format change announced by a dropped frame
+                size = size or self._pending[1]
+                colorfmt = colorfmt or self._pending[2]
+            self._pending = (data, size, colorfmt)
+
+    def swap(self):
+        '''Upload the latest written frame into the next texture of the ring,
+        and make it the current :attr:`texture`. Must be called from the main
+        thread. Return True if a new frame has been uploaded.
+        '''
+        with self._lock:
+            pending = self._pending
+            self._pending = None
+        if pending is None:
+            return False
+        data, size, colorfmt = pending
+        if colorfmt is not None and colorfmt != self.colorfmt:
+            self.colorfmt = colorfmt
+            self._textures = []
+        if size is not None and tuple(size) != self.size:
+            self.size = tuple(size)
+            self._textures = []
+        if self.size is None:
+            raise ValueError('TextureStream size is unknown, pass it to '
+                             'the constructor or to write()')
+        if not self._textures:
+            self._textures = [self._create_texture()
+                              for x in range(self.count)]
+            self._index = -1
+        index = (self._index + 1) % self.count
+        self._textures[index].blit_buffer(data, size=self.size,
+                colorfmt=self.colorfmt, bufferfmt=self.bufferfmt)
+        self._index = index
+        return True
+
+    def clear(self):
+        '''Drop the pending frame and release the textures of the ring.
+        '''
+        with self._lock:
+            self._pending = None
+        self._textures = []
+        self._index = -1
+
+    def _create_texture(self):
+        texture = texture_create(size=self.size, colorfmt=self.colorfmt,
+                                 bufferfmt=self.bufferfmt)
+        if self.flip:
+            texture.flip_vertical()
+        return texture
+
+    @property
+    def texture(self):
+        '''Texture containing the last swapped frame, or None if no frame has
+        been swapped yet.
+        '''
+        if self._index < 0:
+            return None
+        return self._textures[self._index]
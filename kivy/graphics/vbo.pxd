@@ -4,6 +4,12 @@ from vertex cimport vertex_t, vertex_attr_t, VertexFormat
 
 cdef VertexFormat default_vertex
 
+# state of the bounding box of a vertex batch
+cdef enum:
+    BBOX_EMPTY = 0
+    BBOX_VALID = 1
+    BBOX_UNKNOWN = 2
+
 cdef class VBO:
     cdef object __weakref__
 
@@ -40,12 +46,15 @@ cdef class VertexBatch:
     cdef int usage
     cdef short flags
     cdef int elements_size
+    cdef float bbox[4]
+    cdef int bbox_state
 
     cdef void clear_data(self)
     cdef void set_data(self, void *vertices, int vertices_count,
                        unsigned short *indices, int indices_count)
     cdef void append_data(self, void *vertices, int vertices_count,
                           unsigned short *indices, int indices_count)
+    cdef void update_bbox(self, void *vertices, int vertices_count)
     cdef void draw(self)
     cdef void set_mode(self, str mode)
     cdef str get_mode(self)
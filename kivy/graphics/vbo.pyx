@@ -28,7 +28,8 @@ IF USE_OPENGL_DEBUG == 1:
     from kivy.graphics.c_opengl_debug cimport *
 from kivy.graphics.vertex cimport *
 from kivy.logger import Logger
-from kivy.graphics.context cimport Context, get_context
+from kivy.graphics.context cimport Context, get_context, frame_stats_t, \
+    get_frame_stats_ptr
 from kivy.graphics.instructions cimport getActiveContext
 from kivy.graphics.shader cimport Shader
 
@@ -39,6 +40,9 @@ cdef short V_NEEDGEN = 1 << 0
 cdef short V_NEEDUPLOAD = 1 << 1
 cdef short V_HAVEID = 1 << 2
 
+# counters of the current frame, see kivy.graphics.context
+cdef frame_stats_t *stats = get_frame_stats_ptr()
+
 cdef class VBO:
     '''
     .. versionchanged:: 1.6.0
@@ -79,12 +83,14 @@ cdef class VBO:
             self.vbo_size = self.data.size()
             glBindBuffer(GL_ARRAY_BUFFER, self.id)
             glBufferData(GL_ARRAY_BUFFER, self.vbo_size, self.data.pointer(), self.usage)
+            stats.vbo_bytes += self.vbo_size
             self.flags &= ~V_NEEDUPLOAD
 
         # if size match, update only what is needed
         elif self.flags & V_NEEDUPLOAD:
             glBindBuffer(GL_ARRAY_BUFFER, self.id)
             glBufferSubData(GL_ARRAY_BUFFER, 0, self.data.size(), self.data.pointer())
+            stats.vbo_bytes += self.data.size()
             self.flags &= ~V_NEEDUPLOAD
 
     cdef void bind(self):
@@ -157,6 +163,7 @@ cdef class VertexBatch:
                                     self.vbo_index.count())
         self.vbo_index.clear()
         self.elements.clear()
+        self.bbox_state = BBOX_EMPTY
 
     cdef void set_data(self, void *vertices, int vertices_count,
                        unsigned short *indices, int indices_count):
@@ -178,6 +185,7 @@ cdef class VertexBatch:
         self.vbo.add_vertex_data(vertices, vi, vertices_count)
         self.vbo_index.add(vi, NULL, vertices_count)
         free(vi)
+        self.update_bbox(vertices, vertices_count)
 
         # build element list for DrawElements using vbo indices
         # TODO: remove buffer usage in this case, the memory is always one big
@@ -189,6 +197,36 @@ cdef class VertexBatch:
             self.elements.add(&vbi[local_index], NULL, 1)
         self.flags |= V_NEEDUPLOAD
 
+    cdef void update_bbox(self, void *vertices, int vertices_count):
+        # extend the bounding box of the vertices positions, used for tracking
+        # the damaged regions of the window. The position must be the first
+        # attribute, with 2 floats.
+        cdef vertex_attr_t *attr = &self.vbo.format[0]
+        cdef char *data = <char *>vertices
+        cdef float *pos
+        cdef int i
+        if vertices_count == 0 or self.bbox_state == BBOX_UNKNOWN:
+            return
+        if strcmp(attr.name, b'vPosition') != 0 or attr.size != 2 or \
+                attr.type != GL_FLOAT:
+            self.bbox_state = BBOX_UNKNOWN
+            return
+        if self.bbox_state == BBOX_EMPTY:
+            pos = <float *>data
+            self.bbox[0] = self.bbox[2] = pos[0]
+            self.bbox[1] = self.bbox[3] = pos[1]
+            self.bbox_state = BBOX_VALID
+        for i in xrange(vertices_count):
+            pos = <float *>(data + i * self.vbo.format_size)
+            if pos[0] < self.bbox[0]:
+                self.bbox[0] = pos[0]
+            elif pos[0] > self.bbox[2]:
+                self.bbox[2] = pos[0]
+            if pos[1] < self.bbox[1]:
+                self.bbox[1] = pos[1]
+            elif pos[1] > self.bbox[3]:
+                self.bbox[3] = pos[1]
+
     cdef void draw(self):
         cdef int count = self.elements.count()
         if count == 0:
@@ -212,12 +250,15 @@ cdef class VertexBatch:
                 glBufferData(GL_ELEMENT_ARRAY_BUFFER, self.elements.size(),
                     self.elements.pointer(), self.usage)
                 self.elements_size = self.elements.size()
+            stats.vbo_bytes += self.elements_size
             self.flags &= ~V_NEEDUPLOAD
 
         self.vbo.bind()
 
         # draw the elements pointed by indices in ELEMENT ARRAY BUFFER.
         glDrawElements(self.mode, count, GL_UNSIGNED_SHORT, NULL)
+        stats.draw_calls += 1
+        stats.vertices += count
 
     cdef void set_mode(self, str mode):
         # most common case in top;
@@ -464,7 +464,7 @@ cdef class Point(VertexInstruction):
         self.batch.append_data(vertices, 4, indices, 6)
 
         if self.parent is not None:
-            self.parent.flag_update()
+            self.parent.flag_child_update()
 
     property points:
         '''Property for getting/settings points of the triangle
@@ -255,6 +255,14 @@ class MotionEvent(MotionEventBase):
         #: Time of the end event (last touch usage)
         self.time_end = -1
 
+        #: Number of `update` events of this touch dropped by the
+        #: :class:`~kivy.base.EventLoopBase` in the current frame, because a
+        #: newer update was received. Postproc modules can use it to know that
+        #: intermediate positions have been skipped.
+        #:
+        #: .. versionadded:: 1.8.0
+        self.coalesced = 0
+
         #: Indicate if the touch is a double tap or not
         self.is_double_tap = False
 
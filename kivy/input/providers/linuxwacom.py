@@ -191,12 +191,14 @@ else:
         def start(self):
             if self.input_fn is None:
                 return
+            from kivy.base import EventLoop
             self.uid = 0
             self.queue = collections.deque()
             self.thread = threading.Thread(
                 target=self._thread_run,
                 kwargs=dict(
                     queue=self.queue,
+                    wakeup=EventLoop.wakeup,
                     input_fn=self.input_fn,
                     device=self.device,
                     default_ranges=self.default_ranges))
@@ -206,6 +208,7 @@ else:
         def _thread_run(self, **kwargs):
             input_fn = kwargs.get('input_fn')
             queue = kwargs.get('queue')
+            wakeup = kwargs.get('wakeup')
             device = kwargs.get('device')
             drs = kwargs.get('default_ranges').get
             touches = {}
@@ -250,6 +253,8 @@ else:
                             queue.append(('end', touch))
                             touches_sent.remove(tid)
                         del touches[tid]
+                # wake up the event loop if it's sleeping in power save
+                wakeup()
 
             def normalize(value, vmin, vmax):
                 return (value - vmin) / float(vmax - vmin)
@@ -140,12 +140,14 @@ else:
         def start(self):
             if self.input_fn is None:
                 return
+            from kivy.base import EventLoop
             self.uid = 0
             self.queue = collections.deque()
             self.thread = threading.Thread(
                 target=self._thread_run,
                 kwargs=dict(
                     queue=self.queue,
+                    wakeup=EventLoop.wakeup,
                     input_fn=self.input_fn,
                     device=self.device,
                     default_ranges=self.default_ranges))
@@ -155,6 +157,7 @@ else:
         def _thread_run(self, **kwargs):
             input_fn = kwargs.get('input_fn')
             queue = kwargs.get('queue')
+            wakeup = kwargs.get('wakeup')
             device = kwargs.get('device')
             drs = kwargs.get('default_ranges').get
             touches = {}
@@ -182,6 +185,8 @@ else:
                         touches_sent.remove(tid)
                         touch.update_time_end()
                     queue.append((action, touch))
+                # wake up the event loop if it's sleeping in power save
+                wakeup()
 
             def normalize(value, vmin, vmax):
                 return (value - vmin) / float(vmax - vmin)
@@ -18,6 +18,12 @@ interactions. You could compare this language to Qt's QML
     by setting the env `KIVY_PROFILE_LANG=1`. You will get an html file named
     `builder_stats.html`.
 
+.. versionchanged:: 1.8.0
+
+    The `builder_stats.html` file also lists the sets, dispatches, observers
+    time and number of observers of all the properties and events, see
+    the statistics of :mod:`~kivy.properties`.
+
 Overview
 --------
 
@@ -1726,6 +1732,9 @@ Builder.load_file(join(kivy_data_dir, 'style.kv'), rulesonly=True)
 if 'KIVY_PROFILE_LANG' in environ:
     import atexit
     import cgi
+    from kivy import properties
+
+    properties.start_stats()
 
     def match_rule(fn, index, rule):
         if rule.ctx.filename != fn:
@@ -1747,6 +1756,28 @@ if 'KIVY_PROFILE_LANG' in environ:
             for r in match_rule(fn, index, rule.canvas_after):
                 yield r
 
+    def dump_property_stats():
+        # properties and events sorted by the time spent in their observers
+        stats = sorted(iteritems(properties.get_stats()),
+                       key=lambda x: x[1][3], reverse=True)
+        html = ['<h2>Properties and events</h2>', '<table>',
+                '<tr><th>Class</th><th>Name</th><th>Sets</th>',
+                '<th>Changes</th><th>Dispatches</th><th>Time (ms)</th>',
+                '<th>Max observers</th></tr>']
+        for (cls, name), (sets, changes, dispatches, duration,
+                          observers) in stats:
+            html += ['<tr>',
+                     '<td>', cgi.escape(cls), '</td>',
+                     '<td>', cgi.escape(name), '</td>',
+                     '<td>', str(sets), '</td>',
+                     '<td>', str(changes), '</td>',
+                     '<td>', str(dispatches), '</td>',
+                     '<td>', '%.3f' % (duration * 1000.), '</td>',
+                     '<td>', str(observers), '</td>',
+                     '</tr>']
+        html += ['</table>']
+        return html
+
     def dump_builder_stats():
         html = [
             '<!doctype html>'
@@ -1775,6 +1806,7 @@ if 'KIVY_PROFILE_LANG' in environ:
                         '<td><pre>', line, '</pre></td>',
                         '</tr>']
             html += ['</table>']
+        html += dump_property_stats()
         html += ['</body></html>']
         with open('builder_stats.html', 'w') as fd:
             fd.write(''.join(html))
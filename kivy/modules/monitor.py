@@ -7,11 +7,19 @@ application :
 
 * FPS
 * Graph of input events
+* Graphics statistics of the last frame: draw calls, vertices, instructions
+  applied and ignored, texture binds, shader switches, uniforms uploaded and
+  kilobytes uploaded in the buffers and textures. See
+  :func:`~kivy.graphics.context.get_frame_stats`.
+
+.. versionchanged:: 1.8.0
+    The graphics statistics have been added.
 
 '''
 
 from kivy.uix.label import Label
 from kivy.graphics import Rectangle, Color
+from kivy.graphics.context import get_frame_stats
 from kivy.clock import Clock
 from kivy.input.postproc import kivy_postproc_modules
 from functools import partial
@@ -21,7 +29,15 @@ _maxinput = -1
 
 
 def update_fps(ctx, *largs):
-    ctx.label.text = 'FPS: %f' % Clock.get_fps()
+    stats = get_frame_stats()
+    ctx.label.text = (
+        'FPS: %.1f - draw: %d, vertices: %d, instr: %d/%d ignored, '
+        'tex: %d, shaders: %d, uniforms: %d, upload: %.1fkB' % (
+            Clock.get_fps(), stats['draw_calls'], stats['vertices'],
+            stats['instructions'], stats['instructions_ignored'],
+            stats['texture_binds'], stats['shader_switches'],
+            stats['uniform_uploads'],
+            (stats['vbo_bytes'] + stats['texture_bytes']) / 1024.))
     ctx.rectangle.texture = ctx.label.texture
     ctx.rectangle.size = ctx.label.texture_size
 
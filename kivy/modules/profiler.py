@@ -0,0 +1,54 @@
+'''
+Profiler module
+===============
+
+.. versionadded:: 1.8.0
+
+Record the frames with the :mod:`~kivy.profiler`, from the start of the
+application. The trace is saved in the Chrome trace event format when the
+application stops, or when F10 is pressed::
+
+    python main.py -m profiler:filename=trace.json,size=200000
+
+Configuration
+-------------
+
+:Parameters:
+    `filename`: str, default to 'kivy-trace.json'
+        Filename of the trace.
+    `size`: int, default to 100000
+        Maximum number of spans kept in the ring buffer.
+
+'''
+
+__all__ = ('start', 'stop')
+
+from functools import partial
+from kivy.base import EventLoop
+from kivy.logger import Logger
+from kivy.profiler import Profiler
+
+
+def _export(ctx, *largs):
+    Profiler.export_trace(ctx.filename)
+    Logger.info('Profiler: Trace saved at <%s>' % ctx.filename)
+
+
+def _on_keyboard_handler(ctx, instance, key, *largs):
+    if key == 291:  # F10
+        _export(ctx)
+
+
+def start(win, ctx):
+    ctx.filename = ctx.config.get('filename', 'kivy-trace.json')
+    Profiler.start(int(ctx.config.get('size', 100000)))
+    ctx.on_keyboard = partial(_on_keyboard_handler, ctx)
+    ctx.on_stop = partial(_export, ctx)
+    win.bind(on_keyboard=ctx.on_keyboard)
+    EventLoop.bind(on_stop=ctx.on_stop)
+
+
+def stop(win, ctx):
+    win.unbind(on_keyboard=ctx.on_keyboard)
+    EventLoop.unbind(on_stop=ctx.on_stop)
+    Profiler.stop()
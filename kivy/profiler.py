@@ -0,0 +1,171 @@
+'''
+Profiler
+========
+
+.. versionadded:: 1.8.0
+
+The :class:`ProfilerBase` records how long each step of a frame takes, in a
+ring buffer, and exports it as a `Chrome trace
+<https://github.com/catapult-project/catapult/wiki/Trace-Event-Format>`_.
+Open the exported file in `chrome://tracing` to see which callback made a
+frame late::
+
+    from kivy.profiler import Profiler
+
+    Profiler.start()
+    # ... run the application ...
+    Profiler.stop()
+    Profiler.export_trace('trace.json')
+
+You can also use the :mod:`~kivy.modules.profiler` module, which start the
+profiler with the application, and export the trace when it stops.
+
+The recorded spans are:
+
+================== =========== ================================================
+Name               Category    Span
+================== =========== ================================================
+`frame`            frame       One iteration of
+                               :meth:`~kivy.base.EventLoopBase.idle`
+`sleep`            frame       Time slept to respect `maxfps`, or waiting in
+                               power saving mode
+`Clock.tick`       clock       Scheduled callbacks run by
+                               :meth:`~kivy.clock.ClockBase.tick`
+`Clock.tick_draw`  clock       Callbacks scheduled before the frame, including
+                               the layout triggers
+<callback name>    clock       One clock callback, named after it. A layout
+                               trigger appears as `BoxLayout.do_layout`
+`dispatch_input`   input       Reading and dispatching the input events
+`Builder.sync`     builder     Applying the pending kv rules
+`on_draw`          graphics    Drawing the window canvas
+`on_flip`          graphics    Swapping the window buffers
+================== =========== ================================================
+
+The profiler is disabled by default, and then has nearly no cost.
+'''
+
+__all__ = ('Profiler', 'ProfilerBase')
+
+from collections import deque
+from json import dump
+from sys import platform
+from os import environ
+from types import ModuleType
+import time
+
+if platform in ('win32', 'cygwin'):
+    _default_time = time.clock
+else:
+    _default_time = time.time
+
+
+class ProfilerBase(object):
+    '''Record the duration of the steps of the frames, in a ring buffer.
+
+    :Parameters:
+        `size`: int, default to 100000
+            Maximum number of spans kept. When the buffer is full, the oldest
+            spans are dropped.
+    '''
+
+    #: Function returning the current time in seconds, used for the spans.
+    time = staticmethod(_default_time)
+
+    def __init__(self, size=100000):
+        super(ProfilerBase, self).__init__()
+        #: True if the profiler is recording.
+        self.enabled = False
+        #: Index of the current frame.
+        self.frame = 0
+        self._spans = deque(maxlen=size)
+
+    @property
+    def spans(self):
+        '''List of the recorded spans, as (name, category, start, duration,
+        frame) tuples. The times are in seconds.
+        '''
+        return list(self._spans)
+
+    def start(self, size=None):
+        '''Start recording. If `size` is set, the ring buffer is resized.
+        '''
+        if size is not None and size != self._spans.maxlen:
+            self._spans = deque(self._spans, maxlen=size)
+        self.enabled = True
+
+    def stop(self):
+        '''Stop recording. The recorded spans are kept.
+        '''
+        self.enabled = False
+
+    def clear(self):
+        '''Remove all the recorded spans.
+        '''
+        self._spans.clear()
+        self.frame = 0
+
+    def add(self, name, category, start, duration):
+        '''Record a span. `start` and `duration` are in seconds, from
+        :attr:`time`.
+        '''
+        self._spans.append((name, category, start, duration, self.frame))
+
+    def mark(self, name, category, start):
+        '''Record a span from `start` to now, and return the current time, to
+        be used as the start of the next span.
+        '''
+        now = self.time()
+        self._spans.append((name, category, start, now - start, self.frame))
+        return now
+
+    @staticmethod
+    def get_callback_name(callback):
+        '''Return a readable name for a callback: `Class.method` for methods,
+        the function name otherwise.
+        '''
+        # functools.partial
+        func = getattr(callback, 'func', callback)
+        name = getattr(func, '__name__', None)
+        if name is None:
+            return type(func).__name__
+        obj = getattr(func, '__self__', None)
+        # builtin functions are bound to their module
+        if obj is not None and not isinstance(obj, ModuleType):
+            return '%s.%s' % (type(obj).__name__, name)
+        return name
+
+    def get_summary(self):
+        '''Return a dict of name: (count, total duration, max duration) for all
+        the recorded spans.
+        '''
+        summary = {}
+        for name, category, start, duration, frame in self._spans:
+            count, total, longest = summary.get(name, (0, 0., 0.))
+            summary[name] = (count + 1, total + duration,
+                             max(longest, duration))
+        return summary
+
+    def to_trace(self):
+        '''Return the recorded spans in the Chrome trace event format, as a
+        dict ready to be serialized in JSON.
+        '''
+        events = [{
+            'name': name, 'cat': category, 'ph': 'X',
+            'ts': start * 1000000., 'dur': duration * 1000000.,
+            'pid': 1, 'tid': 1, 'args': {'frame': frame}}
+            for name, category, start, duration, frame in self._spans]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_trace(self, filename):
+        '''Save the recorded spans in `filename`, in the Chrome trace event
+        format.
+        '''
+        with open(filename, 'w') as fd:
+            dump(self.to_trace(), fd)
+
+
+if 'KIVY_DOC_INCLUDE' in environ:
+    #: Instance of the ProfilerBase, available for everybody
+    Profiler = None
+else:
+    Profiler = ProfilerBase()
@@ -158,6 +158,36 @@ If you created the class yourself, you can use the 'on_<propname>' callback::
     property you are inherit, you must not forget to call the subclass
     function too.
 
+Statistics
+----------
+
+.. versionadded:: 1.8.0
+
+To find which property change triggers a costly cascade of callbacks, you can
+count the sets and dispatches of all the properties and events::
+
+    from kivy import properties
+
+    properties.start_stats()
+    # ... run the application ...
+    properties.stop_stats()
+    for (cls, name), stats in properties.get_stats().items():
+        sets, changes, dispatches, duration, observers = stats
+        print(cls, name, dispatches, duration)
+
+For each class and property (or event), you get:
+
+- the number of calls to :meth:`Property.set`,
+- how many of them changed the value,
+- the number of dispatches,
+- the time spent in the observers, in seconds. It includes the time of the
+  nested dispatches triggered by the observers,
+- the largest number of observers bound on one instance.
+
+The statistics are disabled by default, and then have nearly no cost. With the
+`KIVY_PROFILE_LANG` environment variable, they are enabled when the
+:mod:`~kivy.lang` module is imported, and written in `builder_stats.html`.
+
 
 
 
@@ -175,10 +205,68 @@ include "graphics/config.pxi"
 
 from weakref import ref
 from kivy.compat import string_types
+from kivy.profiler import ProfilerBase
 
 cdef float g_dpi = -1
 cdef float g_density = -1
 cdef float g_fontscale = -1
+cdef int g_stats_enabled = 0
+cdef dict g_stats = {}
+cdef object g_stats_time = ProfilerBase.time
+
+
+cdef list stats_entry(EventDispatcher obj, str name):
+    # return the [sets, changes, dispatches, observers time, max observers]
+    # stats of the property or event `name` for the class of `obj`, or None
+    # if the stats are not enabled.
+    cdef list entry
+    if not g_stats_enabled:
+        return None
+    key = (obj.__class__.__name__, name)
+    entry = g_stats.get(key)
+    if entry is None:
+        entry = g_stats[key] = [0, 0, 0, 0., 0]
+    return entry
+
+
+cdef double stats_time():
+    return g_stats_time()
+
+
+def start_stats():
+    '''Start counting the sets and dispatches of all the properties and
+    events. See `Statistics`_.
+
+    .. versionadded:: 1.8.0
+    '''
+    global g_stats_enabled
+    g_stats_enabled = 1
+
+
+def stop_stats():
+    '''Stop counting. The collected statistics are kept.
+
+    .. versionadded:: 1.8.0
+    '''
+    global g_stats_enabled
+    g_stats_enabled = 0
+
+
+def clear_stats():
+    '''Remove all the collected statistics.
+
+    .. versionadded:: 1.8.0
+    '''
+    g_stats.clear()
+
+
+def get_stats():
+    '''Return the collected statistics, as a dict of (class name, property or
+    event name): (sets, changes, dispatches, observers time, max observers).
+
+    .. versionadded:: 1.8.0
+    '''
+    return dict([(key, tuple(entry)) for key, entry in g_stats.items()])
 
 NUMERIC_FORMATS = ('in', 'px', 'dp', 'sp', 'pt', 'cm', 'mm')
 
@@ -309,8 +397,12 @@ cdef class Property:
         '''Add a new observer to be called only when the value is changed.
         '''
         cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef list entry
         if observer not in ps.observers:
             ps.observers.append(observer)
+            entry = stats_entry(obj, self._name)
+            if entry is not None and len(ps.observers) > entry[4]:
+                entry[4] = len(ps.observers)
 
     cpdef unbind(self, EventDispatcher obj, observer):
         '''Remove the observer from our widget observer list.
@@ -335,6 +427,9 @@ cdef class Property:
         '''Set a new value for the property.
         '''
         cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef list entry = stats_entry(obj, self._name)
+        if entry is not None:
+            entry[0] += 1
         value = self.convert(obj, value)
         realvalue = ps.value
         if self.compare_value(realvalue, value):
@@ -352,6 +447,8 @@ cdef class Property:
             else:
                 raise e
 
+        if entry is not None:
+            entry[1] += 1
         ps.value = value
         self.dispatch(obj)
         return True
@@ -404,10 +501,24 @@ cdef class Property:
 
         '''
         cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef list entry = stats_entry(obj, self._name)
+        cdef double start
+        if entry is not None:
+            entry[2] += 1
+            if len(ps.observers) > entry[4]:
+                entry[4] = len(ps.observers)
         if len(ps.observers):
             value = ps.value
-            for observer in ps.observers:
-                observer(obj, value)
+            if entry is None:
+                for observer in ps.observers:
+                    observer(obj, value)
+                return
+            start = stats_time()
+            try:
+                for observer in ps.observers:
+                    observer(obj, value)
+            finally:
+                entry[3] += stats_time() - start
 
 
 cdef class NumericProperty(Property):
@@ -1047,10 +1158,15 @@ cdef class ReferenceListProperty(Property):
         cdef int idx
         cdef list value
         cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef list entry = stats_entry(obj, self._name)
+        if entry is not None:
+            entry[0] += 1
         value = self.convert(obj, _value)
         if self.compare_value(ps.value, value):
             return False
         self.check(obj, value)
+        if entry is not None:
+            entry[1] += 1
         # prevent dependency loop
         ps.stop_event = 1
         props = ps.properties
@@ -1173,7 +1289,12 @@ cdef class AliasProperty(Property):
 
     cpdef set(self, EventDispatcher obj, value):
         cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef list entry = stats_entry(obj, self._name)
+        if entry is not None:
+            entry[0] += 1
         if ps.setter(obj, value):
+            if entry is not None:
+                entry[1] += 1
             ps.value = self.get(obj)
             self.dispatch(obj)
 
@@ -228,6 +228,19 @@ fruit_data_items = \
     [FruitItem(**fruit_dict) for fruit_dict in fruit_data_list_of_dicts]
 
 
+class RecyclableListItemButton(ListItemButton):
+
+    recycled = BooleanProperty(False)
+
+    def on_recycle(self, adapter, index):
+        self.recycled = True
+
+    def refresh_view_attrs(self, adapter, index, item_args):
+        self.recycled = False
+        self.index = index
+        self.text = item_args['text']
+
+
 class FruitsListAdapter(ListAdapter):
 
     def __init__(self, **kwargs):
@@ -1407,3 +1420,206 @@ class AdaptersTestCase(unittest.TestCase):
         self.assertEqual(len(letters_dict_adapter.data), 2)
 
         self.assertTrue(sorted_keys_ok(letters_dict_adapter))
+
+    def test_list_adapter_cache_limit(self):
+        list_adapter = ListAdapter(data=[str(i) for i in range(10)],
+                                   args_converter=lambda i, rec: {'text': rec},
+                                   selection_mode='multiple',
+                                   cache_limit=3,
+                                   cls=ListItemButton)
+        views = [list_adapter.get_view(i) for i in range(3)]
+        list_adapter.handle_selection(views[0])
+
+        # the least recently used view is evicted, but not the selected one
+        list_adapter.get_view(3)
+        self.assertEqual(sorted(list_adapter.cached_views), [0, 2, 3])
+        self.assertIs(list_adapter.get_view(2), views[2])
+        list_adapter.get_view(4)
+        self.assertEqual(sorted(list_adapter.cached_views), [0, 2, 4])
+
+    def test_adapter_recycle_view_attrs(self):
+        list_adapter = ListAdapter(data=[str(i) for i in range(10)],
+                                   args_converter=lambda i, rec: {'text': rec},
+                                   pool_size=1,
+                                   cls=RecyclableListItemButton)
+        view = list_adapter.get_view(0)
+        other_view = list_adapter.get_view(1)
+        list_adapter.release_view(0, view)
+        list_adapter.release_view(1, other_view)
+        self.assertTrue(view.recycled)
+        self.assertNotIn(0, list_adapter.cached_views)
+
+        # the pool only keeps the last released view
+        recycled_view = list_adapter.get_view(5)
+        self.assertIs(recycled_view, other_view)
+        self.assertFalse(recycled_view.recycled)
+        self.assertEqual(recycled_view.text, '5')
+        self.assertEqual(recycled_view.index, 5)
+        self.assertIsNot(list_adapter.get_view(6), view)
+
+    def test_list_adapter_refresh_data_item(self):
+        # data items modified in place, without changing the data list
+        data = [{'text': str(i)} for i in range(10)]
+        args_converter = lambda i, rec: {'text': rec['text']}
+        changed = []
+        list_adapter = ListAdapter(data=data,
+                                   args_converter=args_converter,
+                                   cls=RecyclableListItemButton)
+        list_adapter.bind(
+            on_data_item_changed=lambda adapter, index: changed.append(index))
+        view = list_adapter.get_view(2)
+        other_view = list_adapter.get_view(3)
+
+        # modified in place: the view is updated, the others are kept
+        data[2]['text'] = 'two'
+        list_adapter.refresh_data_item(2)
+        self.assertEqual(changed, [2])
+        self.assertIs(list_adapter.get_view(2), view)
+        self.assertEqual(view.text, 'two')
+        self.assertIs(list_adapter.get_view(3), other_view)
+
+        # without refresh_view_attrs, a new view is created
+        list_adapter = ListAdapter(data=data,
+                                   args_converter=args_converter,
+                                   cls=ListItemButton)
+        view = list_adapter.get_view(2)
+        other_view = list_adapter.get_view(3)
+        data[2]['text'] = 'deux'
+        list_adapter.refresh_data_item(2)
+        new_view = list_adapter.get_view(2)
+        self.assertIsNot(new_view, view)
+        self.assertEqual(new_view.text, 'deux')
+        self.assertIs(list_adapter.get_view(3), other_view)
+
+    def test_list_adapter_select_range(self):
+        list_adapter = ListAdapter(data=[str(i) for i in range(1000)],
+                                   args_converter=lambda i, rec: {'text': rec},
+                                   selection_mode='multiple',
+                                   allow_empty_selection=True,
+                                   cls=ListItemButton)
+        changes = []
+        list_adapter.bind(on_selection_change=lambda *args: changes.append(1))
+
+        # selected by index, the views are not created
+        list_adapter.select_range(100, 199)
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(len(list_adapter.cached_views), 0)
+        self.assertEqual(len(list_adapter.selection), 0)
+        self.assertEqual(list_adapter.get_selected_indices(),
+                         list(range(100, 200)))
+
+        # until they are needed
+        view = list_adapter.get_view(150)
+        self.assertTrue(view.is_selected)
+        self.assertTrue(list_adapter.is_view_selected(view))
+        self.assertEqual(list_adapter.selection, [view])
+
+        list_adapter.deselect_range(120, 179)
+        self.assertEqual(len(changes), 2)
+        self.assertEqual(list_adapter.get_selected_indices(),
+                         list(range(100, 120)) + list(range(180, 200)))
+        self.assertFalse(view.is_selected)
+        self.assertEqual(list_adapter.selection, [])
+
+        list_adapter.select_range(500, 509, extend=False)
+        self.assertEqual(len(changes), 3)
+        self.assertEqual(list_adapter.get_selected_indices(),
+                         list(range(500, 510)))
+
+        list_adapter.select_all()
+        self.assertEqual(len(list_adapter.get_selected_indices()), 1000)
+        self.assertEqual(len(list_adapter.cached_views), 1)
+        list_adapter.deselect_all()
+        self.assertEqual(list_adapter.get_selected_indices(), [])
+        self.assertEqual(len(changes), 5)
+
+    def test_list_adapter_select_range_propagation(self):
+        data = [{'text': str(i), 'is_selected': False} for i in range(20)]
+        list_adapter = ListAdapter(data=data,
+                                   args_converter=lambda i, rec: {
+                                       'text': rec['text']},
+                                   selection_mode='multiple',
+                                   propagate_selection_to_data=True,
+                                   cls=ListItemButton)
+        list_adapter.select_range(3, 6)
+        self.assertEqual([rec['is_selected'] for rec in data[2:8]],
+                         [False, True, True, True, True, False])
+        self.assertTrue(list_adapter.get_view(4).is_selected)
+        list_adapter.deselect_all()
+        self.assertFalse(any(rec['is_selected'] for rec in data))
+
+    def test_list_adapter_single_change_event(self):
+        list_adapter = ListAdapter(data=[str(i) for i in range(10)],
+                                   args_converter=lambda i, rec: {'text': rec},
+                                   selection_mode='multiple',
+                                   allow_empty_selection=False,
+                                   cls=ListItemButton)
+        views = [list_adapter.get_view(i) for i in range(3)]
+        list_adapter.select_list(views[1:])
+
+        # the first item is selected again, with a single event, after the
+        # selection is updated
+        changes = []
+        list_adapter.bind(on_selection_change=lambda *args: changes.append(
+            [view.index for view in list_adapter.selection]))
+        list_adapter.deselect_list(views)
+        self.assertEqual(changes, [[0]])
+
+    def test_list_adapter_direct_selection_change(self):
+        list_adapter = ListAdapter(data=[str(i) for i in range(10)],
+                                   args_converter=lambda i, rec: {'text': rec},
+                                   selection_mode='multiple',
+                                   cls=ListItemButton)
+        view_1 = list_adapter.get_view(1)
+        view_2 = list_adapter.get_view(2)
+        list_adapter.handle_selection(view_1)
+
+        # replaced by a list of the same length
+        list_adapter.selection = [view_2]
+        self.assertEqual(list_adapter.get_selected_indices(), [2])
+        self.assertFalse(list_adapter.is_view_selected(view_1))
+        list_adapter.selection[0] = view_1
+        self.assertEqual(list_adapter.get_selected_indices(), [1])
+
+    def test_list_adapter_trim_with_indices(self):
+        list_adapter = ListAdapter(data=[str(i) for i in range(100)],
+                                   args_converter=lambda i, rec: {'text': rec},
+                                   selection_mode='multiple',
+                                   allow_empty_selection=True,
+                                   cls=ListItemButton)
+        list_adapter.handle_selection(list_adapter.get_view(60))
+        list_adapter.handle_selection(list_adapter.get_view(20))
+        list_adapter.trim_to_sel()
+        self.assertEqual(list_adapter.data, [str(i) for i in range(20, 61)])
+
+        # the selection, sorted by index, becomes the data
+        list_adapter.select_list([list_adapter.get_view(5),
+                                  list_adapter.get_view(3)])
+        list_adapter.cut_to_sel()
+        self.assertEqual([view.text for view in list_adapter.data],
+                         ['23', '25'])
+
+    def test_list_adapter_selection_order(self):
+        list_adapter = ListAdapter(data=[str(i) for i in range(10)],
+                                   args_converter=lambda i, rec: {'text': rec},
+                                   selection_mode='multiple',
+                                   cls=ListItemButton)
+        for index in (5, 2, 8):
+            list_adapter.handle_selection(list_adapter.get_view(index))
+        self.assertEqual([view.index for view in list_adapter.selection],
+                         [2, 5, 8])
+        list_adapter.handle_selection(list_adapter.get_view(5))
+        self.assertEqual([view.index for view in list_adapter.selection],
+                         [2, 8])
+
+        # a list set directly is sorted too
+        list_adapter.selection = [list_adapter.get_view(8),
+                                  list_adapter.get_view(1)]
+        self.assertEqual([view.index for view in list_adapter.selection],
+                         [1, 8])
+
+        # deselect_list toggles the selection of the views
+        list_adapter.deselect_list([list_adapter.get_view(1),
+                                    list_adapter.get_view(3)])
+        self.assertEqual([view.index for view in list_adapter.selection],
+                         [3, 8])
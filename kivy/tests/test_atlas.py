@@ -0,0 +1,146 @@
+'''
+Atlas tests
+===========
+'''
+
+import unittest
+from random import Random
+
+
+class AtlasPackerTestCase(unittest.TestCase):
+
+    def pack(self, size, count):
+        from kivy.atlas import _MaxRectsPacker
+        packer = _MaxRectsPacker(size, size)
+        rnd = Random(0)
+        placed = []
+        for x in range(count):
+            w, h = rnd.randint(4, 40), rnd.randint(4, 40)
+            pos = packer.insert(w, h)
+            if pos is not None:
+                placed.append((pos[0], pos[1], w, h))
+        return packer, placed
+
+    def test_inside_page(self):
+        packer, placed = self.pack(256, 300)
+        for x, y, w, h in placed:
+            self.assertTrue(x >= 0 and y >= 0)
+            self.assertTrue(x + w <= 256 and y + h <= 256)
+
+    def test_no_overlap(self):
+        packer, placed = self.pack(256, 300)
+        for index, a in enumerate(placed):
+            for b in placed[index + 1:]:
+                self.assertTrue(
+                    a[0] >= b[0] + b[2] or b[0] >= a[0] + a[2] or
+                    a[1] >= b[1] + b[3] or b[1] >= a[1] + a[3])
+
+    def test_occupancy(self):
+        packer, placed = self.pack(256, 300)
+        used = sum(w * h for x, y, w, h in placed)
+        self.assertEqual(packer.used, used)
+        self.assertTrue(packer.occupancy > .8)
+
+    def test_full(self):
+        from kivy.atlas import _MaxRectsPacker
+        packer = _MaxRectsPacker(64, 64)
+        self.assertEqual(packer.insert(64, 64), (0, 0))
+        self.assertEqual(packer.insert(1, 1), None)
+        self.assertEqual(packer.freerects, [])
+
+    def test_extrude(self):
+        from kivy.atlas import _extrude_rgba
+        data = b'aaaabbbbccccdddd'
+        self.assertEqual(_extrude_rgba(data, 2, 2),
+                         b'aaaaaaaabbbbbbbb' * 2 + b'ccccccccdddddddd' * 2)
+
+
+class AtlasCreateTestCase(unittest.TestCase):
+
+    def setUp(self):
+        from tempfile import mkdtemp
+        self.path = mkdtemp()
+
+    def tearDown(self):
+        from shutil import rmtree
+        rmtree(self.path)
+
+    def make_images(self, sizes, border=0):
+        from os.path import join
+        from PIL import Image
+        filenames = []
+        for index, (w, h) in enumerate(sizes):
+            im = Image.new('RGBA', (w + border * 2, h + border * 2))
+            im.paste((255, 0, index, 255),
+                     (border, border, border + w, border + h))
+            filename = join(self.path, 'image%d.png' % index)
+            im.save(filename)
+            filenames.append(filename)
+        return filenames
+
+    def create(self, filenames, size, **kwargs):
+        from os.path import join
+        from kivy.atlas import Atlas
+        return Atlas.create(join(self.path, 'out'), filenames, size,
+                            **kwargs)
+
+    def rects(self, meta):
+        return [(page, coords) for page, ids in meta.items()
+                for coords in ids.values()]
+
+    def test_pages(self):
+        from os.path import exists, join
+        rnd = Random(0)
+        sizes = [(rnd.randint(8, 60), rnd.randint(8, 60)) for x in range(60)]
+        outfn, meta = self.create(self.make_images(sizes), 128, jobs=3)
+        self.assertEqual(outfn, join(self.path, 'out.atlas'))
+        self.assertTrue(len(meta) > 1)
+        for page in meta:
+            self.assertTrue(exists(join(self.path, page)))
+
+        rects = self.rects(meta)
+        self.assertEqual(len(rects), 60)
+        self.assertEqual(sorted(coords[2:4] for page, coords in rects),
+                         sorted(sizes))
+        for index, (page, a) in enumerate(rects):
+            x, y, w, h = a
+            self.assertTrue(x >= 0 and y >= 0 and x + w <= 128 and
+                            y + h <= 128)
+            for other, b in rects[index + 1:]:
+                self.assertTrue(
+                    page != other or
+                    a[0] >= b[0] + b[2] or b[0] >= a[0] + a[2] or
+                    a[1] >= b[1] + b[3] or b[1] >= a[1] + a[3])
+
+    def test_fill(self):
+        # 16 squares filling a page exactly with the padding
+        filenames = self.make_images([(30, 30)] * 16)
+        outfn, meta = self.create(filenames, 128)
+        self.assertEqual(len(meta), 1)
+        filenames = self.make_images([(30, 30)] * 17)
+        outfn, meta = self.create(filenames, 128)
+        self.assertEqual(len(meta), 2)
+
+    def test_jobs(self):
+        rnd = Random(1)
+        sizes = [(rnd.randint(8, 40), rnd.randint(8, 40)) for x in range(30)]
+        filenames = self.make_images(sizes)
+        outfn, meta = self.create(filenames, 128, jobs=1)
+        outfn, meta2 = self.create(filenames, 128, jobs=4)
+        self.assertEqual(meta, meta2)
+
+    def test_too_large(self):
+        filenames = self.make_images([(10, 10), (200, 10)])
+        self.assertEqual(self.create(filenames, 128), None)
+
+    def test_trim(self):
+        filenames = self.make_images([(20, 10), (8, 8)], border=3)
+        outfn, meta = self.create(filenames, 64, trim=True)
+        ids = meta['out-0.png']
+        self.assertEqual(list(ids['image0'][2:]), [20, 10, 3, 3, 26, 16])
+        self.assertEqual(list(ids['image1'][2:]), [8, 8, 3, 3, 14, 14])
+
+        # an image without transparent border is not trimmed
+        filenames = self.make_images([(20, 10)])
+        outfn, meta = self.create(filenames, 64, trim=True)
+        self.assertEqual(len(meta['out-0.png']['image0']), 4)
@@ -0,0 +1,57 @@
+'''
+EventLoop tests
+===============
+'''
+
+import unittest
+
+
+class InputQueueTestCase(unittest.TestCase):
+
+    def setUp(self):
+        from kivy.base import EventLoopBase
+        from kivy.input.motionevent import MotionEvent
+
+        class FakeMotionEvent(MotionEvent):
+            pass
+
+        self.loop = EventLoopBase()
+        self.loop.post_dispatch_input = self.post_dispatch_input
+        self.a = FakeMotionEvent('fake', 1, [])
+        self.b = FakeMotionEvent('fake', 2, [])
+        self.dispatched = []
+
+    def post_dispatch_input(self, etype, me):
+        self.dispatched.append((etype, me))
+
+    def queue(self):
+        a, b = self.a, self.b
+        for ev in (('begin', a), ('update', a), ('begin', b), ('update', a),
+                   ('update', b), ('update', a), ('end', b)):
+            self.loop._dispatch_input(*ev)
+        self.loop.dispatch_input()
+
+    def test_coalesce(self):
+        a, b = self.a, self.b
+        self.queue()
+        self.assertEqual(self.dispatched, [
+            ('begin', a), ('begin', b), ('update', b), ('update', a),
+            ('end', b)])
+        self.assertEqual(a.coalesced, 2)
+        self.assertEqual(b.coalesced, 0)
+
+    def test_no_coalesce(self):
+        self.loop.coalesce_events = False
+        self.queue()
+        self.assertEqual(len(self.dispatched), 7)
+
+    def test_coalesce_reset(self):
+        a, b = self.a, self.b
+        self.queue()
+        self.assertEqual(a.coalesced, 2)
+
+        # the count is reset in the next frame, even without update
+        self.loop._dispatch_input('end', a)
+        self.loop.dispatch_input()
+        self.assertEqual(self.dispatched[-1], ('end', a))
+        self.assertEqual(a.coalesced, 0)
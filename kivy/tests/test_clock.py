@@ -73,3 +73,28 @@ class ClockTestCase(unittest.TestCase):
         Clock.unschedule(callback)
         Clock.tick()
         self.assertEqual(counter, 0)
+
+    def test_next_timeout(self):
+        from kivy.clock import Clock
+        Clock.tick()
+        self.assertEqual(Clock.get_next_timeout(), None)
+        Clock.schedule_once(callback, 5.)
+        self.assertTrue(4. < Clock.get_next_timeout() <= 5.)
+        Clock.schedule_interval(callback, 1.)
+        self.assertTrue(0. < Clock.get_next_timeout() <= 1.)
+        Clock.schedule_once(callback)
+        self.assertEqual(Clock.get_next_timeout(), 0)
+
+    def test_fixed_step(self):
+        from kivy.clock import Clock
+        Clock.fixed_step = .25
+        try:
+            start = Clock.get_time()
+            Clock.schedule_once(callback, .5)
+            Clock.tick()
+            self.assertEqual(counter, 0)
+            Clock.tick()
+            self.assertEqual(counter, 1)
+            self.assertEqual(Clock.get_time() - start, .5)
+        finally:
+            Clock.fixed_step = 0
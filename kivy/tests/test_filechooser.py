@@ -1,3 +1,4 @@
+import unittest
 from kivy.tests.common import GraphicUnitTest
 
 
@@ -9,3 +10,22 @@ class FileChooserTestCase(GraphicUnitTest):
         r = self.render
         wid = FileChooserListView(path=expanduser('~'))
         r(wid, 2)
+
+
+class FileChooserListDirTestCase(unittest.TestCase):
+
+    def test_listdir(self):
+        from kivy.uix.filechooser import _listdir
+        from os import mkdir
+        from os.path import join
+        from shutil import rmtree
+        from tempfile import mkdtemp
+        path = mkdtemp()
+        try:
+            mkdir(join(path, 'directory'))
+            open(join(path, 'file.txt'), 'w').close()
+            names, dirs = _listdir(path)
+            self.assertEqual(sorted(names), ['directory', 'file.txt'])
+            self.assertEqual(dirs, set(['directory']))
+        finally:
+            rmtree(path)
@@ -107,3 +107,111 @@ class FBOInstructionTestCase(unittest.TestCase):
         pygame.image.save(surface, "results.png")
 
 
+class DamageTrackingTestCase(GraphicUnitTest):
+
+    def test_damage(self):
+        from kivy.core.window import Window
+        from kivy.uix.widget import Widget
+        from kivy.graphics import Color, Rectangle
+
+        rc = Window.render_context
+        wid = Widget()
+        with wid.canvas:
+            color = Color(1, 1, 1)
+            rect = Rectangle(pos=(100, 100), size=(50, 50))
+        Window.add_widget(wid)
+        rc.damage_tracking = True
+        try:
+            rc.draw()
+            rc.pop_damage()
+            rc.pop_late_damage()
+            self.assertEqual(rc.pop_damage(), ())
+
+            # the previous position is known before drawing
+            rect.pos = (200, 100)
+            x, y, w, h = rc.pop_damage()
+            self.assertTrue(x <= 100 and x + w >= 150)
+            self.assertTrue(x + w < 200)
+
+            # the new one while drawing
+            rc.draw()
+            x, y, w, h = rc.pop_late_damage()
+            self.assertTrue(x <= 200 and x + w >= 250)
+            self.assertTrue(x > 150)
+
+            # a color covers the instructions drawn with it
+            color.rgb = (1, 0, 0)
+            x, y, w, h = rc.pop_damage()
+            self.assertTrue(x <= 200 and x + w >= 250)
+
+            # an instruction added needs a full redraw
+            with wid.canvas:
+                Rectangle()
+            self.assertEqual(rc.pop_damage(), None)
+        finally:
+            rc.damage_tracking = False
+            Window.remove_widget(wid)
+
+
+class ShaderProgramSharingTestCase(GraphicUnitTest):
+
+    fs = '''$HEADER$
+uniform vec4 tint;
+void main(void) {
+    gl_FragColor = tint;
+}
+'''
+
+    def pixel(self, fbo, x, y):
+        data = bytearray(fbo.pixels)
+        index = (y * fbo.size[0] + x) * 4
+        return tuple(data[index:index + 4])
+
+    def draw(self, fbo):
+        from kivy.graphics.context import flip_frame_stats, get_frame_stats
+        flip_frame_stats()
+        fbo.draw()
+        flip_frame_stats()
+        return get_frame_stats()['uniform_uploads']
+
+    def test_shared_program(self):
+        from kivy.graphics import Fbo, RenderContext, Rectangle, \
+            ClearColor, ClearBuffers
+
+        fbo = Fbo(size=(64, 32))
+        with fbo:
+            ClearColor(0, 0, 0, 1)
+            ClearBuffers()
+        left = RenderContext(fs=self.fs, use_parent_projection=True)
+        right = RenderContext(fs=self.fs, use_parent_projection=True)
+        with left:
+            Rectangle(pos=(0, 0), size=(32, 32))
+        with right:
+            Rectangle(pos=(32, 0), size=(32, 32))
+        fbo.add(left)
+        fbo.add(right)
+
+        left['tint'] = [1., 0., 0., 1.]
+        right['tint'] = [0., 1., 0., 1.]
+        self.draw(fbo)
+        self.assertEqual(self.pixel(fbo, 16, 16), (255, 0, 0, 255))
+        self.assertEqual(self.pixel(fbo, 48, 16), (0, 255, 0, 255))
+
+        # the shaders share the program: only the tint differs between
+        # them, and is uploaded each time the other shader uses it.
+        self.assertEqual(self.draw(fbo), 2)
+        self.assertEqual(self.pixel(fbo, 16, 16), (255, 0, 0, 255))
+        self.assertEqual(self.pixel(fbo, 48, 16), (0, 255, 0, 255))
+
+        # the values of each shader are still applied after switching
+        left['tint'] = [0., 0., 1., 1.]
+        self.draw(fbo)
+        self.assertEqual(self.pixel(fbo, 16, 16), (0, 0, 255, 255))
+        self.assertEqual(self.pixel(fbo, 48, 16), (0, 255, 0, 255))
+
+        # with the same values, nothing is uploaded anymore
+        right['tint'] = [0., 0., 1., 1.]
+        self.draw(fbo)
+        self.assertEqual(self.draw(fbo), 0)
+        self.assertEqual(self.pixel(fbo, 16, 16), (0, 0, 255, 255))
+        self.assertEqual(self.pixel(fbo, 48, 16), (0, 0, 255, 255))
@@ -0,0 +1,47 @@
+'''
+Profiler tests
+==============
+'''
+
+import unittest
+from functools import partial
+
+
+class ProfilerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        from kivy.profiler import ProfilerBase
+        self.profiler = ProfilerBase(size=4)
+
+    def callback(self, dt):
+        pass
+
+    def test_ring_buffer(self):
+        profiler = self.profiler
+        for x in range(6):
+            profiler.add('span%d' % x, 'test', x, 1)
+        self.assertEqual([span[0] for span in profiler.spans],
+                         ['span2', 'span3', 'span4', 'span5'])
+        profiler.start(size=2)
+        self.assertEqual([span[0] for span in profiler.spans],
+                         ['span4', 'span5'])
+
+    def test_callback_name(self):
+        name = self.profiler.get_callback_name
+        self.assertEqual(name(self.callback), 'ProfilerTestCase.callback')
+        self.assertEqual(name(partial(self.callback, 1)),
+                         'ProfilerTestCase.callback')
+        self.assertEqual(name(len), 'len')
+
+    def test_trace(self):
+        profiler = self.profiler
+        profiler.frame = 3
+        profiler.add('Clock.tick', 'clock', 1., .5)
+        profiler.add('Clock.tick', 'clock', 2., .25)
+        event = profiler.to_trace()['traceEvents'][0]
+        self.assertEqual(event['ph'], 'X')
+        self.assertEqual(event['ts'], 1000000.)
+        self.assertEqual(event['dur'], 500000.)
+        self.assertEqual(event['args'], {'frame': 3})
+        self.assertEqual(profiler.get_summary(),
+                         {'Clock.tick': (2, .75, .5)})
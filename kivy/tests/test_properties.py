@@ -391,3 +391,33 @@ class PropertiesTestCase(unittest.TestCase):
 
         bnp.set(wid, -10)
         self.assertEqual(bnp.get(wid), -5)
+
+    def test_stats(self):
+        from kivy import properties
+        from kivy.properties import NumericProperty
+
+        a = NumericProperty(0)
+        a.link(wid, 'stats_a')
+        a.link_deps(wid, 'stats_a')
+        a.bind(wid, lambda obj, value: None)
+        a.bind(wid, lambda obj, value: None)
+
+        properties.clear_stats()
+        properties.start_stats()
+        try:
+            a.set(wid, 1)
+            a.set(wid, 1)
+            a.set(wid, 2)
+        finally:
+            properties.stop_stats()
+        a.set(wid, 3)
+
+        sets, changes, dispatches, duration, observers = \
+            properties.get_stats()[('TestProperty', 'stats_a')]
+        self.assertEqual(sets, 3)
+        self.assertEqual(changes, 2)
+        self.assertEqual(dispatches, 2)
+        self.assertTrue(duration >= 0)
+        self.assertEqual(observers, 2)
+        properties.clear_stats()
+        self.assertEqual(properties.get_stats(), {})
@@ -0,0 +1,23 @@
+'''
+Cached view unit test
+=====================
+'''
+
+from kivy.tests.common import GraphicUnitTest
+
+
+class UIXCachedViewTestCase(GraphicUnitTest):
+
+    def test_cachedview(self):
+        from kivy.uix.cachedview import CachedView
+        from kivy.uix.button import Button
+        r = self.render
+
+        view = CachedView()
+        view.add_widget(Button(text='Cached', size_hint=(.5, .5),
+                               pos_hint={'x': .25, 'y': .25}))
+        r(view)
+
+        view = CachedView(clear_color=(0, 0, 1, 1))
+        view.add_widget(Button(text='Cached', size_hint=(.5, .5)))
+        r(view)
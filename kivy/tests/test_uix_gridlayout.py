@@ -0,0 +1,48 @@
+'''
+Grid layout unit test
+=====================
+'''
+
+import unittest
+
+from kivy.uix.widget import Widget
+from kivy.uix.gridlayout import GridLayout
+
+
+class UIXGridLayoutTestCase(unittest.TestCase):
+
+    def grid(self, sizes, do_layout=True):
+        layout = GridLayout(cols=3, spacing=2, size=(400, 400))
+        for width, height in sizes:
+            layout.add_widget(Widget(size_hint=(None, None),
+                                     size=(width, height)))
+        if do_layout:
+            layout.do_layout()
+        return layout
+
+    def geometry(self, layout):
+        return [tuple(w.pos) + tuple(w.size) for w in layout.children]
+
+    def test_incremental_minimum_size(self):
+        sizes = [(10 * x, 5 * x) for x in range(1, 10)]
+        layout = self.grid(sizes)
+        self.assertEqual(layout.minimum_size, [70 + 80 + 90 + 4,
+                                               15 + 30 + 45 + 4])
+
+        # grow a child
+        child = layout.children[0]
+        child.size = (200, 100)
+        layout.do_layout()
+        sizes[-1] = (200, 100)
+        self.assertEqual(layout.minimum_size, self.grid(sizes).minimum_size)
+        self.assertEqual(self.geometry(layout),
+                         self.geometry(self.grid(sizes)))
+
+    def test_remove_child(self):
+        sizes = [(10 * x, 5 * x) for x in range(1, 10)]
+        layout = self.grid(sizes, do_layout=False)
+        layout.update_minimum_size()
+        layout.remove_widget(layout.children[0])
+        layout.update_minimum_size()
+        self.assertEqual(layout.minimum_size, [70 + 80 + 60 + 4,
+                                               15 + 30 + 40 + 4])
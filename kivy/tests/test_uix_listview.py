@@ -197,3 +197,66 @@ class ListViewTestCase(unittest.TestCase):
         list_view = list_view_modal.lvm
 
         self.assertEqual(len(list_view.adapter.data), 100)
+
+    def test_row_heights(self):
+        from kivy.uix.listview import _RowHeights
+
+        heights = _RowHeights(1000, 25)
+        heights.set(3, 50)
+        heights.set(10, 5)
+
+        self.assertEqual(heights.offset(3), 75)
+        self.assertEqual(heights.offset(4), 125)
+        self.assertEqual(heights.total(), 1000 * 25 + 25 - 20)
+        self.assertEqual(heights.index_at(0), 0)
+        self.assertEqual(heights.index_at(124), 3)
+        self.assertEqual(heights.index_at(125), 4)
+        self.assertEqual(heights.index_at(10 ** 6), 999)
+
+    def test_list_view_recycling(self):
+
+        list_view = ListView(
+                item_strings=[str(index) for index in range(1000)],
+                size=(100, 100))
+        container = list_view.container
+
+        list_view.populate()
+        self.assertEqual(sorted(list_view._views.keys()), [0, 1, 2, 3])
+        self.assertEqual(list_view.row_height, 25)
+        self.assertEqual(container.height, 25000)
+        views = set(id(view) for view in list_view._views.values())
+
+        # the views out of the window are reused for the new rows
+        list_view.populate(500, 503)
+        self.assertEqual(sorted(list_view._views.keys()),
+                         [500, 501, 502, 503])
+        self.assertEqual(
+            set(id(view) for view in list_view._views.values()), views)
+        self.assertEqual(list_view._views[500].text, '500')
+        self.assertEqual(container.children[-1].height, 500 * 25)
+        self.assertEqual(len(container.children), 5)
+
+        # the rows still shown are kept
+        view = list_view._views[502]
+        list_view.populate(502, 505)
+        self.assertTrue(list_view._views[502] is view)
+        self.assertEqual([child.text for child in container.children[:-1]],
+                         ['505', '504', '503', '502'])
+
+    def test_list_view_adapter_switch(self):
+        calls = []
+
+        class CountingListView(ListView):
+            def _data_item_changed(self, adapter, index):
+                calls.append(adapter)
+
+        adapter_a = SimpleListAdapter(data=['a'], cls=Label)
+        adapter_b = SimpleListAdapter(data=['b'], cls=Label)
+        list_view = CountingListView(adapter=adapter_a)
+        list_view.adapter = adapter_b
+        list_view.adapter = adapter_a
+
+        # bound once to the current adapter, not anymore to the previous
+        adapter_a.refresh_data_item(0)
+        adapter_b.refresh_data_item(0)
+        self.assertEqual(calls, [adapter_a])
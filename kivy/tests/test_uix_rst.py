@@ -0,0 +1,79 @@
+'''
+RstDocument tests
+=================
+'''
+
+import unittest
+from hashlib import sha1
+
+from kivy.cache import Cache
+
+RST_TEXT = '''
+Title
+=====
+
+Introduction.
+
+First
+-----
+
+.. _inner:
+
+First paragraph.
+
+Sub
+~~~
+
+Sub paragraph.
+
+Second
+------
+
+Last paragraph.
+'''
+
+
+class RstDocumentTestCase(unittest.TestCase):
+
+    def parse(self):
+        from docutils import utils
+        from docutils.parsers import rst
+        from kivy.uix.rst import RstDocument
+        document = utils.new_document('Document',
+                                      RstDocument()._settings)
+        rst.Parser().parse(RST_TEXT, document)
+        return document
+
+    def test_split_sections(self):
+        from kivy.uix.rst import _split_sections
+        title, sections, refs = _split_sections(self.parse())
+        self.assertEqual(title, 'Title')
+        self.assertEqual([depth for depth, body, length in sections],
+                         [1, 2, 3, 2])
+        self.assertEqual([body[0].astext() for depth, body, length in
+                          sections], ['Title', 'First', 'Sub', 'Second'])
+        for depth, body, length in sections:
+            self.assertEqual(length, sum(len(node.astext()) for node in body))
+        self.assertEqual(refs['title'], 0)
+        self.assertEqual(refs['first'], 1)
+        self.assertEqual(refs['inner'], 1)
+        self.assertEqual(refs['sub'], 2)
+        self.assertEqual(refs['second'], 3)
+
+    def test_lazy_loading_cache(self):
+        from kivy.uix.rst import RstDocument, _split_sections
+        key = sha1(RST_TEXT.encode('utf-8')).hexdigest()
+        Cache.append('kv.rst', key, _split_sections(self.parse()))
+
+        document = RstDocument(lazy_loading=True)
+        document.text = RST_TEXT
+        document._load_lazily()
+        # found in the cache, the text is not parsed again in a thread
+        self.assertIsNone(document._parse_result)
+        self.assertEqual(document.title, 'Title')
+        self.assertEqual(len(document._sections), 4)
+        self.assertEqual(len(document.content.children), 4)
+
+        Cache.remove('kv.rst', key)
+        document._load_lazily()
+        self.assertIsNotNone(document._parse_result)
@@ -0,0 +1,78 @@
+'''
+ScreenManager tests
+===================
+'''
+
+from kivy.tests.common import GraphicUnitTest
+
+
+class ShaderTransitionTestCase(GraphicUnitTest):
+
+    def build(self, **kwargs):
+        from kivy.core.window import Window
+        from kivy.graphics import Color, Rectangle
+        from kivy.uix.screenmanager import ScreenManager, Screen, \
+            FadeTransition
+
+        sm = ScreenManager(transition=FadeTransition(**kwargs),
+                           size=(100, 100))
+        for name in ('a', 'b'):
+            screen = Screen(name=name)
+            with screen.canvas:
+                Color(1, 0, 0)
+                Rectangle(size=(50, 50))
+            sm.add_widget(screen)
+        Window.add_widget(sm)
+        self.addCleanup(Window.remove_widget, sm)
+        return sm
+
+    def draw_frame(self):
+        from kivy.core.window import Window
+        from kivy.clock import Clock
+        Window.render_context.draw()
+        Clock.tick()
+
+    def run_transition(self, sm, name):
+        tr = sm.transition
+        canvas = sm.canvas
+        sm.current = name
+        self.assertTrue(tr.is_active)
+        fbo_in, fbo_out = tr.fbo_in, tr.fbo_out
+        for instr in (fbo_in, fbo_out, tr.render_ctx):
+            self.assertNotEqual(canvas.indexof(instr), -1)
+
+        # with a snapshot, the framebuffers are not drawn anymore once they
+        # have been drawn
+        self.draw_frame()
+        attached = not tr.snapshot
+        self.assertEqual(canvas.indexof(fbo_in) != -1, attached)
+        self.assertEqual(canvas.indexof(fbo_out) != -1, attached)
+        self.assertNotEqual(canvas.indexof(tr.render_ctx), -1)
+        self.assertNotEqual(fbo_in.indexof(tr.screen_in.canvas), -1)
+        self.assertNotEqual(fbo_out.indexof(tr.screen_out.canvas), -1)
+        self.draw_frame()
+        self.assertEqual(canvas.indexof(fbo_in) != -1, attached)
+
+        # the end of the transition removes everything
+        tr.stop()
+        for instr in (fbo_in, fbo_out, tr.render_ctx):
+            self.assertEqual(canvas.indexof(instr), -1)
+        self.assertEqual(fbo_in.indexof(tr.screen_in.canvas), -1)
+        self.assertEqual(fbo_out.indexof(tr.screen_out.canvas), -1)
+        self.assertEqual(sm.children, [sm.get_screen(name)])
+        return fbo_in, fbo_out
+
+    def check_transitions(self, sm):
+        fbo_in, fbo_out = self.run_transition(sm, 'b')
+        render_ctx = sm.transition.render_ctx
+
+        # the framebuffers and the render context are reused
+        fbos = self.run_transition(sm, 'a')
+        self.assertTrue(fbos[0] is fbo_in and fbos[1] is fbo_out)
+        self.assertTrue(sm.transition.render_ctx is render_ctx)
+
+    def test_live_transitions(self):
+        self.check_transitions(self.build())
+
+    def test_snapshot_transitions(self):
+        self.check_transitions(self.build(snapshot=True))
@@ -0,0 +1,62 @@
+'''
+StencilView tests
+=================
+'''
+
+import unittest
+
+from kivy.uix.widget import Widget
+from kivy.uix.scatter import Scatter
+from kivy.uix.stencilview import StencilView
+
+
+class StencilViewTestCase(unittest.TestCase):
+
+    def build(self):
+        view = StencilView(size=(100, 100), culling=True)
+        content = Widget(pos=(0, -900), size=(100, 1000))
+        for y in range(-900, 100, 10):
+            content.add_widget(Widget(pos=(0, y), size=(100, 10)))
+        view.add_widget(content)
+        return view, content
+
+    def test_culling(self):
+        view, content = self.build()
+        view._update_culling()
+        self.assertFalse(content.canvas.culled)
+        visible = [w for w in content.children if not w.canvas.culled]
+        self.assertEqual(len(visible), 10)
+        for widget in visible:
+            self.assertTrue(0 <= widget.y < 100)
+
+        # scroll the content
+        content.y = -500
+        for index, widget in enumerate(reversed(content.children)):
+            widget.y = -500 + index * 10
+        view._update_culling()
+        visible = [w for w in content.children if not w.canvas.culled]
+        self.assertEqual(len(visible), 10)
+        for widget in visible:
+            self.assertTrue(0 <= widget.y < 100)
+
+    def test_culling_rotated(self):
+        view = StencilView(size=(100, 100), culling=True)
+        scatter = Scatter(size=(100, 100), rotation=45)
+        scatter.center = view.center
+        # partially visible in the view, and visible in the scatter
+        widget = Widget(pos=(40, 40), size=(20, 20))
+        scatter.add_widget(widget)
+        view.add_widget(scatter)
+        view._update_culling()
+        self.assertFalse(scatter.canvas.culled)
+        self.assertFalse(widget.canvas.culled)
+
+    def test_culling_default(self):
+        self.assertFalse(StencilView().culling)
+
+    def test_no_culling(self):
+        view, content = self.build()
+        view.culling = False
+        view._update_culling()
+        for widget in content.children:
+            self.assertFalse(widget.canvas.culled)
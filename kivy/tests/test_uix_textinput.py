@@ -0,0 +1,101 @@
+'''
+TextInput tests
+===============
+'''
+
+import unittest
+
+from kivy.graphics import Rectangle
+from kivy.uix.textinput import TextInput, FL_IS_NEWLINE
+
+
+class TextInputTestCase(unittest.TestCase):
+
+    def build(self, count):
+        self.text = u'\n'.join(u'line %d' % x for x in range(count))
+        return TextInput(text=self.text, size=(300, 100), pos=(0, 0))
+
+    def max_rows(self, ti):
+        # the rows fully or partially shown in the viewport
+        dy = ti.line_height + ti._line_spacing
+        height = ti.height - ti.padding[1] - ti.padding[3]
+        return int(height / dy) + 2
+
+    def shown_rows(self, ti):
+        ti._update_graphics()
+        return sorted(ti._lines_rects)
+
+    def check_lines(self, ti, text):
+        self.assertEqual(ti.text, text)
+        self.assertEqual(ti._lines, text.split(u'\n'))
+        self.assertEqual(len(ti._lines_flags), len(ti._lines))
+        self.assertEqual([flags & FL_IS_NEWLINE for flags in ti._lines_flags],
+                         [0] + [FL_IS_NEWLINE] * (len(ti._lines) - 1))
+
+    def test_visible_lines(self):
+        ti = self.build(1000)
+        self.assertEqual(len(ti._lines), 1000)
+
+        rows = self.shown_rows(ti)
+        self.assertEqual(rows[0], 0)
+        self.assertEqual(rows, list(range(rows[0], rows[-1] + 1)))
+        self.assertTrue(len(rows) <= self.max_rows(ti))
+
+        # scrolled in the middle of the text
+        dy = ti.line_height + ti._line_spacing
+        ti.scroll_y = 500 * dy
+        rows = self.shown_rows(ti)
+        self.assertTrue(rows[0] in (499, 500))
+        self.assertEqual(rows, list(range(rows[0], rows[-1] + 1)))
+        self.assertTrue(len(rows) <= self.max_rows(ti))
+
+        # the rectangles are reused
+        self.assertTrue(len(ti._lines_rects_pool) <= self.max_rows(ti))
+
+    def test_insert_delete(self):
+        ti = self.build(20)
+        text = self.text
+
+        # insert lines in the middle of a line
+        ti.cursor = (3, 10)
+        index = ti.cursor_index()
+        ti.insert_text(u'a\nb\nc')
+        text = text[:index] + u'a\nb\nc' + text[index:]
+        self.check_lines(ti, text)
+        self.assertEqual(len(ti._lines), 22)
+
+        # delete a selection over several lines
+        start, end = text.index(u'line 4'), text.index(u'line 8')
+        ti.select_text(start, end)
+        ti.delete_selection()
+        text = text[:start] + text[end:]
+        self.check_lines(ti, text)
+        self.assertEqual(len(ti._lines), 18)
+
+        # join two lines
+        ti.cursor = (0, 5)
+        index = ti.cursor_index()
+        ti.do_backspace()
+        text = text[:index - 1] + text[index:]
+        self.check_lines(ti, text)
+        self.assertEqual(len(ti._lines), 17)
+
+    def test_selection_rows(self):
+        ti = self.build(1000)
+        ti.select_all()
+        rows = self.shown_rows(ti)
+
+        # one selection rectangle per shown row, not per selected line
+        rects = [instr for instr in ti.canvas.get_group('selection')
+                 if isinstance(instr, Rectangle)]
+        self.assertEqual(len(rects), len(rows))
+        for rect in rects:
+            self.assertTrue(rect.pos[1] + rect.size[1] >= ti.y)
+            self.assertTrue(rect.pos[1] <= ti.top)
+
+        # a selection out of the viewport is not drawn
+        ti.select_text(self.text.index(u'line 900'), len(self.text))
+        ti._update_graphics()
+        rects = [instr for instr in ti.canvas.get_group('selection')
+                 if isinstance(instr, Rectangle)]
+        self.assertEqual(rects, [])
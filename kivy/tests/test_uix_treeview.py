@@ -0,0 +1,82 @@
+'''
+TreeView tests
+==============
+'''
+
+import unittest
+
+from kivy.uix.scatter import Scatter
+from kivy.uix.stencilview import StencilView
+from kivy.uix.treeview import TreeView, TreeViewLabel
+
+
+class TreeViewTestCase(unittest.TestCase):
+
+    def build(self, **kwargs):
+        tv = TreeView(hide_root=True, **kwargs)
+        self.folders = []
+        for x in range(10):
+            folder = tv.add_node(TreeViewLabel(text='Folder %d' % x))
+            self.folders.append(folder)
+            for y in range(100):
+                tv.add_node(TreeViewLabel(text='Entry %d' % y), folder)
+        return tv
+
+    def test_virtualized_rows(self):
+        tv = self.build(virtualized=True, row_height=20, size=(200, 100))
+        tv._do_layout()
+        self.assertEqual(tv.minimum_height, 10 * 20)
+        self.assertEqual(len(tv.children), 6)
+
+        tv.toggle_node(self.folders[0])
+        tv._do_layout()
+        self.assertEqual(tv.minimum_height, 110 * 20)
+        self.assertEqual(
+            tv._rows, list(tv.iterate_open_nodes())[:len(tv._rows)])
+        self.assertEqual(len(tv._rows), 110)
+        self.assertTrue(len(tv.children) <= 6)
+
+        tv.toggle_node(self.folders[0])
+        tv._do_layout()
+        self.assertEqual(tv._rows, self.folders)
+
+    def test_virtualized_node_at_pos(self):
+        tv = self.build(virtualized=True, row_height=20, size=(200, 200))
+        tv.toggle_node(self.folders[1])
+        tv._do_layout()
+        node = tv.get_node_at_pos((tv.x + 50, tv.top - 10))
+        self.assertIs(node, self.folders[0])
+        node = tv.get_node_at_pos((tv.x + 50, tv.top - 50))
+        self.assertIs(node, self.folders[1].nodes[0])
+        self.assertIsNone(tv.get_node_at_pos((tv.right + 10, tv.top - 10)))
+
+    def test_virtualized_in_scatter(self):
+        tv = self.build(virtualized=True, row_height=20, size=(200, 2200))
+        tv.toggle_node(self.folders[0])
+        scatter = Scatter(size=(200, 2200), pos=(0, 100 - 2200))
+        scatter.add_widget(tv)
+        view = StencilView(size=(200, 100))
+        view.add_widget(scatter)
+        self.assertIs(tv._viewport, view)
+        tv._do_layout()
+        self.assertEqual(len(tv.children), 6)
+        self.assertIn(self.folders[0], tv.children)
+
+        # scrolled by moving the scatter, the tree is not moved
+        scatter.y += 1000
+        tv._do_layout()
+        self.assertEqual(len(tv.children), 6)
+        self.assertNotIn(self.folders[0], tv.children)
+
+    def test_virtualized_nodes_reset(self):
+        tv = self.build(virtualized=True, row_height=20, size=(200, 100))
+        tv._do_layout()
+        tv.root.nodes = []
+        tv._do_layout()
+        self.assertEqual(tv._rows, [])
+        self.assertEqual(len(tv.children), 0)
+
+    def test_not_virtualized(self):
+        tv = self.build(size=(200, 100))
+        tv._do_layout()
+        self.assertEqual(len(tv.children), 10)
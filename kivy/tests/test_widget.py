@@ -64,3 +64,26 @@ class WidgetTestCase(unittest.TestCase):
         self.assertEqual(wid.collide_point(100, 100), True)
         self.assertEqual(wid.collide_point(200, 0), False)
         self.assertEqual(wid.collide_point(500, 500), False)
+
+    def test_touch_index(self):
+        from kivy.input.motionevent import MotionEvent
+
+        class FakeMotionEvent(MotionEvent):
+            pass
+
+        received = []
+        root = self.root
+        root.touch_index = True
+        children = [self.cls(pos=(x * 50, 0), size=(60, 60))
+                    for x in range(4)]
+        for child in children:
+            child.bind(on_touch_down=lambda wid, touch: received.append(wid))
+            root.add_widget(child)
+        touch = FakeMotionEvent('fake', 1, [])
+        touch.pos = (55, 10)
+        root.dispatch('on_touch_down', touch)
+        self.assertEqual(received, [children[1], children[0]])
+        del received[:]
+        children[3].x = 40
+        root.dispatch('on_touch_down', touch)
+        self.assertEqual(received, [children[3], children[1], children[0]])
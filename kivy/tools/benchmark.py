@@ -2,24 +2,50 @@
 Benchmark
 =========
 
+Run all the benchmarks, or the ones whose name contains one of the
+arguments::
+
+    python -m kivy.tools.benchmark
+    python -m kivy.tools.benchmark --repeat 20 label clock
+
+Each benchmark is run `--warmup` times, then timed `--repeat` times, with the
+garbage collector disabled. The median and the 95th percentile of the runs are
+reported. The random generator is seeded, so two runs use the same data.
+
+Save the results in JSON, and compare a later run against them. The
+benchmarks whose median is slower than the baseline by more than
+`--threshold` (10% by default) are reported, and the exit code is 1::
+
+    python -m kivy.tools.benchmark --json baseline.json
+    python -m kivy.tools.benchmark --baseline baseline.json
+
+The benchmark can be run without a GPU, on Mesa's software renderer::
+
+    LIBGL_ALWAYS_SOFTWARE=1 python -m kivy.tools.benchmark
+
+or without any display, with the offscreen window provider::
+
+    KIVY_WINDOW=offscreen python -m kivy.tools.benchmark
+
 '''
 
 from __future__ import print_function
 
-benchmark_version = '1'
+benchmark_version = '2'
 
 import os
 import sys
 import json
 import kivy
 import gc
+from argparse import ArgumentParser
 from time import clock, time, ctime
-from random import randint
+from random import randint, seed
 
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.widget import Widget
-from kivy.graphics import RenderContext
+from kivy.graphics import RenderContext, Canvas, Color, Rectangle
 from kivy.input.motionevent import MotionEvent
 from kivy.cache import Cache
 from kivy.clock import Clock
@@ -105,8 +131,8 @@ class bench_button_creation:
 
     def __init__(self):
         labels = []
-        for x in xrange(10000):
-            button = map(lambda x: chr(randint(ord('a'), ord('z'))), xrange(10))
+        for x in range(10000):
+            button = [chr(randint(ord('a'), ord('z'))) for x in range(10)]
             labels.append(''.join(button))
         self.labels = labels
 
@@ -139,8 +165,8 @@ class bench_button_creation_with_tick:
 
     def __init__(self):
         labels = []
-        for x in xrange(10000):
-            button = map(lambda x: chr(randint(ord('a'), ord('z'))), xrange(10))
+        for x in range(10000):
+            button = [chr(randint(ord('a'), ord('z'))) for x in range(10)]
             labels.append(''.join(button))
         self.labels = labels
 
@@ -152,29 +178,274 @@ class bench_button_creation_with_tick:
         Clock.tick()
 
 
-if __name__ == '__main__':
+class bench_property_dispatch:
+    '''Property: set and dispatch (100000 NumericProperty changes)'''
+
+    def __init__(self):
+        from kivy.event import EventDispatcher
+        from kivy.properties import NumericProperty
+
+        class Sample(EventDispatcher):
+            value = NumericProperty(0)
+
+        self.obj = Sample()
+        self.obj.bind(value=self.callback)
+
+    def callback(self, instance, value):
+        pass
+
+    def run(self):
+        obj = self.obj
+        for x in range(100000):
+            obj.value = x
+
+
+class bench_clock_schedule:
+    '''Clock: schedule_once and tick (10000 callbacks)'''
+
+    def callback(self, dt):
+        pass
+
+    def run(self):
+        callback = self.callback
+        for x in range(10000):
+            Clock.schedule_once(callback)
+        Clock.tick()
+
+
+_bench_kv = '''
+<BenchWidget@Widget>:
+    label: label
+    canvas:
+        Color:
+            rgba: 1, 1, 1, .5
+        Rectangle:
+            pos: self.pos
+            size: self.size
+    Label:
+        id: label
+        text: 'hello'
+        pos: root.pos
+        size: root.width / 2., root.height
+'''
+
+
+class bench_kv_parse:
+    '''Lang: parsing (100 times a kv rule)'''
+
+    def run(self):
+        from kivy.lang import Parser
+        for x in range(100):
+            Parser(content=_bench_kv)
+
+
+class bench_kv_apply:
+    '''Lang: rule application (1000 widgets with a kv rule)'''
+
+    def __init__(self):
+        from kivy.lang import Builder
+        from kivy.factory import Factory
+        Builder.load_string(_bench_kv, filename='bench_kv_apply')
+        self.cls = Factory.BenchWidget
+
+    def run(self):
+        cls = self.cls
+        for x in range(1000):
+            cls()
+
+
+class bench_layout_box:
+    '''Layout: BoxLayout pass (100 layouts of 1000 children)'''
+
+    def __init__(self):
+        from kivy.uix.boxlayout import BoxLayout
+        self.layout = layout = BoxLayout()
+        for x in range(1000):
+            layout.add_widget(Widget())
+
+    def run(self):
+        layout = self.layout
+        for x in range(100):
+            layout.width += 1
+            layout.do_layout()
+
+
+class bench_text_render:
+    '''Text: core label rendering (1000 labels of 10 a-z)'''
+
+    def __init__(self):
+        self.texts = [''.join([chr(randint(ord('a'), ord('z')))
+                               for y in range(10)]) for x in range(1000)]
+
+    def run(self):
+        from kivy.core.text import Label as CoreLabel
+        for text in self.texts:
+            CoreLabel(text=text).refresh()
+
+
+class bench_image_decode:
+    '''Image: decoding (100 png 256x256)'''
+
+    def __init__(self):
+        from os.path import join
+        self.filename = join(kivy.kivy_data_dir, 'logo', 'kivy-icon-256.png')
+
+    def run(self):
+        from kivy.core.image import ImageLoader
+        for x in range(100):
+            ImageLoader.load(self.filename, nocache=True)
+
+
+class bench_canvas_compile:
+    '''Graphics: canvas compilation (1000 Color + Rectangle)'''
+
+    def __init__(self):
+        self.ctx = RenderContext()
+        self.canvas = Canvas()
+        self.ctx.add(self.canvas)
+
+    def run(self):
+        canvas = self.canvas
+        canvas.clear()
+        with canvas:
+            for x in range(1000):
+                Color(1, 1, 1, x / 1000.)
+                Rectangle(pos=(x, x), size=(10, 10))
+        self.ctx.draw()
+
+
+class bench_texture_blit:
+    '''Texture: blit_buffer upload (100 frames 640x480 rgb)'''
+
+    def __init__(self):
+        from kivy.graphics.texture import Texture
+        self.texture = Texture.create(size=(640, 480), colorfmt='rgb')
+        self.frames = [bytes(bytearray([x]) * (640 * 480 * 3))
+                       for x in range(4)]
+
+    def run(self):
+        texture = self.texture
+        frames = self.frames
+        for x in range(100):
+            texture.blit_buffer(frames[x % 4], colorfmt='rgb')
+            texture.bind()
+
+
+class bench_texture_stream:
+    '''Texture: TextureStream upload (100 frames 640x480 rgb)'''
+
+    def __init__(self):
+        from kivy.graphics.texture import TextureStream
+        self.stream = TextureStream(size=(640, 480), colorfmt='rgb')
+        self.frames = [bytes(bytearray([x]) * (640 * 480 * 3))
+                       for x in range(4)]
+
+    def run(self):
+        stream = self.stream
+        frames = self.frames
+        for x in range(100):
+            stream.write(frames[x % 4])
+            stream.swap()
+            stream.texture.bind()
+
+
+class bench_input_dispatch:
+    '''Input: queue and dispatch (100 frames, 10 touches at 20 updates)'''
+
+    def __init__(self):
+        from kivy.base import EventLoopBase
+        self.touches = [FakeMotionEvent('fake', x, []) for x in range(10)]
+        self.loop = loop = EventLoopBase()
+        loop.add_input_provider(self)
+
+    def update(self, dispatch_fn):
+        for x in range(20):
+            for touch in self.touches:
+                dispatch_fn('update', touch)
+
+    def run(self):
+        dispatch_input = self.loop.dispatch_input
+        for x in range(100):
+            dispatch_input()
+
+
+def percentile(values, ratio):
+    '''Return the value at `ratio` (0-1) of the sorted `values`, with linear
+    interpolation.
+    '''
+    values = sorted(values)
+    pos = (len(values) - 1) * ratio
+    low = int(pos)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (pos - low)
+
+
+def run_bench(cls, warmup, repeat):
+    '''Instanciate and run the benchmark `cls`, and return the durations of
+    the timed runs.
+    '''
+    # clean cache to prevent weird case
+    for cat in Cache._categories:
+        Cache.remove(cat)
+    # same data for every run
+    seed(0)
+    test = cls()
+    for x in range(warmup):
+        test.run()
+    durations = []
+    gc.collect()
+    gc.disable()
+    try:
+        for x in range(repeat):
+            start = clockfn()
+            test.run()
+            durations.append(clockfn() - start)
+    finally:
+        gc.enable()
+    return durations
+
+
+def compare(results, baseline, threshold):
+    '''Return the (name, ratio) of the benchmarks whose median is slower than
+    in the `baseline` by more than `threshold`.
+    '''
+    regressions = []
+    reference = baseline['benchmarks']
+    for name, result in sorted(results.items()):
+        if name not in reference or not reference[name]['median']:
+            continue
+        ratio = result['median'] / reference[name]['median']
+        if ratio > 1. + threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = ArgumentParser(description='Kivy benchmark')
+    parser.add_argument('names', nargs='*',
+                        help='run only the benchmarks containing these names')
+    parser.add_argument('--warmup', type=int, default=1,
+                        help='untimed runs before measuring (default: 1)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='timed runs (default: 5)')
+    parser.add_argument('--json', help='save the results in this file')
+    parser.add_argument('--baseline', help='compare with this JSON file')
+    parser.add_argument('--threshold', type=float, default=.1,
+                        help='regression threshold of the median '
+                        '(default: 0.1)')
+    args = parser.parse_args(argv)
 
     report = []
-    report_newline = True
-
-    def log(s, newline=True):
-        global report_newline
-        if not report_newline:
-            report[-1] = '%s %s' % (report[-1], s)
-        else:
-            report.append(s)
-        if newline:
-            print(s)
-            report_newline = True
-        else:
-            print(s, end=' ')
-            report_newline = False
+
+    def log(s):
+        report.append(s)
+        print(s)
         sys.stdout.flush()
 
-    clock_total = 0
-    benchs = list(locals().keys())
-    benchs.sort()
-    benchs = [locals()[x] for x in benchs if x.startswith('bench_')]
+    benchs = sorted(name for name in globals() if name.startswith('bench_'))
+    if args.names:
+        benchs = [name for name in benchs
+                  if any(x in name for x in args.names)]
 
     log('')
     log('=' * 70)
@@ -197,76 +468,101 @@ if __name__ == '__main__':
     log('-------------------')
 
     from kivy.core.gl import glGetString, GL_VENDOR, GL_RENDERER, GL_VERSION
-    log('GL Vendor: %s' % glGetString(GL_VENDOR))
-    log('GL Renderer: %s' % glGetString(GL_RENDERER))
-    log('GL Version: %s' % glGetString(GL_VERSION))
+    gl_info = {
+        'vendor': str(glGetString(GL_VENDOR)),
+        'renderer': str(glGetString(GL_RENDERER)),
+        'version': str(glGetString(GL_VERSION))}
+    log('GL Vendor: %s' % gl_info['vendor'])
+    log('GL Renderer: %s' % gl_info['renderer'])
+    log('GL Version: %s' % gl_info['version'])
     log('')
 
-    log('Benchmark')
+    log('Benchmark (warmup %d, repeat %d)' % (args.warmup, args.repeat))
     log('---------')
+    log('%-5s %-56s %10s %10s' % ('', '', 'median', 'p95'))
 
-    for x in benchs:
-        # clean cache to prevent weird case
-        for cat in Cache._categories:
-            Cache.remove(cat)
-
-        # force gc before next test
-        gc.collect()
-
-        log('%2d/%-2d %-60s' % (benchs.index(x) + 1,
-            len(benchs), x.__doc__), False)
+    results = {}
+    for index, name in enumerate(benchs):
+        cls = globals()[name]
+        title = '%2d/%-2d %-56s' % (index + 1, len(benchs), cls.__doc__)
         try:
-            sys.stderr.write('.')
-            test = x()
+            durations = run_bench(cls, args.warmup, args.repeat)
         except Exception as e:
-            log('failed %s' % str(e))
+            log('%s failed %s' % (title, e))
             import traceback
             traceback.print_exc()
             continue
+        results[name] = result = {
+            'title': cls.__doc__,
+            'median': percentile(durations, .5),
+            'p95': percentile(durations, .95),
+            'min': min(durations),
+            'durations': durations}
+        log('%s %10.6f %10.6f' % (title, result['median'], result['p95']))
 
-        clock_start = clockfn()
+    log('')
+    log('Result: %.6f' % sum(x['median'] for x in results.values()))
+    log('')
+
+    if args.json:
+        with open(args.json, 'w') as fd:
+            json.dump({
+                'version': benchmark_version,
+                'kivy': kivy.__version__,
+                'python': sys.version,
+                'platform': sys.platform,
+                'gl': gl_info,
+                'warmup': args.warmup,
+                'repeat': args.repeat,
+                'benchmarks': results}, fd, indent=2, sort_keys=True)
+        log('Results saved in %s' % args.json)
+
+    if args.baseline:
+        with open(args.baseline) as fd:
+            baseline = json.load(fd)
+        regressions = compare(results, baseline, args.threshold)
+        log('Comparison with %s' % args.baseline)
+        for name, ratio in regressions:
+            log('REGRESSION %-50s %+.1f%%' % (name, (ratio - 1.) * 100))
+        if not regressions:
+            log('No regression')
+        return 1 if regressions else 0
+
+    if args.json or not sys.stdin.isatty():
+        return 0
+
+    try:
+        reply = input(
+            'Do you want to send benchmark to gist.github.com (Y/n) : ')
+    except EOFError:
+        return 0
+
+    if reply.lower().strip() in ('', 'y'):
+        print('Please wait while sending the benchmark...')
 
         try:
-            sys.stderr.write('.')
-            test.run()
-            clock_end = clockfn() - clock_start
-            log('%.6f' % clock_end)
-        except Exception as e:
-            log('failed %s' % str(e))
-            continue
+            import requests
+        except ImportError:
+            print("`requests` module not found, no benchmark posted.")
+            return 1
 
-        clock_total += clock_end
+        payload = {
+            'public': True, 'files': {
+                'benchmark.txt': {
+                    'content': '\n'.join(report)}}}
 
-    log('')
-    log('Result: %.6f' % clock_total)
-    log('')
+        r = requests.post('https://api.github.com/gists',
+                          data=json.dumps(payload))
 
-try:
-    reply = input(
-        'Do you want to send benchmark to gist.github.com (Y/n) : ')
-except EOFError:
-    sys.exit(0)
+        print()
+        print()
+        print('REPORT posted at {0}'.format(r.json['html_url']))
+        print()
+        print()
+    else:
+        print('No benchmark posted.')
+    return 0
 
-if reply.lower().strip() in ('', 'y'):
-    print('Please wait while sending the benchmark...')
 
-    try:
-        import requests
-    except ImportError:
-        print("`requests` module not found, no benchmark posted.")
-        sys.exit(1)
-
-    payload = {
-        'public': True, 'files': {
-            'benchmark.txt': {
-                'content': '\n'.join(report)}}}
-
-    r = requests.post('https://api.github.com/gists', data=json.dumps(payload))
-
-    print()
-    print()
-    print('REPORT posted at {0}'.format(r.json['html_url']))
-    print()
-    print()
-else:
-    print('No benchmark posted.')
+if __name__ == '__main__':
+    sys.exit(main())
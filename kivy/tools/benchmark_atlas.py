@@ -0,0 +1,78 @@
+'''
+Atlas benchmark
+===============
+
+Generate a deterministic set of sprites, pack them with
+:meth:`~kivy.atlas.Atlas.create`, and report the runtime and the fill ratio
+of the atlas images::
+
+    $ python -m kivy.tools.benchmark_atlas [count] [size]
+
+The sprites have random sizes and transparent borders, from a fixed seed, so
+two runs on the same machine can be compared.
+'''
+
+from __future__ import print_function
+
+import sys
+import shutil
+import tempfile
+from os.path import join
+from random import Random
+from time import time
+
+from kivy.atlas import Atlas
+
+
+def generate_sprites(directory, count, seed=0):
+    '''Create `count` png sprites into `directory`, and return their
+    filenames.
+    '''
+    from PIL import Image
+    rnd = Random(seed)
+    filenames = []
+    for index in range(count):
+        w, h = rnd.randint(8, 96), rnd.randint(8, 96)
+        im = Image.new('RGBA', (w, h))
+        # opaque content with a random transparent border
+        left, top = rnd.randint(0, w // 4), rnd.randint(0, h // 4)
+        right, bottom = w - rnd.randint(0, w // 4), h - rnd.randint(0, h // 4)
+        color = (rnd.randint(0, 255), rnd.randint(0, 255),
+                 rnd.randint(0, 255), 255)
+        im.paste(color, (left, top, right, bottom))
+        filename = join(directory, 'sprite%05d.png' % index)
+        im.save(filename)
+        filenames.append(filename)
+    return filenames
+
+
+def fill_ratio(meta, size):
+    '''Return the ratio of the atlas images area used by the sprites.
+    '''
+    used = sum(coords[2] * coords[3] for ids in meta.values()
+               for coords in ids.values())
+    return used / float(len(meta) * size * size)
+
+
+def run(count=1000, size=1024):
+    directory = tempfile.mkdtemp()
+    try:
+        filenames = generate_sprites(directory, count)
+        results = {}
+        for trim in (False, True):
+            start = time()
+            outfn, meta = Atlas.create(join(directory, 'atlas'), filenames,
+                                       size, trim=trim)
+            results[trim] = time() - start, len(meta), fill_ratio(meta, size)
+        return results
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 1024
+    print('Atlas benchmark: %d sprites, %dx%d images' % (count, size, size))
+    for trim, (duration, pages, ratio) in sorted(run(count, size).items()):
+        print('trim=%-5s %8.3fs %3d image(s) fill ratio %.3f' % (
+            trim, duration, pages, ratio))
@@ -0,0 +1,117 @@
+'''
+Cached View
+===========
+
+.. versionadded:: 1.8.0
+
+The :class:`CachedView` draws its children once into a
+:class:`~kivy.graphics.fbo.Fbo`, and then only draws the texture of the
+framebuffer, with a single rectangle. Use it for a part of the interface that
+is costly to draw but rarely changes, like a complex panel or a long
+document::
+
+    from kivy.uix.cachedview import CachedView
+
+    view = CachedView(size_hint=(None, None), size=(400, 2000))
+    view.add_widget(RstDocument(text=long_text))
+
+The framebuffer is redrawn at the next frame when any instruction of the
+children is updated, or when the size of the view changes. Moving the view,
+for example in a :class:`~kivy.uix.scrollview.ScrollView`, only moves the
+rectangle.
+
+Like a :class:`~kivy.uix.relativelayout.RelativeLayout`, the children are
+positioned relatively to the view. Anything drawn outside of the view is
+clipped.
+
+.. note::
+
+    The framebuffer is cleared with :data:`CachedView.clear_color` before
+    drawing the children. The default is fully transparent, which changes
+    slightly how the semi-transparent parts of the children are blended.
+    Use an opaque color if the view has an opaque background.
+
+.. warning::
+
+    The framebuffer uses ``width * height * 4`` bytes of video memory. Don't
+    cache a view that changes at every frame, like an animation: it would be
+    drawn twice.
+
+'''
+
+__all__ = ('CachedView', )
+
+from kivy.uix.relativelayout import RelativeLayout
+from kivy.properties import ListProperty
+from kivy.graphics import Canvas, Fbo, Color, Rectangle, ClearColor, \
+    ClearBuffers
+
+
+class CachedView(RelativeLayout):
+    '''CachedView class. See module documentation for more information.
+    '''
+
+    clear_color = ListProperty([0, 0, 0, 0])
+    '''Color used to clear the framebuffer before drawing the children, in
+    the (r, g, b, a) format.
+
+    :data:`clear_color` is a :class:`~kivy.properties.ListProperty`, default
+    to [0, 0, 0, 0].
+    '''
+
+    def __init__(self, **kwargs):
+        self.canvas = Canvas()
+        with self.canvas:
+            self._fbo = Fbo(size=self._get_fbo_size())
+            Color(1, 1, 1, 1)
+            self._fbo_rect = Rectangle(size=self.size,
+                                       texture=self._fbo.texture)
+        with self._fbo.before:
+            self._fbo_clear_color = ClearColor(*self.clear_color)
+            ClearBuffers()
+        super(CachedView, self).__init__(**kwargs)
+        self.bind(size=self._update_fbo, clear_color=self._update_clear_color)
+        self._update_fbo()
+
+    def _get_fbo_size(self):
+        return max(1, int(self.width)), max(1, int(self.height))
+
+    def _update_fbo(self, *largs):
+        fbo = self._fbo
+        fbo.size = self._get_fbo_size()
+        # the texture is recreated when the framebuffer is resized
+        self._fbo_rect.texture = fbo.texture
+        self._fbo_rect.size = fbo.size
+
+    def _update_clear_color(self, instance, value):
+        self._fbo_clear_color.rgba = value
+
+    @property
+    def texture(self):
+        '''Texture of the framebuffer where the children are drawn.
+        '''
+        return self._fbo.texture
+
+    def invalidate(self):
+        '''Force the children to be drawn again in the framebuffer at the next
+        frame. This is only needed if the children use OpenGL directly, with a
+        :class:`~kivy.graphics.instructions.Callback`.
+        '''
+        self._fbo.ask_update()
+
+    def add_widget(self, widget, index=0):
+        # draw the children into the framebuffer instead of our canvas
+        canvas = self.canvas
+        self.canvas = self._fbo
+        try:
+            super(CachedView, self).add_widget(widget, index)
+        finally:
+            self.canvas = canvas
+
+    def remove_widget(self, widget):
+        canvas = self.canvas
+        self.canvas = self._fbo
+        try:
+            super(CachedView, self).remove_widget(widget)
+        finally:
+            self.canvas = canvas
@@ -15,6 +15,14 @@ FileChooser
     You must update all the notation `root.controller.xxx` to
     `root.controller().xxx`.
 
+.. versionchanged:: 1.8.0
+    The files of a directory are listed, filtered and sorted in a thread,
+    and the entries are added to the view as they are created. The callable
+    :data:`~FileChooserController.filters` and the
+    :data:`~FileChooserController.sort_func` are called from that thread. The
+    result is cached until the modification time of the directory changes,
+    so going back to a directory is immediate.
+
 Simple example
 --------------
 
@@ -37,6 +45,8 @@ __all__ = ('FileChooserListView', 'FileChooserIconView',
 
 from weakref import ref
 from time import time
+from threading import Thread
+from kivy.cache import Cache
 from kivy.clock import Clock
 from kivy.lang import Builder
 from kivy.logger import Logger
@@ -47,14 +57,22 @@ from kivy.properties import (
     NumericProperty)
 from os import listdir
 from os.path import (
-    basename, getsize, isdir, join, sep, normpath, expanduser, altsep,
-    splitdrive, realpath)
+    basename, getsize, getmtime, isdir, join, sep, normpath, expanduser,
+    altsep, splitdrive, realpath)
 from fnmatch import fnmatch
 import collections
 
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
+
 platform = core_platform()
 filesize_units = ('B', 'KB', 'MB', 'GB', 'TB')
 
+# files listed per directory, until the directory is modified
+Cache.register('kv.filechooser', timeout=60)
+
 _have_win32file = False
 if platform == 'win':
     # Import that module here as it's not available on non-windows machines.
@@ -87,6 +105,24 @@ def is_hidden_win(fn):
         return True
 
 
+def _listdir(path):
+    # return the names of the files in path, and the names of the directories
+    # among them. scandir() knows the type of the files without a stat().
+    if scandir is None:
+        names = listdir(path)
+        return names, set(fn for fn in names if isdir(join(path, fn)))
+    names = []
+    dirs = set()
+    for entry in scandir(path):
+        names.append(entry.name)
+        try:
+            if entry.is_dir():
+                dirs.add(entry.name)
+        except OSError:
+            pass
+    return names, dirs
+
+
 def alphanumeric_folders_first(files):
     return (sorted(f for f in files if isdir(f)) +
             sorted(f for f in files if not isdir(f)))
@@ -439,11 +475,12 @@ class FileChooserController(FloatLayout):
         # trigger to start gathering the files in the new directory
         # we'll start a timer that will do the job, 10 times per frames
         # (default)
-        self._gitems = []
+        self._gitems = None
         self._gitems_parent = kwargs.get('parent', None)
         self._gitems_gen = self._generate_file_entries(
             path=kwargs.get('path', self.path),
             parent=self._gitems_parent)
+        self._gitems_start = time()
 
         # cancel any previous clock if exist
         Clock.unschedule(self._create_files_entries)
@@ -452,45 +489,61 @@ class FileChooserController(FloatLayout):
         self._hide_progress()
         if self._create_files_entries():
             # not enough for creating all the entries, all a clock to continue
-            # start a timer for the next 100 ms
-            Clock.schedule_interval(self._create_files_entries, .1)
+            # at the next frame
+            Clock.schedule_interval(self._create_files_entries, 0)
 
     def _create_files_entries(self, *args):
         # create maximum entries during 50ms max, or 10 minimum (slow system)
         # (on a "fast system" (core i7 2700K), we can create up to 40 entries
         # in 50 ms. So 10 is fine for low system.
         start = time()
-        finished = False
+        finished = waiting = False
         index = total = count = 1
+        items = []
         while time() - start < 0.05 or count < 10:
             try:
                 index, total, item = next(self._gitems_gen)
-                self._gitems.append(item)
-                count += 1
             except StopIteration:
                 finished = True
                 break
+            if item is None:
+                # the files are still listed in the thread
+                waiting = True
+                break
+            items.append(item)
+            count += 1
 
-        # if this wasn't enough for creating all the entries, show a progress
-        # bar, and report the activity to the user.
+        # push the entries created on the view
+        parent = self._gitems_parent
+        if (items or finished) and self._gitems is None:
+            self._items = self._gitems = []
+            if parent is None:
+                self.dispatch('on_entries_cleared')
+            else:
+                parent.entries[:] = []
+        if items:
+            self._gitems.extend(items)
+            if parent is None:
+                for entry in items:
+                    self.dispatch('on_entry_added', entry, parent)
+            else:
+                parent.entries.extend(items)
+                for entry in items:
+                    self.dispatch('on_subentry_to_entry', entry, parent)
+
+        # if the files are not listed yet, show a progress bar, and report
+        # the activity to the user.
         if not finished:
-            self._show_progress()
-            self._progress.total = total
-            self._progress.index = index
+            if waiting and time() - self._gitems_start > .05:
+                self._show_progress()
+                self._progress.total = total
+                self._progress.index = index
+            else:
+                self._hide_progress()
             return True
 
-        # we created all the files, now push them on the view
-        self._items = items = self._gitems
-        parent = self._gitems_parent
-        if parent is None:
-            self.dispatch('on_entries_cleared')
-            for entry in items:
-                self.dispatch('on_entry_added', entry, parent)
-        else:
-            parent.entries[:] = items
-            for entry in items:
-                self.dispatch('on_subentry_to_entry', entry, parent)
-        self.files[:] = [file.path for file in items]
+        # we created all the files
+        self.files[:] = [file.path for file in self._gitems]
 
         # stop the progression / creation
         self._hide_progress()
@@ -568,25 +621,23 @@ class FileChooserController(FloatLayout):
             Logger.exception('Unable to open directory <%s>' % self.path)
             self.files[:] = []
 
-    def _add_files(self, path, parent=None):
+    def _list_files(self, path):
+        # List, filter and sort the files of path. This is executed in a
+        # thread by _add_files().
         force_unicode = self._force_unicode
-        # Make sure we're using unicode in case of non-ascii chars in
-        # filenames.  listdir() returns unicode if you pass it unicode.
-        try:
-            path = expanduser(path)
-            path = force_unicode(path)
-        except ForceUnicodeError:
-            pass
-
+        names, dirnames = _listdir(path)
         files = []
-        fappend = files.append
-        for fn in listdir(path):
+        dirs = set()
+        for fn in names:
             try:
-                fappend(force_unicode(fn))
+                ufn = force_unicode(fn)
             except ForceUnicodeError:
-                pass
-        # In the following, use fully qualified filenames
-        files = [normpath(join(path, f)) for f in files]
+                continue
+            # use fully qualified filenames
+            ufn = normpath(join(path, ufn))
+            files.append(ufn)
+            if fn in dirnames:
+                dirs.add(ufn)
         # Apply filename filters
         files = self._apply_filters(files)
         # Sort the list of files
@@ -594,6 +645,45 @@ class FileChooserController(FloatLayout):
         is_hidden = self.is_hidden
         if not self.show_hidden:
             files = [x for x in files if not is_hidden(x)]
+        return files, dirs
+
+    def _list_files_thread(self, path, result):
+        try:
+            result.append(self._list_files(path))
+        except Exception as e:
+            result.append(e)
+
+    def _add_files(self, path, parent=None):
+        force_unicode = self._force_unicode
+        # Make sure we're using unicode in case of non-ascii chars in
+        # filenames.  listdir() returns unicode if you pass it unicode.
+        try:
+            path = expanduser(path)
+            path = force_unicode(path)
+        except ForceUnicodeError:
+            pass
+
+        # the files are listed in a thread. Until the result is available,
+        # yield None entries. The result is reused until the directory is
+        # modified, or the options are changed.
+        options = (getmtime(path), list(self.filters), self.filter_dirs,
+                   self.sort_func, self.show_hidden)
+        cached = Cache.get('kv.filechooser', path)
+        if cached is not None and cached[0] == options:
+            files, dirs = cached[1]
+        else:
+            result = []
+            thread = Thread(target=self._list_files_thread,
+                            args=(path, result))
+            thread.daemon = True
+            thread.start()
+            while not result:
+                yield 0, 1, None
+            if isinstance(result[0], Exception):
+                raise result[0]
+            files, dirs = result[0]
+            Cache.append('kv.filechooser', path, (options, result[0]))
+
         self.files[:] = files
         total = len(files)
         wself = ref(self)
@@ -607,7 +697,7 @@ class FileChooserController(FloatLayout):
                    'get_nice_size': get_nice_size,
                    'path': fn,
                    'controller': wself,
-                   'isdir': isdir(fn),
+                   'isdir': fn in dirs,
                    'parent': parent,
                    'sep': sep}
             entry = Builder.template(self._ENTRY_TEMPLATE, **ctx)
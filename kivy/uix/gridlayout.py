@@ -108,6 +108,33 @@ class GridLayoutException(Exception):
     pass
 
 
+class _Maximum(object):
+    # Counted multiset of the values of a column or a row, keeping their
+    # maximum, so a value can be removed without going through all the others.
+
+    __slots__ = ('counts', 'value')
+
+    def __init__(self):
+        self.counts = {}
+        self.value = None
+
+    def add(self, value):
+        counts = self.counts
+        counts[value] = counts.get(value, 0) + 1
+        if self.value is None or value > self.value:
+            self.value = value
+
+    def remove(self, value):
+        counts = self.counts
+        count = counts[value] - 1
+        if count:
+            counts[value] = count
+            return
+        del counts[value]
+        if value == self.value:
+            self.value = max(counts) if counts else None
+
+
 class GridLayout(Layout):
     '''Grid layout class. See module documentation for more information.
     '''
@@ -243,6 +270,15 @@ class GridLayout(Layout):
 
     def __init__(self, **kwargs):
         self._cols = self._rows = None
+        # contribution of each child to the minimum size of its column and
+        # row, by id. None means they must be computed again from all the
+        # children.
+        self._cells = None
+        self._cells_shape = None
+        self._dirty_cells = {}
+        self._moved_cells = set()
+        # position and size of the columns and rows at the last layout
+        self._cols_pos = self._rows_pos = None
         super(GridLayout, self).__init__(**kwargs)
 
         self.bind(
@@ -275,6 +311,71 @@ class GridLayout(Layout):
         if smax and len(value) > smax:
             raise GridLayoutException(
                     'Too many children in GridLayout. Increase rows/cols!')
+        self._cells = None
+
+    def add_widget(self, widget, index=0):
+        widget.bind(size=self._child_changed, size_hint=self._child_changed)
+        return super(GridLayout, self).add_widget(widget, index)
+
+    def remove_widget(self, widget):
+        widget.unbind(size=self._child_changed, size_hint=self._child_changed)
+        return super(GridLayout, self).remove_widget(widget)
+
+    def _child_changed(self, instance, value):
+        if self._cells is not None:
+            self._dirty_cells[id(instance)] = instance
+
+    def _build_cells(self, current_cols, current_rows):
+        # compute the contribution of all the children
+        self._cols_w = [_Maximum() for x in range(current_cols)]
+        self._cols_shw = [_Maximum() for x in range(current_cols)]
+        self._rows_h = [_Maximum() for x in range(current_rows)]
+        self._rows_shh = [_Maximum() for x in range(current_rows)]
+        self._cells = {}
+        self._cells_shape = current_cols, current_rows
+        self._dirty_cells = {}
+        count = current_cols * current_rows
+        for index, child in enumerate(reversed(self.children)):
+            if index >= count:
+                break
+            self._add_cell(child, index)
+        # everything must be laid out again
+        self._cols_pos = self._rows_pos = None
+
+    def _add_cell(self, child, index):
+        current_cols = self._cells_shape[0]
+        col = index % current_cols
+        row = index // current_cols
+        shw = child.size_hint_x
+        shh = child.size_hint_y
+        if shw is None:
+            w = child.width
+            self._cols_w[col].add(w)
+        else:
+            w = None
+            self._cols_shw[col].add(shw)
+        if shh is None:
+            h = child.height
+            self._rows_h[row].add(h)
+        else:
+            h = None
+            self._rows_shh[row].add(shh)
+        self._cells[id(child)] = index, w, shw, h, shh
+
+    def _remove_cell(self, child):
+        index, w, shw, h, shh = self._cells.pop(id(child))
+        current_cols = self._cells_shape[0]
+        col = index % current_cols
+        row = index // current_cols
+        if w is None:
+            self._cols_shw[col].remove(shw)
+        else:
+            self._cols_w[col].remove(w)
+        if h is None:
+            self._rows_shh[row].remove(shh)
+        else:
+            self._rows_h[row].remove(h)
+        return index
 
     def update_minimum_size(self, *largs):
         # the goal here is to calculate the minimum size of every cols/rows
@@ -298,6 +399,21 @@ class GridLayout(Layout):
         current_cols = max(1, current_cols)
         current_rows = max(1, current_rows)
 
+        # update the contribution of the children whose size or size_hint
+        # changed, or of all of them if the grid changed
+        if self._cells is None or \
+                self._cells_shape != (current_cols, current_rows):
+            self._build_cells(current_cols, current_rows)
+        elif self._dirty_cells:
+            cells = self._cells
+            for key, child in self._dirty_cells.items():
+                if key not in cells:
+                    continue
+                index = self._remove_cell(child)
+                self._add_cell(child, index)
+                self._moved_cells.add(index)
+            self._dirty_cells = {}
+
         cols = [self.col_default_width] * current_cols
         cols_sh = [None] * current_cols
         rows = [self.row_default_height] * current_rows
@@ -310,34 +426,14 @@ class GridLayout(Layout):
         for index, value in self.rows_minimum.items():
             rows[index] = value
 
-        # calculate minimum size for each columns and rows
-        i = len_children - 1
+        # calculate minimum size / maximum stretch needed for each columns
+        # and rows
+        for col in range(current_cols):
+            cols[col] = nmax(cols[col], self._cols_w[col].value)
+            cols_sh[col] = self._cols_shw[col].value
         for row in range(current_rows):
-            for col in range(current_cols):
-
-                # don't go further is we don't have child left
-                if i < 0:
-                    break
-
-                # get initial information from the child
-                c = children[i]
-                shw = c.size_hint_x
-                shh = c.size_hint_y
-                w = c.width
-                h = c.height
-
-                # compute minimum size / maximum stretch needed
-                if shw is None:
-                    cols[col] = nmax(cols[col], w)
-                else:
-                    cols_sh[col] = nmax(cols_sh[col], shw)
-                if shh is None:
-                    rows[row] = nmax(rows[row], h)
-                else:
-                    rows_sh[row] = nmax(rows_sh[row], shh)
-
-                # next child
-                i = i - 1
+            rows[row] = nmax(rows[row], self._rows_h[row].value)
+            rows_sh[row] = self._rows_shh[row].value
 
         # calculate minimum width/height needed, starting from padding + spacing
         padding_x = self.padding[0] + self.padding[2]
@@ -421,20 +517,44 @@ class GridLayout(Layout):
                                  strech_h * row_stretch / rows_weigth)
                 rows[index] = row_height
 
-        # reposition every child
-        i = len_children - 1
+        # position of every column and row
+        cols_pos = []
+        x = selfx + padding_left
+        for col_width in cols:
+            cols_pos.append((x, col_width))
+            x = x + col_width + spacing_x
+        rows_pos = []
         y = self.top - padding_top
         for row_height in rows:
-            x = selfx + padding_left
-            for col_width in cols:
-                if i < 0:
-                    break
-                c = children[i]
-                c.x = x
-                c.y = y - row_height
-                c.width = col_width
-                c.height = row_height
-                i = i - 1
-                x = x + col_width + spacing_x
+            rows_pos.append((y - row_height, row_height))
             y -= row_height + spacing_y
 
+        # reposition only the children in the columns and rows that moved,
+        # and the ones whose size changed
+        current_cols = len(cols)
+        old_cols_pos = self._cols_pos
+        old_rows_pos = self._rows_pos
+        if old_cols_pos is None or len(old_cols_pos) != len(cols_pos) or \
+                len(old_rows_pos) != len(rows_pos):
+            indices = range(len_children)
+        else:
+            indices = self._moved_cells
+            for col in range(current_cols):
+                if cols_pos[col] != old_cols_pos[col]:
+                    indices.update(range(col, len_children, current_cols))
+            for row in range(len(rows)):
+                if rows_pos[row] != old_rows_pos[row]:
+                    start = row * current_cols
+                    indices.update(range(
+                        start, min(start + current_cols, len_children)))
+        self._moved_cells = set()
+        self._cols_pos = cols_pos
+        self._rows_pos = rows_pos
+
+        for index in indices:
+            if index >= len_children:
+                continue
+            c = children[len_children - 1 - index]
+            c.x, c.width = cols_pos[index % current_cols]
+            c.y, c.height = rows_pos[index // current_cols]
+
@@ -574,7 +574,7 @@ from kivy.uix.label import Label
 from kivy.uix.boxlayout import BoxLayout
 from kivy.adapters.simplelistadapter import SimpleListAdapter
 from kivy.uix.abstractview import AbstractView
-from kivy.properties import ObjectProperty, DictProperty, \
+from kivy.properties import ObjectProperty, \
         NumericProperty, ListProperty, BooleanProperty
 from kivy.lang import Builder
 from math import ceil, floor
@@ -800,6 +800,67 @@ class CompositeListItem(SelectableView, BoxLayout):
             return '<%s>' % (self.__class__.__name__)
 
 
+class _RowHeights(object):
+    # Heights of the rows of a ListView, using `default` for the rows that
+    # have not been displayed yet. The differences with the default height
+    # are summed in a Fenwick tree, so the offset of a row, and the row at an
+    # offset, are found in O(log n) whatever the count of rows.
+
+    def __init__(self, count, default):
+        self.count = count
+        self.default = default
+        self.sizes = {}
+        self._tree = [0] * (count + 1)
+        mask = 1
+        while mask * 2 <= count:
+            mask *= 2
+        self._mask = mask
+
+    def set(self, index, height):
+        if index < 0 or index >= self.count:
+            return
+        delta = height - self.sizes.get(index, self.default)
+        self.sizes[index] = height
+        if not delta:
+            return
+        tree = self._tree
+        count = self.count
+        index += 1
+        while index <= count:
+            tree[index] += delta
+            index += index & -index
+
+    def offset(self, index):
+        # sum of the heights of the rows before index
+        index = max(0, min(index, self.count))
+        tree = self._tree
+        offset = index * self.default
+        while index > 0:
+            offset += tree[index]
+            index -= index & -index
+        return offset
+
+    def total(self):
+        return self.offset(self.count)
+
+    def index_at(self, offset):
+        # index of the row at the distance offset from the top
+        tree = self._tree
+        count = self.count
+        default = self.default
+        index = 0
+        step = self._mask
+        while step:
+            nindex = index + step
+            if nindex <= count:
+                height = tree[nindex] + step * default
+                if height <= offset:
+                    index = nindex
+                    offset -= height
+            step //= 2
+        return max(0, min(index, count - 1))
+
+
 Builder.load_string('''
 <ListView>:
     container: container
@@ -853,10 +914,15 @@ class ListView(AbstractView, EventDispatcher):
     within a :class:`~kivy.uix.scrollview.ScrollView` widget.  (See the
     associated kv block in the Builder.load_string() setup). Item view
     instances managed and provided by the adapter are added to this container.
-    The container is cleared with a call to clear_widgets() when the list is
-    rebuilt by the populate() method. A padding
-    :class:`~kivy.uix.widget.Widget` instance is also added as needed,
-    depending on the row height calculations.
+    A padding :class:`~kivy.uix.widget.Widget` instance is added first, with
+    the height of the rows before the displayed ones.
+
+    .. versionchanged:: 1.8.0
+        When the list is scrolled, populate() only removes the item views
+        that went out of the displayed window, and gives them back to the
+        adapter with :meth:`~kivy.adapters.adapter.Adapter.release_view`, so
+        they can be reused for the new items. The container is not cleared
+        anymore.
 
     :data:`container` is an :class:`~kivy.properties.ObjectProperty`,
     default to None.
@@ -890,7 +956,6 @@ class ListView(AbstractView, EventDispatcher):
     '''
 
     _index = NumericProperty(0)
-    _sizes = DictProperty({})
     _count = NumericProperty(0)
 
     _wstart = NumericProperty(0)
@@ -918,6 +983,10 @@ class ListView(AbstractView, EventDispatcher):
                                                  cls=Label)
             kwargs['adapter'] = list_adapter
 
+        self._views = {}
+        self._heights = None
+        self._padding = None
+
         super(ListView, self).__init__(**kwargs)
 
         self._trigger_populate = Clock.create_trigger(self._spopulate, -1)
@@ -927,7 +996,7 @@ class ListView(AbstractView, EventDispatcher):
         self.bind(size=self._trigger_populate,
                   pos=self._trigger_populate,
                   item_strings=self.item_strings_changed,
-                  adapter=self._trigger_populate)
+                  adapter=self._adapter_changed)
 
         # The bindings setup above sets self._trigger_populate() to fire
         # when the adapter changes, but we also need this binding for when
@@ -935,12 +1004,91 @@ class ListView(AbstractView, EventDispatcher):
         # We don't know that these are, so we ask the adapter to set up the
         # bindings back to the view updating function here.
         self.adapter.bind_triggers_to_view(self._trigger_reset_populate)
+        self._bound_adapter = None
+        self._bind_adapter()
 
     # Added to set data when item_strings is set in a kv template, but it will
     # be good to have also if item_strings is reset generally.
     def item_strings_changed(self, *args):
         self.adapter.data = self.item_strings
 
+    def _adapter_changed(self, *args):
+        # the displayed views come from the previous adapter
+        self._clear_rows(release=False)
+        self._heights = None
+        self._wend = None
+        self._trigger_populate()
+        self._bind_adapter()
+
+    def _bind_adapter(self):
+        # listen to the changes of single data items, only from the current
+        # adapter
+        adapter = self._bound_adapter
+        if adapter is self.adapter:
+            return
+        if adapter is not None:
+            adapter.unbind(on_data_item_changed=self._data_item_changed)
+        adapter = self._bound_adapter = self.adapter
+        if adapter is not None:
+            adapter.bind(on_data_item_changed=self._data_item_changed)
+
+    def _data_item_changed(self, adapter, index):
+        # only the row of the modified data item is updated
+        old_view = self._views.get(index)
+        if old_view is None:
+            return
+        item_view = adapter.get_view(index)
+        if item_view is not old_view:
+            container = self.container
+            position = container.children.index(old_view)
+            self._release_row(index)
+            if item_view is None:
+                self._trigger_reset_populate()
+                return
+            self._views[index] = item_view
+            container.add_widget(item_view, position)
+        # the height of the row might have changed
+        self._trigger_populate()
+
+    def _get_heights(self):
+        heights = self._heights
+        count = self.adapter.get_count()
+        rh = self.row_height
+        if heights is None or heights.count != count or \
+                heights.default != rh:
+            sizes = heights.sizes if heights is not None and \
+                heights.count == count else {}
+            heights = self._heights = _RowHeights(count, rh)
+            for index, height in sizes.items():
+                heights.set(index, height)
+        return heights
+
+    def _add_row(self, index, top, pending):
+        # add the view of the row index, at the top or the bottom of the
+        # shown rows
+        item_view = pending.pop(index, None)
+        if item_view is None:
+            item_view = self.adapter.get_view(index)
+            if item_view is None:
+                return
+        self._views[index] = item_view
+        container = self.container
+        if top:
+            # just after the padding
+            container.add_widget(item_view, len(container.children) - 1)
+        else:
+            container.add_widget(item_view)
+
+    def _release_row(self, index, release=True):
+        item_view = self._views.pop(index)
+        self.container.remove_widget(item_view)
+        if release:
+            self.adapter.release_view(index, item_view)
+
+    def _clear_rows(self, release=True):
+        for index in list(self._views.keys()):
+            self._release_row(index, release)
+
     def _scroll(self, scroll_y):
         if self.row_height is None:
             return
@@ -951,19 +1099,16 @@ class ListView(AbstractView, EventDispatcher):
         mend = mstart + self.height
 
         # convert distance to index
-        rh = self.row_height
-        istart = int(ceil(mstart / rh))
-        iend = int(floor(mend / rh))
-
-        istart = max(0, istart - 1)
-        iend = max(0, iend - 1)
+        heights = self._get_heights()
+        istart = heights.index_at(mstart)
+        iend = heights.index_at(mend)
 
         if istart < self._wstart:
             rstart = max(0, istart - 10)
             self.populate(rstart, iend)
             self._wstart = rstart
             self._wend = iend
-        elif iend > self._wend:
+        elif self._wend is None or iend > self._wend:
             self.populate(istart, iend + 10)
             self._wstart = istart
             self._wend = iend + 10
@@ -972,6 +1117,9 @@ class ListView(AbstractView, EventDispatcher):
         self.populate()
 
     def _reset_spopulate(self, *args):
+        # the data changed, the views and their sizes are not valid anymore
+        self._clear_rows()
+        self._heights = None
         self._wend = None
         self.populate()
         # simulate the scroll again, only if we already scrolled before
@@ -982,66 +1130,85 @@ class ListView(AbstractView, EventDispatcher):
 
     def populate(self, istart=None, iend=None):
         container = self.container
-        sizes = self._sizes
-        rh = self.row_height
+        views = self._views
+        pending = {}
+
+        # the padding is always the first widget of the container
+        padding = self._padding
+        if padding is None or padding.parent is not container.__self__:
+            self._clear_rows()
+            container.clear_widgets()
+            padding = self._padding = Widget(size_hint_y=None, height=0)
+            container.add_widget(padding)
 
         # ensure we know what we want to show
         if istart is None:
             istart = self._wstart
             iend = self._wend
 
-        # clear the view
-        container.clear_widgets()
-
         # guess only ?
-        if iend is not None:
-
-            # fill with a "padding"
-            fh = 0
-            for x in range(istart):
-                fh += sizes[x] if x in sizes else rh
-            container.add_widget(Widget(size_hint_y=None, height=fh))
-
-            # now fill with real item_view
-            index = istart
-            while index <= iend:
-                item_view = self.adapter.get_view(index)
-                index += 1
-                if item_view is None:
-                    continue
-                sizes[index] = item_view.height
-                container.add_widget(item_view)
-        else:
+        if iend is None:
+            # show enough rows to fill our height, from _index
             available_height = self.height
             real_height = 0
-            index = self._index
+            istart = index = self._index
             count = 0
             while available_height > 0:
-                item_view = self.adapter.get_view(index)
+                item_view = views.get(index)
                 if item_view is None:
-                    break
-                sizes[index] = item_view.height
+                    item_view = self.adapter.get_view(index)
+                    if item_view is None:
+                        break
+                    pending[index] = item_view
                 index += 1
                 count += 1
-                container.add_widget(item_view)
                 available_height -= item_view.height
                 real_height += item_view.height
+            iend = index - 1
 
             self._count = count
+            if count and self.row_height is None:
+                self.row_height = real_height / count
+
+        iend = min(iend, self.adapter.get_count() - 1)
+
+        # remove the rows that are not shown anymore
+        for index in [x for x in views if x < istart or x > iend]:
+            self._release_row(index)
+
+        # add the new rows, above and below the ones still shown
+        if views:
+            for index in range(min(views) - 1, istart - 1, -1):
+                self._add_row(index, True, pending)
+            istart = max(views) + 1
+        for index in range(istart, iend + 1):
+            self._add_row(index, False, pending)
+
+        if self.row_height is None:
+            return
 
-            # extrapolate the full size of the container from the size
-            # of view instances in the adapter
-            if count:
-                container.height = \
-                    real_height / count * self.adapter.get_count()
-                if self.row_height is None:
-                    self.row_height = real_height / count
+        # the size of the container is known from the size of the rows
+        # already shown, and the row_height for the others
+        heights = self._get_heights()
+        for index, item_view in views.items():
+            heights.set(index, item_view.height)
+        if views:
+            padding.height = heights.offset(min(views))
+        container.height = heights.total()
 
     def scroll_to(self, index=0):
         if not self.scrolling:
             self.scrolling = True
             self._index = index
+            self._wend = None
             self.populate()
+            # move the scrollview on the first row
+            scrollview = self.container.parent
+            distance = self.container.height - self.height
+            if self._heights is not None and scrollview is not None and \
+                    distance > 0:
+                offset = self._heights.offset(index)
+                scrollview.scroll_y = 1 - min(1, offset / float(distance))
             self.dispatch('on_scroll_complete')
 
     def on_scroll_complete(self, *args):
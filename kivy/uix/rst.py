@@ -51,12 +51,34 @@ document ``index.rst`` you can write::
 It will generate a link that, when clicked, the document ``moreinfo.rst``
 will be loaded.
 
+Lazy Loading
+------------
+
+.. versionadded:: 1.8.0
+
+By default, the document is parsed, and the widgets of all its paragraphs,
+lists and tables are created, before anything is displayed. For a long
+document, set :data:`RstDocument.lazy_loading` to True::
+
+    document = RstDocument(source='manual.rst', lazy_loading=True)
+
+The text is then parsed in a thread, and the result is cached, using a hash
+of the text as key, so loading the same text again is immediate. Each section
+is first displayed as an empty space of an estimated height, and its widgets
+are created only when it comes near the visible area of the document. The
+scroll position can move slightly when a section above the visible area
+is created, because its real height differs from the estimation.
+
 '''
 
 __all__ = ('RstDocument', )
 
 import os
 from os.path import dirname, join, exists
+from functools import partial
+from hashlib import sha1
+from threading import Thread
+from kivy.cache import Cache
 from kivy.clock import Clock
 from kivy.compat import PY2
 from kivy.properties import ObjectProperty, NumericProperty, \
@@ -73,6 +95,7 @@ from kivy.uix.videoplayer import VideoPlayer
 from kivy.uix.anchorlayout import AnchorLayout
 from kivy.animation import Animation
 from kivy.logger import Logger
+from kivy.metrics import sp
 from docutils.parsers import rst
 from docutils.parsers.rst import roles
 from docutils import nodes, frontend, utils
@@ -80,6 +103,9 @@ from docutils.parsers.rst import Directive, directives
 from docutils.parsers.rst.roles import set_classes
 
 
+# cache of the parsed documents, for lazy loading
+Cache.register('kv.rst', timeout=60)
+
 #
 # Handle some additional roles
 #
@@ -164,6 +190,10 @@ Builder.load_string('''
             size: self.width, 1
 
 
+<RstSection>:
+    cols: 1
+    size_hint_y: None
+
 <RstParagraph>:
     markup: True
     valign: 'top'
@@ -433,6 +463,17 @@ class RstDocument(ScrollView):
     to False
     '''
 
+    lazy_loading = BooleanProperty(False)
+    '''If True, the text is parsed in a thread, and the widgets of a section
+    are created only when the section comes near the visible area. See
+    `Lazy Loading`_ for more information.
+
+    .. versionadded:: 1.8.0
+
+    :data:`lazy_loading` is a :class:`~kivy.properties.BooleanProperty`,
+    default to False
+    '''
+
     def _get_bgc(self):
         return get_color_from_hex(self.colors.background)
 
@@ -490,10 +531,19 @@ class RstDocument(ScrollView):
 
     def __init__(self, **kwargs):
         self._trigger_load = Clock.create_trigger(self._load_from_text, -1)
+        self._trigger_sections = Clock.create_trigger(self._build_sections)
         self._parser = rst.Parser()
         self._settings = frontend.OptionParser(
                 components=(rst.Parser, )).get_default_values()
+        # state of the lazy loading
+        self._parse_result = None
+        self._sections = []
+        self._pending_sections = []
+        self._sections_refs = {}
         super(RstDocument, self).__init__(**kwargs)
+        self.bind(scroll_y=self._trigger_sections,
+                  size=self._trigger_sections)
+        self.content.bind(height=self._trigger_sections)
 
     def on_source(self, instance, value):
         if self.document_root is None:
@@ -546,11 +596,12 @@ class RstDocument(ScrollView):
                                  self.source_error)
 
     def _load_from_text(self, *largs):
+        if self.lazy_loading:
+            self._load_lazily()
+            return
         try:
             # clear the current widgets
-            self.content.clear_widgets()
-            self.anchors_widgets = []
-            self.refs_assoc = {}
+            self._clear()
 
             # parse the source
             document = utils.new_document('Document', self._settings)
@@ -567,6 +618,100 @@ class RstDocument(ScrollView):
         except:
             Logger.exception('Rst: error while loading text')
 
+    def _clear(self):
+        self.content.clear_widgets()
+        self.anchors_widgets = []
+        self.refs_assoc = {}
+        self._parse_result = None
+        self._sections = []
+        self._pending_sections = []
+        self._sections_refs = {}
+
+    def _load_lazily(self):
+        self._clear()
+        text = self.text or ''
+        if PY2 and type(text) is str:
+            text = text.decode('utf-8')
+        key = sha1(text.encode('utf-8')).hexdigest()
+        parsed = Cache.get('kv.rst', key)
+        if parsed is not None:
+            self._add_sections(parsed)
+            return
+        # parse the text in a thread, and wait for the result
+        result = self._parse_result = []
+        thread = Thread(target=self._parse_thread, args=(text, result))
+        thread.daemon = True
+        thread.start()
+        Clock.schedule_interval(partial(self._check_parse, key, result), 0)
+
+    def _parse_thread(self, text, result):
+        # Parse the text, and split the document in sections. This is
+        # executed in a thread by _load_lazily().
+        try:
+            document = utils.new_document('Document', self._settings)
+            rst.Parser().parse(text, document)
+            result.append(_split_sections(document))
+        except Exception as e:
+            result.append(e)
+
+    def _check_parse(self, key, result, *largs):
+        if not result:
+            return
+        if result is self._parse_result:
+            self._parse_result = None
+            if isinstance(result[0], Exception):
+                Logger.error('Rst: error while loading text: %r' % result[0])
+            else:
+                Cache.append('kv.rst', key, result[0])
+                self._add_sections(result[0])
+        return False
+
+    def _add_sections(self, parsed):
+        title, sections, refs = parsed
+        self.title = title or 'No title'
+        self._sections_refs = refs
+        add_widget = self.content.add_widget
+        # estimate the height of each section from its length, until it is
+        # created
+        width = max(100., self.width - 20.)
+        for section_depth, body, length in sections:
+            section = RstSection(
+                height=len(body) * sp(30) + length * sp(8) * sp(20) / width)
+            section.rst_body = (section_depth, body)
+            add_widget(section)
+            self._sections.append(section)
+        self._pending_sections = self._sections[:]
+        self._trigger_sections()
+
+    def _build_sections(self, *largs):
+        pending = self._pending_sections
+        if not pending:
+            return
+        # build the sections in the visible part of the content, or less than
+        # one screen above or below
+        scatter = self.scatter
+        margin = self.height
+        ymin = self.y - scatter.y - margin
+        ymax = self.top - scatter.y + margin
+        for section in pending[:]:
+            if section.top >= ymin and section.y <= ymax:
+                self._build_section(section)
+
+    def _build_section(self, section):
+        section_depth, body = section.rst_body
+        section.rst_body = None
+        self._pending_sections.remove(section)
+        visitor = _Visitor(self, body[0].document)
+        visitor.section = section_depth
+        visitor.current = section
+        try:
+            for node in body:
+                node.walkabout(visitor)
+        except:
+            Logger.exception('Rst: error while building a section')
+        section.bind(minimum_height=section.setter('height'))
+        section.height = section.minimum_height
+
     def on_ref_press(self, node, ref):
         self.goto(ref)
 
@@ -617,6 +762,15 @@ class RstDocument(ScrollView):
 
         # not found, stop here
         if ax is None:
+            # the reference might be in a section not built yet. Build all
+            # the sections up to it, and try again when they are laid out.
+            index = self._sections_refs.get(ref)
+            if index is not None and \
+                    self._sections[index].rst_body is not None:
+                for section in self._sections[:index + 1]:
+                    if section.rst_body is not None:
+                        self._build_section(section)
+                Clock.schedule_once(partial(self.goto, ref), 0)
             return
 
         # found, calculate the real coordinate
@@ -640,6 +794,13 @@ class RstDocument(ScrollView):
         self.anchors_widgets.append(node)
 
 
+class RstSection(GridLayout):
+    # Container of the widgets of a section, when the document is lazily
+    # loaded. rst_body is the (section depth, doctree nodes) to build, or
+    # None when the section is built.
+    rst_body = None
+
+
 class RstTitle(Label):
 
     section = NumericProperty(0)
@@ -740,6 +901,45 @@ class RstDefinitionSpace(Widget):
     pass
 
 
+def _split_sections(document):
+    # Split a document in a list of (section depth, nodes, text length), one
+    # for the nodes of each section, excluding its subsections. Also return
+    # the title of the document, and the index of the section of each target.
+    sections = []
+    refs = {}
+
+    def add_section(section_depth, body):
+        index = len(sections)
+        for node in body:
+            for target in node.traverse(nodes.target):
+                for name in target['ids'] + target['names']:
+                    refs.setdefault(name, index)
+        length = sum(len(node.astext()) for node in body)
+        sections.append((section_depth, body, length))
+
+    def walk(parent, section_depth):
+        body = []
+        for node in parent.children:
+            if isinstance(node, nodes.section):
+                if body:
+                    add_section(section_depth, body)
+                    body = []
+                # the section starts with the next section body
+                for name in node['ids'] + node['names']:
+                    refs.setdefault(name, len(sections))
+                walk(node, section_depth + 1)
+            else:
+                body.append(node)
+        if body:
+            add_section(section_depth, body)
+
+    walk(document, 0)
+    title = document.next_node(nodes.title)
+    if title is not None:
+        title = title.astext()
+    return title, sections, refs
+
+
 class _ToctreeVisitor(nodes.NodeVisitor):
 
     def __init__(self, *largs):
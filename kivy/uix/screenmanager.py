@@ -119,6 +119,18 @@ You can easily switch to a new transition by changing the
     To be more concrete, if you see sharped-text during the animation, it's
     normal.
 
+The shader based transitions draw the screens into framebuffers. A screen is
+drawn again only when its content changes. If the screens are animated, or
+update their content during the transition, you can draw each screen only
+once, at the start of the transition, with
+:data:`ShaderTransition.snapshot`::
+
+    sm = ScreenManager(transition=FadeTransition(snapshot=True))
+
+.. versionadded:: 1.8.0
+
+    :data:`ShaderTransition.snapshot` has been added.
+
 '''
 
 __all__ = ('Screen', 'ScreenManager', 'ScreenManagerException',
@@ -126,6 +138,7 @@ __all__ = ('Screen', 'ScreenManager', 'ScreenManagerException',
     'FadeTransition', 'WipeTransition')
 
 from kivy.logger import Logger
+from kivy.clock import Clock
 from kivy.event import EventDispatcher
 from kivy.uix.floatlayout import FloatLayout
 from kivy.properties import StringProperty, ObjectProperty, AliasProperty, \
@@ -382,6 +395,29 @@ class ShaderTransition(TransitionBase):
     :data:`vs` is a :class:`~kivy.properties.StringProperty`, default to None.
     '''
 
+    snapshot = BooleanProperty(False)
+    '''If True, the screens are drawn only once in their framebuffers, at the
+    start of the transition. Then only the shader is animated: the changes of
+    the screens are not displayed until the end of the transition.
+
+    If False, a screen is drawn again each time its content changes during the
+    transition.
+
+    .. versionadded:: 1.8.0
+
+    :data:`snapshot` is a :class:`~kivy.properties.BooleanProperty`, default
+    to False.
+    '''
+
+    def __init__(self, **kwargs):
+        # the framebuffers and the render context are reused from one
+        # transition to the next, until the shaders are changed
+        self.fbo_in = self.fbo_out = self.render_ctx = None
+        self._bind_in = self._bind_out = None
+        self._fbos_active = False
+        super(ShaderTransition, self).__init__(**kwargs)
+        self.bind(fs=self._reset_render_ctx, vs=self._reset_render_ctx)
+
     def make_screen_fbo(self, screen):
         fbo = Fbo(size=screen.size)
         with fbo:
@@ -390,6 +426,29 @@ class ShaderTransition(TransitionBase):
         fbo.add(screen.canvas)
         return fbo
 
+    def _get_screen_fbo(self, screen, fbo):
+        if fbo is None:
+            return self.make_screen_fbo(screen)
+        # the framebuffer is drawn again when the screen canvas is added
+        fbo.size = screen.size
+        fbo.add(screen.canvas)
+        return fbo
+
+    def _reset_render_ctx(self, *largs):
+        self.render_ctx = None
+
+    def _freeze_screens(self, *largs):
+        # stop drawing the screens, once their framebuffers have been drawn
+        if not self.is_active or not self._fbos_active:
+            return
+        fbo_in, fbo_out = self.fbo_in, self.fbo_out
+        if fbo_in.needs_redraw or fbo_out.needs_redraw:
+            Clock.schedule_once(self._freeze_screens, 0)
+            return
+        self.manager.canvas.remove(fbo_in)
+        self.manager.canvas.remove(fbo_out)
+        self._fbos_active = False
+
     def on_progress(self, progress):
         self.render_ctx['t'] = progress
 
@@ -402,35 +461,47 @@ class ShaderTransition(TransitionBase):
         self.screen_in.size = self.screen_out.size
         self.manager.real_remove_widget(self.screen_out)
 
-        self.fbo_in = self.make_screen_fbo(self.screen_in)
-        self.fbo_out = self.make_screen_fbo(self.screen_out)
+        self.fbo_in = self._get_screen_fbo(self.screen_in, self.fbo_in)
+        self.fbo_out = self._get_screen_fbo(self.screen_out, self.fbo_out)
         self.manager.canvas.add(self.fbo_in)
         self.manager.canvas.add(self.fbo_out)
-
-        screen_rotation = Config.getfloat('graphics', 'rotation')
-        pos = (0, 1)
-        if screen_rotation == 90:
-            pos = (0, 0)
-        elif screen_rotation == 180:
-            pos = (-1, 0)
-        elif screen_rotation == 270:
-            pos = (-1, 1)
-
-        self.render_ctx = RenderContext(fs=self.fs, vs=self.vs)
-        with self.render_ctx:
-            BindTexture(texture=self.fbo_out.texture, index=1)
-            BindTexture(texture=self.fbo_in.texture, index=2)
-            Rotate(screen_rotation, 0, 0, 1)
-            Rectangle(size=(1, -1), pos=pos)
-        self.render_ctx['projection_mat'] = Matrix().\
-            view_clip(0, 1, 0, 1, 0, 1, 0)
-        self.render_ctx['tex_out'] = 1
-        self.render_ctx['tex_in'] = 2
+        self._fbos_active = True
+        if self.snapshot:
+            Clock.schedule_once(self._freeze_screens, 0)
+
+        if self.render_ctx is None:
+            screen_rotation = Config.getfloat('graphics', 'rotation')
+            pos = (0, 1)
+            if screen_rotation == 90:
+                pos = (0, 0)
+            elif screen_rotation == 180:
+                pos = (-1, 0)
+            elif screen_rotation == 270:
+                pos = (-1, 1)
+
+            self.render_ctx = RenderContext(fs=self.fs, vs=self.vs)
+            with self.render_ctx:
+                self._bind_out = BindTexture(index=1)
+                self._bind_in = BindTexture(index=2)
+                Rotate(screen_rotation, 0, 0, 1)
+                Rectangle(size=(1, -1), pos=pos)
+            self.render_ctx['projection_mat'] = Matrix().\
+                view_clip(0, 1, 0, 1, 0, 1, 0)
+            self.render_ctx['tex_out'] = 1
+            self.render_ctx['tex_in'] = 2
+        # the textures are recreated when the framebuffers are resized
+        self._bind_out.texture = self.fbo_out.texture
+        self._bind_in.texture = self.fbo_in.texture
         self.manager.canvas.add(self.render_ctx)
 
     def remove_screen(self, screen):
-        self.manager.canvas.remove(self.fbo_in)
-        self.manager.canvas.remove(self.fbo_out)
+        Clock.unschedule(self._freeze_screens)
+        if self._fbos_active:
+            self.manager.canvas.remove(self.fbo_in)
+            self.manager.canvas.remove(self.fbo_out)
+            self._fbos_active = False
+        self.fbo_in.remove(self.screen_in.canvas)
+        self.fbo_out.remove(self.screen_out.canvas)
         self.manager.canvas.remove(self.render_ctx)
         self.manager.real_add_widget(self.screen_in)
 
@@ -70,6 +70,12 @@ size_hint_y property to None::
     root = ScrollView(size_hint=(None, None), size=(400, 400))
     root.add_widget(layout)
 
+.. versionchanged:: 1.8.0
+
+    The widgets outside of the ScrollView can be culled, so that only the
+    buttons in the visible part of the layout are drawn. See
+    :data:`~kivy.uix.stencilview.StencilView.culling`.
+
 
 Effects
 -------
@@ -15,15 +15,110 @@ provides an efficient way to clip the drawing area of children.
     As with the stencil graphics instructions, you cannot stack more than 8
     stencil-aware widgets.
 
+Culling
+-------
+
+.. versionadded:: 1.8.0
+
+When :data:`StencilView.culling` is True, the descendants that are entirely
+outside of the bounding box are not drawn at all: their
+:data:`~kivy.graphics.instructions.Canvas.culled` is set. When a descendant is
+only partially visible, its own children are checked. For example, in a
+:class:`~kivy.uix.scrollview.ScrollView` containing a long
+:class:`~kivy.uix.gridlayout.GridLayout`, only the visible rows of the layout
+are drawn, whatever the length of the content::
+
+    root = ScrollView(culling=True)
+
+The culling is computed from the `pos` and `size` of the widgets, and updated
+when they change. It is not enabled by default, as a culled canvas doesn't
+apply its context instructions either: the widgets must not rely on a
+:class:`~kivy.graphics.context_instructions.Color` or a transformation left by
+the canvas of a previous sibling, and must not draw outside of their bounding
+box.
+
 '''
 
 __all__ = ('StencilView', )
 
+from kivy.clock import Clock
 from kivy.uix.widget import Widget
+from kivy.properties import BooleanProperty
 
 
 class StencilView(Widget):
     '''StencilView class. See module documentation for more information.
     '''
-    pass
 
+    culling = BooleanProperty(False)
+    '''If True, the descendants outside of the bounding box of the StencilView
+    are not drawn. See `Culling`_ for the conditions to use it.
+
+    .. versionadded:: 1.8.0
+
+    :data:`culling` is a :class:`~kivy.properties.BooleanProperty`, default to
+    False.
+    '''
+
+    def __init__(self, **kwargs):
+        # widgets culled, and widgets whose changes can change the culling,
+        # by id (the widgets are not hashable)
+        self._culled = {}
+        self._culling_watched = {}
+        self._trigger_culling = Clock.create_trigger(self._update_culling, -1)
+        super(StencilView, self).__init__(**kwargs)
+        self.bind(pos=self._trigger_culling,
+                  size=self._trigger_culling,
+                  children=self._trigger_culling,
+                  culling=self._trigger_culling)
+
+    def _update_culling(self, *largs):
+        culled = {}
+        watched = {}
+        if self.culling:
+            x1, y1 = self.to_local(self.x, self.y)
+            x2, y2 = self.to_local(self.right, self.top)
+            stack = [(self, x1, y1, x2, y2)]
+            while stack:
+                parent, x1, y1, x2, y2 = stack.pop()
+                for child in parent.children:
+                    if child.right <= x1 or child.x >= x2 or \
+                            child.top <= y1 or child.y >= y2:
+                        culled[id(child)] = watched[id(child)] = child
+                    elif not child.children or \
+                            isinstance(child, StencilView) and child.culling:
+                        # nothing to cull inside, or done by the child
+                        continue
+                    elif child.x < x1 or child.right > x2 or \
+                            child.y < y1 or child.top > y2:
+                        # partially visible, check the children of the child,
+                        # in its coordinates. All the corners are converted,
+                        # the child might be rotated.
+                        watched[id(child)] = child
+                        corners = [child.to_local(x, y) for x, y in (
+                            (x1, y1), (x2, y1), (x1, y2), (x2, y2))]
+                        xs = [x for x, y in corners]
+                        ys = [y for x, y in corners]
+                        stack.append((child, min(xs), min(ys),
+                                      max(xs), max(ys)))
+
+        old_culled = self._culled
+        for key, widget in old_culled.items():
+            if key not in culled:
+                widget.canvas.culled = False
+        for key, widget in culled.items():
+            if key not in old_culled:
+                widget.canvas.culled = True
+        self._culled = culled
+
+        # update the culling when one of the culled or partially visible
+        # widgets is moved, resized, or removed
+        trigger = self._trigger_culling
+        old_watched = self._culling_watched
+        for key, widget in old_watched.items():
+            if key not in watched:
+                widget.unbind(pos=trigger, size=trigger, parent=trigger)
+        for key, widget in watched.items():
+            if key not in old_watched:
+                widget.bind(pos=trigger, size=trigger, parent=trigger)
+        self._culling_watched = watched
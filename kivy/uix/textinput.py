@@ -279,11 +279,10 @@ class TextInput(Widget):
         self._selection_to = None
         self._bubble = None
         self._lines_flags = []
-        self._lines_labels = []
-        self._lines_rects = []
+        self._lines_rects = {}
+        self._lines_rects_pool = []
         self._hint_text_flags = []
         self._hint_text_labels = []
-        self._hint_text_rects = []
         self._line_spacing = 0
         self._label_cached = None
         self._line_options = None
@@ -1120,13 +1119,11 @@ class TextInput(Widget):
         # Delete current line, and fix cursor position
         assert(idx < len(self._lines))
         self._lines_flags.pop(idx)
-        self._lines_labels.pop(idx)
         self._lines.pop(idx)
         self.cursor = self.cursor
 
     def _set_line_text(self, line_num, text):
         # Set current line with other text than the default one.
-        self._lines_labels[line_num] = self._create_line_label(text)
         self._lines[line_num] = text
 
     def _trigger_refresh_line_options(self, *largs):
@@ -1159,43 +1156,31 @@ class TextInput(Widget):
     def _refresh_text(self, text, *largs):
         # Refresh all the lines from a new text.
         # By using cache in internal functions, this method should be fast.
+        # The labels of the lines are only created when the lines are shown,
+        # in _update_graphics().
         mode = 'all'
         if len(largs) > 1:
             mode, start, finish, _lines, _lines_flags, len_lines = largs
             #start = max(0, start)
         else:
             _lines, self._lines_flags = self._split_smart(text)
-        _lines_labels = []
-        _line_rects = []
-        _create_label = self._create_line_label
-
-        for x in _lines:
-            lbl = _create_label(x)
-            _lines_labels.append(lbl)
-            _line_rects.append(
-                Rectangle(size=(lbl.size if lbl else (0, 0))))
-            lbl = None
 
         if mode == 'all':
-            self._lines_labels = _lines_labels
-            self._lines_rects = _line_rects
             self._lines = _lines
         elif mode == 'del':
             if finish > start:
                 self._insert_lines(start,
                                 finish if start == finish else (finish + 1),
-                                len_lines, _lines_flags,
-                                _lines, _lines_labels, _line_rects)
+                                len_lines, _lines_flags, _lines)
         elif mode == 'insert':
             self._insert_lines(
                                 start,
                                 finish if (start == finish and not len_lines)
                                         else
                                 (finish + 1),
-                                len_lines, _lines_flags, _lines, _lines_labels,
-                                _line_rects)
+                                len_lines, _lines_flags, _lines)
 
-        line_label = _lines_labels[0]
+        line_label = self._create_line_label(_lines[0] if _lines else u'')
         min_line_ht = self._label_cached.get_extents('_')[1]
         if line_label is None:
             self.line_height = max(1, min_line_ht)
@@ -1214,41 +1199,20 @@ class TextInput(Widget):
         # with the new text don't forget to update graphics again
         self._trigger_update_graphics()
 
-    def _insert_lines(self, start, finish, len_lines, _lines_flags, _lines,
-        _lines_labels, _line_rects):
-            self_lines_flags = self._lines_flags
-            _lins_flags = []
-            _lins_flags.extend(self_lines_flags[:start])
-            if len_lines:
-                # if not inserting at first line then
-                if start:
-                    # make sure line flags restored for first line
-                    # _split_smart assumes first line to be not a new line
-                    _lines_flags[0] = self_lines_flags[start]
-                _lins_flags.extend(_lines_flags)
-            _lins_flags.extend(self_lines_flags[finish:])
-            self._lines_flags = _lins_flags
-
-            _lins_lbls = []
-            _lins_lbls.extend(self._lines_labels[:start])
-            if len_lines:
-                _lins_lbls.extend(_lines_labels)
-            _lins_lbls.extend(self._lines_labels[finish:])
-            self._lines_labels = _lins_lbls
-
-            _lins_rcts = []
-            _lins_rcts.extend(self._lines_rects[:start])
-            if len_lines:
-                _lins_rcts.extend(_line_rects)
-            _lins_rcts.extend(self._lines_rects[finish:])
-            self._lines_rects = _lins_rcts
-
-            _lins = []
-            _lins.extend(self._lines[:start])
-            if len_lines:
-                _lins.extend(_lines)
-            _lins.extend(self._lines[finish:])
-            self._lines = _lins
+    def _insert_lines(self, start, finish, len_lines, _lines_flags, _lines):
+        # Replace the lines from start to finish with the new ones, in place
+        self_lines_flags = self._lines_flags
+        if len_lines:
+            # if not inserting at first line then
+            if start:
+                # make sure line flags restored for first line
+                # _split_smart assumes first line to be not a new line
+                _lines_flags[0] = self_lines_flags[start]
+            self_lines_flags[start:finish] = _lines_flags
+            self._lines[start:finish] = _lines
+        else:
+            del self_lines_flags[start:finish]
+            del self._lines[start:finish]
 
     def _trigger_update_graphics(self, *largs):
         Clock.unschedule(self._update_graphics)
@@ -1278,21 +1242,32 @@ class TextInput(Widget):
         # draw labels
         if not self.focus and (not self._lines or (
             not self._lines[0] and len(self._lines) == 1)):
-            rects = self._hint_text_rects
             labels = self._hint_text_labels
             lines = self._hint_text_lines
         else:
-            rects = self._lines_rects
-            labels = self._lines_labels
+            labels = None
             lines = self._lines
         padding_left, padding_top, padding_right, padding_bottom = self.padding
         x = self.x + padding_left
         y = self.top - padding_top + sy
         miny = self.y + padding_bottom
         maxy = self.top - padding_top
-        for line_num, value in enumerate(lines):
-            if miny <= y <= maxy + dy:
-                texture = labels[line_num]
+
+        # only the lines in the viewport are drawn, with the rectangles of the
+        # pool. Their labels are created now, and kept in the label cache.
+        self._lines_rects = rects = {}
+        pool = self._lines_rects_pool
+        _create_label = self._create_line_label
+        first_line = max(0, int((sy - dy) / dy))
+        y -= first_line * dy
+        for line_num in range(first_line, len(lines)):
+            if y < miny:
+                break
+            if y <= maxy + dy:
+                if labels is None:
+                    texture = _create_label(lines[line_num])
+                else:
+                    texture = labels[line_num]
                 if not texture:
                     y -= dy
                     continue
@@ -1344,7 +1319,12 @@ class TextInput(Widget):
                         tcy)
 
                 # add rectangle.
-                r = rects[line_num]
+                if len(rects) < len(pool):
+                    r = pool[len(rects)]
+                else:
+                    r = Rectangle()
+                    pool.append(r)
+                rects[line_num] = r
                 r.pos = int(x), int(y - mlh)
                 r.size = size
                 r.texture = texture
@@ -1359,14 +1339,7 @@ class TextInput(Widget):
         if not self._selection:
             return
         self.canvas.remove_group('selection')
-        dy = self.line_height + self._line_spacing
         rects = self._lines_rects
-        padding_top = self.padding[1]
-        padding_bottom = self.padding[3]
-        _top = self.top
-        y = _top - padding_top + self.scroll_y
-        miny = self.y + padding_bottom
-        maxy = _top - padding_top
         draw_selection = self._draw_selection
         a, b = self._selection_from, self._selection_to
         if a > b:
@@ -1375,9 +1348,6 @@ class TextInput(Widget):
         s1c, s1r = get_cursor_from_index(a)
         s2c, s2r = get_cursor_from_index(b)
         s2r += 1
-        # pass only the selection lines[]
-        # passing all the lines can get slow when dealing with a lot of text
-        y -= s1r * dy
         _lines = self._lines
         _get_text_width = self._get_text_width
         tab_width = self.tab_width
@@ -1388,14 +1358,15 @@ class TextInput(Widget):
         x = self.x
         canvas_add = self.canvas.add
         selection_color = self.selection_color
-        for line_num, value in enumerate(_lines[s1r:s2r], start=s1r):
-            if miny <= y <= maxy + dy:
+        # pass only the selected lines that are shown, they have a rectangle.
+        # passing all the lines can get slow when dealing with a lot of text
+        for line_num in sorted(rects):
+            if s1r <= line_num < s2r:
                 r = rects[line_num]
                 draw_selection(r.pos, r.size, line_num, (s1c, s1r),
                     (s2c, s2r - 1), _lines, _get_text_width, tab_width,
                     _label_cached, width, padding_left, padding_right, x,
                     canvas_add, selection_color)
-            y -= dy
 
     def _draw_selection(self, *largs):
         pos, size, line_num, (s1c, s1r), (s2c, s2r),\
@@ -1660,20 +1631,10 @@ class TextInput(Widget):
 
     def _refresh_hint_text(self):
         _lines, self._hint_text_flags = self._split_smart(self.hint_text)
-        _hint_text_labels = []
-        _hint_text_rects = []
         _create_label = self._create_line_label
 
-        for x in _lines:
-            lbl = _create_label(x, hint=True)
-            _hint_text_labels.append(lbl)
-            _hint_text_rects.append(
-                Rectangle(size=(lbl.size if lbl else (0, 0))))
-            lbl = None
-
         self._hint_text_lines = _lines
-        self._hint_text_labels = _hint_text_labels
-        self._hint_text_rects = _hint_text_rects
+        self._hint_text_labels = [_create_label(x, hint=True) for x in _lines]
 
         # Remember to update graphics
         self._trigger_update_graphics()
@@ -109,11 +109,37 @@ allocated will be:
 
 You might have some trouble with that. It is the developer's responsibility to
 correctly handle adapting the graphical representation nodes, if needed.
+
+Virtualized Mode
+----------------
+
+.. versionadded:: 1.8.0
+
+By default, every expanded node is added to the TreeView as a child widget,
+and all of them are laid out again each time a node is added, expanded or
+collapsed. For a big tree, set :data:`TreeView.virtualized` to True::
+
+    tv = TreeView(virtualized=True, row_height='24dp', size_hint_y=None)
+    tv.bind(minimum_height=tv.setter('height'))
+    scrollview.add_widget(tv)
+
+In this mode, the TreeView keeps a flat list of the visible rows, updated
+incrementally when a node is expanded or collapsed, and only the nodes inside
+the visible area of the nearest :class:`~kivy.uix.scrollview.ScrollView` (or
+any other :class:`~kivy.uix.stencilview.StencilView`) ancestor are added as
+children. The widgets between the TreeView and this ancestor, like a
+:class:`~kivy.uix.scatter.Scatter`, are followed when they move. Finding the
+node under a touch doesn't need to walk the tree anymore.
+
+All the rows have the same height, :data:`TreeView.row_height`, which is
+assigned to the nodes when they are displayed. The
+:data:`TreeView.minimum_width` is computed from the nodes displayed so far.
 '''
 
 from kivy.clock import Clock
 from kivy.uix.label import Label
 from kivy.uix.widget import Widget
+from kivy.uix.stencilview import StencilView
 from kivy.properties import BooleanProperty, ListProperty, ObjectProperty, \
         AliasProperty, NumericProperty, ReferenceListProperty
 
@@ -264,6 +290,14 @@ class TreeView(Widget):
 
     def __init__(self, **kwargs):
         self._trigger_layout = Clock.create_trigger(self._do_layout, -1)
+        # flat list of the visible rows, and rows currently displayed, used
+        # when virtualized. None means the rows must be computed again.
+        self._rows = None
+        self._displayed_rows = {}
+        self._min_width = 0
+        # nearest StencilView ancestor, and the widgets followed up to it
+        self._viewport = None
+        self._viewport_widgets = []
         super(TreeView, self).__init__(**kwargs)
         tvlabel = TreeViewLabel(text='Root', is_open=True, level=0)
         for key, value in self.root_options.items():
@@ -273,7 +307,9 @@ class TreeView(Widget):
             pos=self._trigger_layout,
             size=self._trigger_layout,
             indent_level=self._trigger_layout,
-            indent_start=self._trigger_layout)
+            indent_start=self._trigger_layout,
+            row_height=self._trigger_layout,
+            parent=self._bind_viewport)
         self._trigger_layout()
 
     def add_node(self, node, parent=None):
@@ -297,7 +333,11 @@ class TreeView(Widget):
             parent.nodes.append(node)
             node.parent_node = parent
             node.level = parent.level + 1
-        node.bind(size=self._trigger_layout)
+        if not self.virtualized:
+            node.bind(size=self._trigger_layout)
+        # the nodes list can also be changed directly
+        node.bind(nodes=self._invalidate_rows)
+        self._rows = None
         self._trigger_layout()
         return node
 
@@ -321,7 +361,9 @@ class TreeView(Widget):
                 nodes.remove(node)
             parent.is_leaf = not bool(len(nodes))
             node.parent_node = None
-            node.unbind(size=self._trigger_layout)
+            node.unbind(size=self._trigger_layout,
+                        nodes=self._invalidate_rows)
+            self._rows = None
             self._trigger_layout()
 
     def on_node_expand(self, node):
@@ -344,6 +386,7 @@ class TreeView(Widget):
         '''Toggle the state of the node (open/collapse).
         '''
         node.is_open = not node.is_open
+        self._update_rows(node)
         if node.is_open:
             if self.load_func and not node.is_loaded:
                 self._do_node_load(node)
@@ -356,6 +399,14 @@ class TreeView(Widget):
         '''Get a node at the position (x, y).
         '''
         x, y = pos
+        if self.virtualized:
+            if not self.x <= x <= self.right:
+                return
+            rows = self._get_rows()
+            index = int((self.top - y) // self.row_height)
+            if 0 <= index < len(rows):
+                return rows[index]
+            return
         for node in self.iterate_open_nodes(self.root):
             if self.x <= x <= self.right and \
                node.y <= y <= node.top:
@@ -423,7 +474,172 @@ class TreeView(Widget):
         for key, value in value.items():
             setattr(self.root, key, value)
 
+    def on_hide_root(self, instance, value):
+        self._rows = None
+        self._trigger_layout()
+
+    def on_virtualized(self, instance, value):
+        self._rows = None
+        self._displayed_rows = {}
+        self._min_width = 0
+        self.clear_widgets()
+        self._bind_viewport()
+        trigger = self._trigger_layout
+        if self.root is None:
+            return
+        for node in self.iterate_all_nodes():
+            if value:
+                node.unbind(size=trigger)
+            else:
+                node.bind(size=trigger)
+        trigger()
+
+    def _invalidate_rows(self, *largs):
+        self._rows = None
+        self._trigger_layout()
+
+    def _bind_viewport(self, *largs):
+        # follow the moves of the ancestors up to the nearest StencilView,
+        # and the changes of parent until it is found
+        trigger = self._trigger_layout
+        for widget in self._viewport_widgets:
+            widget.unbind(pos=trigger, size=trigger,
+                          parent=self._bind_viewport)
+        viewport = None
+        widgets = []
+        if self.virtualized:
+            parent = self.parent
+            while parent is not None and parent not in widgets:
+                widgets.append(parent)
+                if isinstance(parent, StencilView):
+                    viewport = parent
+                    break
+                parent = parent.parent
+        for widget in widgets:
+            widget.bind(pos=trigger, size=trigger,
+                        parent=self._bind_viewport)
+        self._viewport = viewport
+        self._viewport_widgets = widgets
+        trigger()
+
+    def _flatten_open_nodes(self, nodes):
+        # iterative version of iterate_open_nodes(), without the recursive
+        # generators, that can be used on a big tree.
+        rows = []
+        append = rows.append
+        stack = [iter(nodes)]
+        while stack:
+            for node in stack[-1]:
+                append(node)
+                if node.is_open and node.nodes:
+                    stack.append(iter(node.nodes))
+                    break
+            else:
+                stack.pop()
+        return rows
+
+    def _get_rows(self):
+        rows = self._rows
+        if rows is None:
+            root = self.root
+            if not self.hide_root:
+                rows = self._flatten_open_nodes([root])
+            elif root.is_open:
+                rows = self._flatten_open_nodes(root.nodes)
+            else:
+                rows = []
+            self._rows = rows
+            self._min_width = 0
+        return rows
+
+    def _update_rows(self, node):
+        # insert or remove the rows of the children of a node that has just
+        # been expanded or collapsed.
+        rows = self._rows
+        if rows is None:
+            return
+        if self.hide_root and node is self.root:
+            index = -1
+        else:
+            index = self._displayed_rows.get(id(node), (None, -1))[1]
+            if index < 0 or index >= len(rows) or rows[index] is not node:
+                for index, row in enumerate(rows):
+                    if row is node:
+                        break
+                else:
+                    # the node is inside a collapsed node
+                    return
+        start = index + 1
+        if node.is_open:
+            rows[start:start] = self._flatten_open_nodes(node.nodes)
+        else:
+            end = start
+            count = len(rows)
+            level = node.level
+            while end < count and rows[end].level > level:
+                end += 1
+            del rows[start:end]
+
+    def _do_layout_virtualized(self):
+        rows = self._get_rows()
+        count = len(rows)
+        rh = self.row_height
+        self.minimum_height = count * rh
+
+        # range of the rows inside the visible area of the viewport. All its
+        # corners are converted, the ancestors might be rotated.
+        top = self.top
+        vy, vtop = self.y, top
+        viewport = self._viewport
+        if viewport is not None:
+            corners = [
+                self.to_widget(*viewport.to_window(x, y))[1]
+                for x, y in ((viewport.x, viewport.y),
+                             (viewport.right, viewport.y),
+                             (viewport.x, viewport.top),
+                             (viewport.right, viewport.top))]
+            vy = max(vy, min(corners))
+            vtop = min(vtop, max(corners))
+        first = max(0, int((top - vtop) // rh))
+        last = min(count, int((top - vy) // rh) + 1)
+
+        # the nodes are indexed by id, as the widgets are not hashable
+        displayed = self._displayed_rows
+        visible = {}
+        for index in range(first, last):
+            node = rows[index]
+            visible[id(node)] = node, index
+        for key, (node, index) in displayed.items():
+            if key not in visible:
+                self.remove_widget(node)
+        add_widget = self.add_widget
+        for key, (node, index) in visible.items():
+            if key not in displayed:
+                add_widget(node)
+        self._displayed_rows = visible
+
+        x = self.x + self.indent_start
+        width = self.width
+        indent_level = self.indent_level
+        level_offset = 1 if self.hide_root else 0
+        min_width = self._min_width
+        for node, index in visible.values():
+            level = node.level - level_offset
+            node.x = x + level * indent_level
+            node.height = rh
+            node.top = top - index * rh
+            if node.size_hint_x:
+                node.width = (width - (node.x - self.x)) * node.size_hint_x
+            node.odd = not index % 2
+            min_width = max(min_width, node.width + indent_level +
+                            node.level * indent_level)
+        self._min_width = min_width
+        self.minimum_width = min_width
+
     def _do_layout(self, *largs):
+        if self.virtualized:
+            self._do_layout_virtualized()
+            return
         self.clear_widgets()
         # display only the one who are is_open
         self._do_open_node(self.root)
@@ -548,6 +764,26 @@ class TreeView(Widget):
     to False.
     '''
 
+    virtualized = BooleanProperty(False)
+    '''If True, only the nodes inside the visible area are added to the
+    TreeView, and all the rows have the height :data:`row_height`. See
+    `Virtualized Mode`_ for more information.
+
+    .. versionadded:: 1.8.0
+
+    :data:`virtualized` is a :class:`~kivy.properties.BooleanProperty`,
+    defaults to False.
+    '''
+
+    row_height = NumericProperty('24dp')
+    '''Height of every row when the TreeView is :data:`virtualized`.
+
+    .. versionadded:: 1.8.0
+
+    :data:`row_height` is a :class:`~kivy.properties.NumericProperty`,
+    defaults to 24dp.
+    '''
+
     def get_selected_node(self):
         return self._selected_node
 
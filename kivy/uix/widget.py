@@ -89,6 +89,23 @@ Usage:
     parent.remove_widgets([widget1,widget2,widget3])
                            or
     parent.remove_widgets(custom_widget_list_variable)
+
+Touch index
+-----------
+
+.. versionadded:: 1.8.0
+
+By default, a touch is dispatched to every child, each one doing its own
+collision check. For a widget with thousands of children, like a big
+:class:`~kivy.uix.floatlayout.FloatLayout`, you can set
+:data:`Widget.touch_index` to True: the children are stored in a uniform grid,
+kept up to date when their pos or size change, and the touches are dispatched
+only to the children whose bounding box contains the touch position::
+
+    root = FloatLayout(touch_index=True)
+
+The children outside of the touch are then not notified anymore: a widget that
+need the touch events outside of its bounding box must grab the touch.
 '''
 
 __all__ = ('Widget', 'WidgetException')
@@ -103,6 +120,7 @@ from kivy.base import EventLoop
 from kivy.lang import Builder
 from weakref import proxy
 from functools import partial
+from math import floor
 
 
 # references to all the destructors widgets (partial method with widget uid as
@@ -118,6 +136,121 @@ def _widget_destructor(uid, r):
     Builder.unbind_widget(uid)
 
 
+class _TouchIndex(object):
+    # uniform grid of the children of a widget. The children moved, resized,
+    # added or removed are updated lazily, on the next query.
+
+    # size of a cell of the grid, in pixels
+    cell_size = 128.
+
+    # children covering more cells are tested on every query
+    max_cells = 64
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.cells = {}
+        self.large = set()
+        # uid -> (child, cell keys or None if large)
+        self.entries = {}
+        self.order = {}
+        self.dirty = set()
+        self.children_changed = True
+        widget.bind(children=self.invalidate_children)
+
+    def invalidate(self, child, *largs):
+        self.dirty.add(child.uid)
+
+    def invalidate_children(self, *largs):
+        self.children_changed = True
+
+    def release(self):
+        self.widget.unbind(children=self.invalidate_children)
+        for uid in list(self.entries.keys()):
+            self.remove(uid)
+
+    def remove(self, uid):
+        child, keys = self.entries.pop(uid)
+        child.unbind(pos=self.invalidate, size=self.invalidate)
+        self.remove_cells(uid, keys)
+        self.dirty.discard(uid)
+
+    def remove_cells(self, uid, keys):
+        if keys is None:
+            self.large.discard(uid)
+            return
+        cells = self.cells
+        for key in keys:
+            cell = cells[key]
+            cell.discard(uid)
+            if not cell:
+                del cells[key]
+
+    def insert(self, uid, child):
+        size = self.cell_size
+        x0 = int(floor(child.x / size))
+        y0 = int(floor(child.y / size))
+        x1 = int(floor(child.right / size))
+        y1 = int(floor(child.top / size))
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > self.max_cells:
+            self.large.add(uid)
+            keys = None
+        else:
+            cells = self.cells
+            keys = [(x, y) for x in range(x0, x1 + 1)
+                    for y in range(y0, y1 + 1)]
+            for key in keys:
+                cell = cells.get(key)
+                if cell is None:
+                    cells[key] = cell = set()
+                cell.add(uid)
+        self.entries[uid] = (child, keys)
+
+    def sync(self):
+        entries = self.entries
+        dirty = self.dirty
+        if self.children_changed:
+            self.children_changed = False
+            children = self.widget.children
+            self.order = order = dict(
+                (child.uid, index) for index, child in enumerate(children))
+            for uid in list(entries.keys()):
+                if uid not in order:
+                    self.remove(uid)
+            for child in children:
+                uid = child.uid
+                if uid not in entries:
+                    child.bind(pos=self.invalidate, size=self.invalidate)
+                    entries[uid] = (child, ())
+                    dirty.add(uid)
+        for uid in dirty:
+            child, keys = entries[uid]
+            self.remove_cells(uid, keys)
+            self.insert(uid, child)
+        dirty.clear()
+
+    def query(self, x, y):
+        '''Return the children whose bounding box contains (x, y), in the
+        order of the children list.
+        '''
+        self.sync()
+        size = self.cell_size
+        uids = self.cells.get((int(floor(x / size)), int(floor(y / size))))
+        if uids:
+            uids = uids | self.large
+        else:
+            uids = self.large
+        entries = self.entries
+        result = []
+        for uid in uids:
+            child = entries[uid][0]
+            if child.x <= x <= child.right and child.y <= y <= child.top:
+                result.append(child)
+        if len(result) > 1:
+            order = self.order
+            result.sort(key=lambda child: order[child.uid])
+        return result
+
+
 class WidgetException(Exception):
     '''Fired when the widget gets an exception.
     '''
@@ -165,6 +298,7 @@ class Widget(WidgetBase):
 
     def __init__(self, **kwargs):
         self._proxy_ref = None
+        self._touch_index = None
 
         # Before doing anything, ensure the windows exist.
         EventLoop.ensure_window()
@@ -283,7 +417,11 @@ class Widget(WidgetBase):
         '''
         if self.disabled and self.collide_point(*touch.pos):
             return True
-        for child in self.children[:]:
+        if self.touch_index:
+            children = self._get_touch_children(touch)
+        else:
+            children = self.children[:]
+        for child in children:
             if child.dispatch('on_touch_down', touch):
                 return True
 
@@ -294,7 +432,11 @@ class Widget(WidgetBase):
         '''
         if self.disabled:
             return
-        for child in self.children[:]:
+        if self.touch_index:
+            children = self._get_touch_children(touch)
+        else:
+            children = self.children[:]
+        for child in children:
             if child.dispatch('on_touch_move', touch):
                 return True
 
@@ -305,10 +447,25 @@ class Widget(WidgetBase):
         '''
         if self.disabled:
             return
-        for child in self.children[:]:
+        if self.touch_index:
+            children = self._get_touch_children(touch)
+        else:
+            children = self.children[:]
+        for child in children:
             if child.dispatch('on_touch_up', touch):
                 return True
 
+    def _get_touch_children(self, touch):
+        index = self._touch_index
+        if index is None:
+            self._touch_index = index = _TouchIndex(self)
+        return index.query(*touch.pos)
+
+    def on_touch_index(self, instance, value):
+        if not value and self._touch_index is not None:
+            self._touch_index.release()
+            self._touch_index = None
+
     def on_disabled(self, instance, value):
         for child in self.children:
             child.disabled = value
@@ -704,6 +861,18 @@ class Widget(WidgetBase):
     See :class:`~kivy.graphics.Canvas` for more information about the usage.
     '''
 
+    touch_index = BooleanProperty(False)
+    '''If True, the touches are dispatched only to the children whose bounding
+    box contains the touch position, found with a spatial index instead of
+    iterating over all the children. See the `Touch index`_ section for more
+    information.
+
+    .. versionadded:: 1.8.0
+
+    :data:`touch_index` is a :class:`~kivy.properties.BooleanProperty`,
+    default to False.
+    '''
+
     disabled = BooleanProperty(False)
     '''Indicates whether this widget can interact with input or not.
 